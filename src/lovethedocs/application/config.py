@@ -2,7 +2,73 @@
 Central place for tweakable settings.
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BackendConfig:
+    """
+    One LLM backend in a load-balanced pool: an API key, deployment or endpoint.
+
+    Attributes
+    ----------
+    name : str
+        Label shown in the run report; must be unique within the pool.
+    model : str, optional
+        Model or deployment name. None uses `Settings.model`.
+    base_url : str, optional
+        API base URL. None uses `Settings.base_url`, then the SDK default.
+    api_key_env : str, optional
+        Environment variable holding this backend's key. None means
+        ``OPENAI_API_KEY``. Keys themselves never go in the config file.
+    rpm : int
+        Requests-per-minute limit for this backend; 0 means unlimited.
+    """
+
+    name: str
+    model: Optional[str] = None
+    base_url: Optional[str] = None
+    api_key_env: Optional[str] = None
+    rpm: int = 0
+
+
+def load_backends(path: str | Path) -> tuple[BackendConfig, ...]:
+    """
+    Read backend definitions from a JSON file holding a list of objects.
+
+    Parameters
+    ----------
+    path : str | Path
+        File such as ``[{"name": "east", "api_key_env": "KEY_EAST", "rpm": 500}]``.
+
+    Returns
+    -------
+    tuple[BackendConfig, ...]
+        The backends, in file order.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a non-empty list of valid, uniquely named backends.
+    """
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path}: expected a non-empty JSON list of backends.")
+    allowed = {f.name for f in fields(BackendConfig)}
+    backends = []
+    for entry in entries:
+        unknown = set(entry) - allowed if isinstance(entry, dict) else None
+        if unknown is None or unknown or "name" not in entry:
+            raise ValueError(f"{path}: invalid backend entry {entry!r}.")
+        backends.append(BackendConfig(**entry))
+    if len({b.name for b in backends}) != len(backends):
+        raise ValueError(f"{path}: backend names must be unique.")
+    return tuple(backends)
 
 
 @dataclass(frozen=True)
@@ -12,6 +78,101 @@ class Settings:
 
     Stores tweakable parameters such as the model name and documentation style.
     Instances are immutable due to `frozen=True`.
+
+    Attributes
+    ----------
+    model : str
+        The OpenAI model used for documentation requests.
+    base_url : str, optional
+        Override for the API base URL, e.g. a local stub server used for load tests.
+        None keeps the SDK default (or ``OPENAI_BASE_URL`` if set).
+    stream : bool
+        Stream responses and parse edits incrementally (async pipeline only).
+    low_memory : bool
+        Read modules lazily, build prompts on demand and release each module once
+        it is staged, so memory tracks concurrency rather than project size.
+    schedule : str
+        Order in which the async pipeline starts requests: ``"largest"`` (most
+        expensive modules first, so no big file is left running alone at the end),
+        ``"recent"`` (most recently modified files first) or ``"input"``.
+    template_dir : str, optional
+        Directory of ``<style>.txt`` prompt templates overriding the packaged ones.
+    backends : tuple[BackendConfig, ...]
+        Load-balance requests over these backends instead of a single client.
+    small_model : str, optional
+        Faster model for trivial modules; None sends every module to `model`.
+        Responses from it that fail validation are redone on `model`.
+    tier_max_objects : int
+        Most objects a module may define to count as trivial.
+    tier_max_lines : int
+        Most lines a module may have to count as trivial.
+    hedge_percentile : float
+        Duplicate async requests still running after this percentile of recent
+        latencies and keep whichever answers first; 0 disables hedging.
+    hedge_budget : float
+        Most duplicate requests as a fraction of all requests.
+    breaker_error_rate : float
+        Pause dispatch when this fraction of the last 20 requests failed, then
+        probe until the provider recovers; 0 disables the circuit breaker.
+    breaker_cooldown : float
+        Seconds between probes while the breaker is open.
+    max_outage : float
+        Seconds of outage after which the run stops and leaves the remaining
+        modules pending.
+    resume : bool
+        Only process the modules an earlier run left pending.
+    files : tuple[str, ...]
+        Only process these paths, relative to the project root, without
+        discovering modules. Empty processes the whole project.
+    fsync : str
+        When staged files are flushed to disk: ``"none"``, after each ``"file"``,
+        or once per run (``"batch"``). Staged writes are atomic regardless.
+    connect_timeout : float
+        Seconds allowed to open a connection to the API.
+    read_timeout : float
+        Seconds allowed between bytes of a response.
+    keepalive_expiry : float
+        Seconds an idle pooled connection is kept for reuse.
+    http2 : bool
+        Use HTTP/2 when the optional ``h2`` package is installed.
+
+    The connection pool itself is sized from the requested concurrency.
     """
 
     model: str = "gpt-4.1"
+    base_url: Optional[str] = None
+    stream: bool = False
+    low_memory: bool = False
+    schedule: str = "largest"
+    template_dir: Optional[str] = None
+    backends: tuple[BackendConfig, ...] = ()
+    small_model: Optional[str] = None
+    tier_max_objects: int = 5
+    tier_max_lines: int = 150
+    hedge_percentile: float = 0.0
+    hedge_budget: float = 0.05
+    breaker_error_rate: float = 0.5
+    breaker_cooldown: float = 30.0
+    max_outage: float = 300.0
+    resume: bool = False
+    files: tuple[str, ...] = ()
+    fsync: str = "batch"
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    def client_settings(self) -> "Settings":
+        """
+        Return a copy with the per-run fields reset to their defaults.
+
+        Which modules a run processes, in what order, and how it stages them do
+        not affect the clients `make_use_case` builds. Runs that differ only in
+        those fields can therefore share one use case, with its breaker and hedger
+        state.
+        """
+        return replace(self, **{name: getattr(Settings, name) for name in _PER_RUN})
+
+
+# Fields read by the runners, never by the use case or its clients.
+_PER_RUN = ("stream", "low_memory", "schedule", "resume", "files", "fsync")
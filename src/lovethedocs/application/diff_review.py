@@ -9,12 +9,16 @@ Relies on the new ProjectFileSystem gateway:
 
 from __future__ import annotations
 
+import fnmatch
 from pathlib import Path
+from typing import List, Optional, Sequence
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
 
+from lovethedocs.application import diff_stats
 from lovethedocs.gateways.project_file_system import ProjectFileSystem
 from lovethedocs.ports import DiffViewerPort
 
@@ -79,6 +83,7 @@ def batch_review(
     *,
     diff_viewer: DiffViewerPort,
     interactive: bool = True,
+    rel_paths: Optional[Sequence[Path]] = None,
 ) -> None:
     """
     Review all staged Python files and summarize the results.
@@ -96,19 +101,21 @@ def batch_review(
     interactive : bool, optional
         If True, prompt the user for acceptance; otherwise, do not apply changes
         (default is True).
+    rel_paths : Sequence[Path], optional
+        Staged files to review, in order, e.g. from `select`. Default is every
+        staged file by path.
 
     Returns
     -------
     None
     """
-    staged_files = list(fs.staged_root.glob("**/*.py"))
+    staged_files = diff_stats.staged_paths(fs) if rel_paths is None else rel_paths
     if not staged_files:
         print("No staged files to review.")
         return
 
     accepted = rejected = 0
-    for staged in staged_files:
-        rel_path = staged.relative_to(fs.staged_root)
+    for rel_path in staged_files:
         print(f"\nReviewing {rel_path}...")
         ok = _review_single(
             fs,
@@ -129,3 +136,180 @@ def batch_review(
         )
 
     console.print(Panel.fit(summary_text, title="Review complete"))
+
+
+def select(
+    fs: ProjectFileSystem,
+    *,
+    sort: str = "path",
+    where: Sequence[str] = (),
+    page: int = 1,
+    page_size: Optional[int] = None,
+) -> List[diff_stats.DiffStats]:
+    """
+    Pick which staged edits to review, and in what order, from the staged index.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project file system gateway for file operations.
+    sort : str, optional
+        One of `diff_stats.SORT_KEYS`: ``path``, or largest ``lines``,
+        ``docstrings`` or ``signature`` changes first. Default is ``path``.
+    where : Sequence[str], optional
+        Rules (see `diff_stats.parse_rule`) an edit must all match to be shown.
+    page : int, optional
+        1-based page to return when `page_size` is set. Default is 1.
+    page_size : int, optional
+        Edits per page. Default returns all of them.
+
+    Returns
+    -------
+    List[diff_stats.DiffStats]
+        The selected edits' statistics, in review order.
+
+    Raises
+    ------
+    ValueError
+        If `sort` or a rule in `where` is unknown, or `page` is not positive.
+    """
+    if sort not in diff_stats.SORT_KEYS:
+        raise ValueError(
+            f"Unknown sort key {sort!r}; expected one of "
+            f"{', '.join(diff_stats.SORT_KEYS)}."
+        )
+    if page < 1:
+        raise ValueError("page must be at least 1")
+    rules = [diff_stats.parse_rule(spec) for spec in where]
+    stats = [
+        s
+        for s in diff_stats.collect(fs, diff_stats.staged_paths(fs))
+        if all(rule(s) for rule in rules)
+    ]
+    stats.sort(key=diff_stats.SORT_KEYS[sort])
+    if page_size:
+        stats = stats[(page - 1) * page_size : page * page_size]
+    return stats
+
+
+def print_table(stats: Sequence[diff_stats.DiffStats]) -> None:
+    """
+    Print one row of statistics per staged edit.
+
+    Parameters
+    ----------
+    stats : Sequence[diff_stats.DiffStats]
+        Edits to list, e.g. from `select`.
+    """
+    table = Table(title="Staged edits")
+    table.add_column("file")
+    table.add_column("+", justify="right", style="green")
+    table.add_column("-", justify="right", style="red")
+    table.add_column("docstrings", justify="right")
+    table.add_column("signature")
+    for s in stats:
+        table.add_row(
+            s.path.as_posix(),
+            str(s.added),
+            str(s.removed),
+            str(s.docstrings_changed),
+            "changed" if s.signature_changed else "",
+        )
+    console.print(table)
+
+
+def bulk_review(
+    fs: ProjectFileSystem,
+    *,
+    accept_globs: Sequence[str] = ("*",),
+    reject_if: Sequence[str] = (),
+) -> tuple[int, int, int]:
+    """
+    Apply staged edits by rule instead of one prompt per file.
+
+    Every staged file is compared with its original in parallel. Files matching one
+    of `accept_globs` and none of the `reject_if` rules are applied in one batch;
+    all others stay staged for a later review.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project file system gateway for file operations.
+    accept_globs : Sequence[str], optional
+        Shell-style patterns matched against the project-relative path; ``*`` also
+        matches ``/``. Default accepts every file.
+    reject_if : Sequence[str], optional
+        Rule names understood by `diff_stats.parse_rule`, e.g.
+        ``signature-changed`` or ``lines>200``.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        Number of files applied, rejected by a rule, and not matched by any glob.
+
+    Raises
+    ------
+    ValueError
+        If a rule in `reject_if` is unknown.
+    """
+    rules = {spec: diff_stats.parse_rule(spec) for spec in reject_if}
+    staged_files = diff_stats.staged_paths(fs)
+    if not staged_files:
+        print("No staged files to review.")
+        return 0, 0, 0
+
+    matched = [
+        p
+        for p in staged_files
+        if any(fnmatch.fnmatch(p.as_posix(), pattern) for pattern in accept_globs)
+    ]
+    accepted = matched
+    rejected = {spec: 0 for spec in rules}
+    if rules:  # diffs are only needed to evaluate rules
+        accepted = []
+        for stats in diff_stats.collect(fs, matched):
+            broken = [spec for spec, rule in rules.items() if rule(stats)]
+            for spec in broken:
+                rejected[spec] += 1
+            if not broken:
+                accepted.append(stats.path)
+    fs.apply_all(accepted)
+
+    n_rejected = len(matched) - len(accepted)
+    n_unmatched = len(staged_files) - len(matched)
+    lines = [f"✓ {len(accepted)} applied"]
+    if n_rejected:
+        reasons = ", ".join(f"{n} {spec}" for spec, n in rejected.items() if n)
+        lines.append(f"✗ {n_rejected} rejected ({reasons})")
+    if n_unmatched:
+        lines.append(f"· {n_unmatched} not matched")
+    style = "bold green" if len(accepted) == len(staged_files) else "yellow"
+    console.print(Panel.fit(Text("   ".join(lines), style=style), title="Bulk review"))
+    return len(accepted), n_rejected, n_unmatched
+
+
+def export_patch(fs: ProjectFileSystem, dest: Path) -> int:
+    """
+    Write every staged edit into one patch file instead of opening a viewer per file.
+
+    The patch uses paths relative to the project root, so ``git apply`` run from the
+    root applies it. Nothing is applied or unstaged.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project file system gateway for file operations.
+    dest : Path
+        File to write the patch to; overwritten if it exists.
+
+    Returns
+    -------
+    int
+        Number of files in the patch.
+    """
+    count = 0
+    with open(dest, "w", encoding="utf-8", newline="") as fh:
+        for diff in diff_stats.patches(fs, diff_stats.staged_paths(fs)):
+            fh.write(diff)
+            count += 1
+    return count
@@ -0,0 +1,387 @@
+"""
+Per-file statistics and patches for staged edits.
+
+Each staged file is compared with its original: lines added and removed,
+docstrings changed and whether any function signature changed. The pipeline
+records these in the project's staged index as it stages, so review can sort and
+filter without reading files; anything missing from the index is computed on the
+same I/O threads as loading. The same comparison can render a git-style diff.
+"""
+
+from __future__ import annotations
+
+import ast
+import difflib
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from lovethedocs.gateways.project_file_system import IO_WORKERS, ProjectFileSystem
+
+
+@dataclass(frozen=True)
+class DiffStats:
+    """
+    How one staged file differs from its original.
+
+    Attributes
+    ----------
+    path : Path
+        Path relative to the project root.
+    added : int
+        Lines present only in the staged file.
+    removed : int
+        Lines present only in the original.
+    docstrings_changed : int
+        Module, class and function docstrings that were added, removed or edited.
+    signature_changed : bool
+        True if any function's parameters or return annotation differ, or if
+        either file could not be parsed.
+    source_hash : str
+        SHA-256 of the original the edit was made against.
+    """
+
+    path: Path
+    added: int
+    removed: int
+    docstrings_changed: int
+    signature_changed: bool
+    source_hash: str = ""
+
+    def to_entry(self) -> Dict[str, Any]:
+        """Return the fields stored in the staged index (all but `path`)."""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "docstrings": self.docstrings_changed,
+            "signature_changed": self.signature_changed,
+            "source_hash": self.source_hash,
+        }
+
+    @classmethod
+    def from_entry(cls, path: Path, entry: Dict[str, Any]) -> "DiffStats":
+        """Rebuild statistics from a staged index entry."""
+        return cls(
+            path,
+            entry["added"],
+            entry["removed"],
+            entry["docstrings"],
+            entry["signature_changed"],
+            entry["source_hash"],
+        )
+
+
+# --------------------------------------------------------------------------- #
+#  Comparing two versions of a module                                          #
+# --------------------------------------------------------------------------- #
+def content_hash(code: str) -> str:
+    """Return the SHA-256 hex digest recorded for a module's source."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def _line_counts(old: Sequence[str], new: Sequence[str]) -> tuple[int, int]:
+    """
+    Return the number of lines added and removed going from `old` to `new`.
+
+    Lines are compared as multisets, which takes linear time even for huge modules
+    (a sequence diff does not) and is exact for docstring edits. A moved line is
+    not counted.
+    """
+    before, after = Counter(old), Counter(new)
+    return sum((after - before).values()), sum((before - after).values())
+
+
+def _outline(code: str) -> tuple[Dict[str, Optional[str]], Dict[str, str]]:
+    """
+    Map each qualified name in `code` to its docstring, and each function to its
+    signature.
+
+    Raises
+    ------
+    SyntaxError
+        If `code` is not valid Python.
+    """
+    docstrings: Dict[str, Optional[str]] = {}
+    signatures: Dict[str, str] = {}
+
+    def _visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = prefix + child.name
+                signatures[name] = ast.dump(child.args) + ast.dump(
+                    child.returns or ast.Constant(None)
+                )
+            elif not isinstance(child, ast.ClassDef):
+                continue
+            name = prefix + child.name
+            docstrings[name] = ast.get_docstring(child, clean=False)
+            _visit(child, name + ".")
+
+    tree = ast.parse(code)
+    docstrings["<module>"] = ast.get_docstring(tree, clean=False)
+    _visit(tree, "")
+    return docstrings, signatures
+
+
+def compare(rel_path: Path, original: str, staged: str) -> DiffStats:
+    """
+    Compute the statistics for one file.
+
+    Parameters
+    ----------
+    rel_path : Path
+        Path relative to the project root, recorded in the result.
+    original : str
+        Source of the original file.
+    staged : str
+        Source of the staged file.
+
+    Returns
+    -------
+    DiffStats
+        The differences between the two versions.
+    """
+    added, removed = _line_counts(original.splitlines(), staged.splitlines())
+    digest = content_hash(original)
+    try:
+        old_docs, old_sigs = _outline(original)
+        new_docs, new_sigs = _outline(staged)
+    except SyntaxError:
+        return DiffStats(rel_path, added, removed, 0, True, digest)
+    changed_docs = sum(
+        old_docs.get(name) != new_docs.get(name) for name in old_docs.keys() | new_docs
+    )
+    return DiffStats(
+        rel_path, added, removed, changed_docs, old_sigs != new_sigs, digest
+    )
+
+
+def stage(fs: ProjectFileSystem, rel_path: Path, original: str, code: str) -> None:
+    """
+    Stage `code` for `rel_path` and record its statistics in the staged index.
+
+    The entry also holds the hash of `code`, so a later run can tell that a file
+    whose content is either side of this edit needs no new request.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project to stage into.
+    rel_path : Path
+        Path relative to the project root.
+    original : str
+        Source the edit was made against.
+    code : str
+        The edited source.
+    """
+    entry = compare(rel_path, original, code).to_entry()
+    entry["staged_hash"] = content_hash(code)
+    fs.stage_file(rel_path, code, stats=entry)
+
+
+def patch_text(rel_path: Path, original: str, staged: str) -> str:
+    """
+    Render one file's change as a diff that ``git apply`` accepts.
+
+    Parameters
+    ----------
+    rel_path : Path
+        Path relative to the project root, used in the ``a/`` and ``b/`` headers.
+    original : str
+        Source of the original file.
+    staged : str
+        Source of the staged file.
+
+    Returns
+    -------
+    str
+        The diff, or an empty string if the versions are identical.
+    """
+    name = rel_path.as_posix()
+    lines = difflib.unified_diff(
+        original.splitlines(keepends=True),
+        staged.splitlines(keepends=True),
+        fromfile=f"a/{name}",
+        tofile=f"b/{name}",
+    )
+    out = []
+    for line in lines:
+        out.append(line)
+        if not line.endswith("\n"):
+            out.append("\n\\ No newline at end of file\n")
+    if not out:
+        return ""
+    return f"diff --git a/{name} b/{name}\n" + "".join(out)
+
+
+def _read_pair(fs: ProjectFileSystem, rel_path: Path) -> tuple[str, str]:
+    """Return the original (empty if missing) and staged source of `rel_path`."""
+    original = fs.original_path(rel_path)
+    old = original.read_text(encoding="utf-8") if original.exists() else ""
+    return old, fs.staged_path(rel_path).read_text(encoding="utf-8")
+
+
+def staged_paths(fs: ProjectFileSystem) -> List[Path]:
+    """Return every staged Python file relative to the project root, sorted."""
+    return sorted(p.relative_to(fs.staged_root) for p in fs.staged_root.glob("**/*.py"))
+
+
+def changed_modules(fs: ProjectFileSystem, files: Iterable[Path]) -> List[Path]:
+    """
+    Pick the files that still need documenting, e.g. those passed by a git hook.
+
+    Files that are not modules `load_modules` would read, or no longer exist, are
+    dropped. So are files whose content is the source last sent for them or the
+    edit staged for it, according to the staged index; no request would change
+    them.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project the files belong to.
+    files : Iterable[Path]
+        Paths relative to the project root.
+
+    Returns
+    -------
+    List[Path]
+        The files to process, in the order given.
+    """
+    index = fs.read_index(current=False)
+    todo = []
+    for rel_path in files:
+        if not fs.is_module(rel_path) or not fs.original_path(rel_path).is_file():
+            continue
+        entry = index.get(rel_path)
+        if entry is not None:
+            digest = content_hash(fs.read_module(rel_path))
+            if digest in (entry.get("source_hash"), entry.get("staged_hash")):
+                continue
+        todo.append(rel_path)
+    return todo
+
+
+def collect(
+    fs: ProjectFileSystem,
+    rel_paths: Iterable[Path],
+    *,
+    workers: int = IO_WORKERS,
+) -> List[DiffStats]:
+    """
+    Return statistics for many staged files, computing only what is not indexed.
+
+    Entries the staged index still holds are used as they are. The rest are
+    compared concurrently and added to the index for next time.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project holding the originals and the staged edits.
+    rel_paths : Iterable[Path]
+        Staged files to compare.
+    workers : int, optional
+        Threads reading and comparing files. Default is `IO_WORKERS`.
+
+    Returns
+    -------
+    List[DiffStats]
+        One entry per path, in the order given.
+    """
+
+    rel_paths = list(rel_paths)
+    index = fs.read_index()
+    known = {p: DiffStats.from_entry(p, index[p]) for p in rel_paths if p in index}
+    missing = [p for p in rel_paths if p not in known]
+
+    def _one(rel_path: Path) -> DiffStats:
+        return compare(rel_path, *_read_pair(fs, rel_path))
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(_one, missing))
+        fs.update_index({s.path: s.to_entry() for s in computed})
+        known.update((s.path, s) for s in computed)
+    return [known[p] for p in rel_paths]
+
+
+def patches(
+    fs: ProjectFileSystem,
+    rel_paths: Iterable[Path],
+    *,
+    workers: int = IO_WORKERS,
+) -> Iterator[str]:
+    """
+    Render the diffs of many staged files concurrently.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project holding the originals and the staged edits.
+    rel_paths : Iterable[Path]
+        Staged files to render.
+    workers : int, optional
+        Threads reading and diffing files. Default is `IO_WORKERS`.
+
+    Yields
+    ------
+    str
+        One diff per changed file, in the order given; unchanged files are skipped.
+    """
+
+    def _one(rel_path: Path) -> str:
+        return patch_text(rel_path, *_read_pair(fs, rel_path))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from filter(None, pool.map(_one, rel_paths))
+
+
+# --------------------------------------------------------------------------- #
+#  Sorting                                                                     #
+# --------------------------------------------------------------------------- #
+SORT_KEYS: Dict[str, Callable[[DiffStats], Any]] = {
+    "path": lambda s: s.path,
+    "lines": lambda s: (-(s.added + s.removed), s.path),
+    "docstrings": lambda s: (-s.docstrings_changed, s.path),
+    "signature": lambda s: (not s.signature_changed, s.path),
+}
+
+
+# --------------------------------------------------------------------------- #
+#  Rules                                                                       #
+# --------------------------------------------------------------------------- #
+Rule = Callable[[DiffStats], bool]
+
+RULES: Dict[str, Rule] = {
+    "signature-changed": lambda s: s.signature_changed,
+    "no-docstring-change": lambda s: s.docstrings_changed == 0,
+}
+
+_LINES_RULE = re.compile(r"lines>(\d+)")
+
+
+def parse_rule(spec: str) -> Rule:
+    """
+    Turn a rule name into a predicate over `DiffStats`.
+
+    Rules select edits to reject in bulk review or to show in a filtered review.
+    Besides the names in `RULES`, ``lines>N`` matches edits touching more than N
+    lines (added plus removed).
+
+    Raises
+    ------
+    ValueError
+        If `spec` is not a known rule.
+    """
+    if spec in RULES:
+        return RULES[spec]
+    match = _LINES_RULE.fullmatch(spec)
+    if match:
+        limit = int(match.group(1))
+        return lambda s: s.added + s.removed > limit
+    raise ValueError(
+        f"Unknown rule {spec!r}; expected one of {', '.join(RULES)} or lines>N."
+    )
@@ -2,18 +2,57 @@
 Public entry-point for documentation update pipelines.
 """
 
+import asyncio
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Callable, Sequence, Union
+from typing import AsyncIterator, Callable, Iterable, Optional, Sequence, Union
 
+from lovethedocs.application import diff_stats
+from lovethedocs.application.config import Settings
 from lovethedocs.domain.docstyle.base import DocStyle
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.models.update_result import UpdateResult
 from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
 from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
+from . import watch
 from .async_runner import run_async
 from .factory import fs_factory, make_use_case
+from .projects import (
+    SCHEDULES,
+    PendingTracker,
+    load_project,
+    merge_projects,
+    merged_order,
+    normalize_paths,
+)
 from .sync_runner import run_sync
 
-__all__ = ["run_pipeline"]
+__all__ = ["run_pipeline", "run_pipeline_async", "run_watch"]
+
+
+def _prepare(
+    settings: Optional[Settings],
+    fs_factory: Callable[[Path], ProjectFileSystem],
+) -> tuple[Settings, Callable[[Path], ProjectFileSystem]]:
+    """
+    Default `settings`, validate them and bind the fsync policy to `fs_factory`.
+
+    Raises
+    ------
+    ValueError
+        If `settings.schedule` is not one of `SCHEDULES`.
+    """
+    settings = settings or Settings()
+    if settings.schedule not in SCHEDULES:
+        raise ValueError(
+            f"Unknown schedule {settings.schedule!r}; "
+            f"expected one of {', '.join(SCHEDULES)}."
+        )
+    if settings.fsync != "batch":
+        fs_factory = partial(fs_factory, fsync=settings.fsync)
+    return settings, fs_factory
 
 
 def run_pipeline(
@@ -21,6 +60,8 @@ def run_pipeline(
     *,
     style: str,
     concurrency: int = 0,
+    threads: int = 0,
+    settings: Optional[Settings] = None,
     fs_factory: Callable[[Path], ProjectFileSystem] = fs_factory,
     use_case_factory: Callable[[bool], DocumentationUpdateUseCase] = make_use_case,
 ) -> list[ProjectFileSystem]:
@@ -35,6 +76,11 @@ def run_pipeline(
         Docstring style to use (numpy or google).
     concurrency : int
         Number of concurrent requests to make. If 0, run synchronously.
+    threads : int
+        Worker threads for the synchronous runner; ignored when `concurrency` > 0.
+        0 keeps the strictly serial behavior.
+    settings : Settings, optional
+        Model and gateway configuration. None uses the defaults.
     fs_factory : Callable[[Path], ProjectFileSystem]
         Factory function to create a ProjectFileSystem instance.
     use_case_factory : Callable[[bool], DocumentationUpdateUseCase]
@@ -46,9 +92,18 @@ def run_pipeline(
         List of ProjectFileSystem instances with staged files.
     """
     style = DocStyle.from_string(style)
+    settings, fs_factory = _prepare(settings, fs_factory)
+
+    # Passed only when set, so custom runners need not know about it.
+    selection = {"files": [Path(f) for f in settings.files]} if settings.files else {}
 
     async_mode = concurrency > 0
-    use_case = use_case_factory(async_mode=async_mode, style=style)
+    use_case = use_case_factory(
+        async_mode=async_mode,
+        style=style,
+        settings=settings,
+        concurrency=concurrency if async_mode else threads,
+    )
 
     if async_mode:
         return run_async(
@@ -57,6 +112,11 @@ def run_pipeline(
             fs_factory=fs_factory,
             use_case=use_case,
             style=style,
+            stream=settings.stream,
+            low_memory=settings.low_memory,
+            schedule=settings.schedule,
+            resume=settings.resume,
+            **selection,
         )
 
     return run_sync(
@@ -64,4 +124,168 @@ def run_pipeline(
         fs_factory=fs_factory,
         use_case=use_case,
         style=style,
+        workers=threads,
+        low_memory=settings.low_memory,
+        resume=settings.resume,
+        **selection,
+    )
+
+
+async def run_pipeline_async(
+    paths: Union[str | Path, Sequence[str | Path]],
+    *,
+    style: str | DocStyle,
+    concurrency: int = 8,
+    settings: Optional[Settings] = None,
+    stage: bool = False,
+    fs_factory: Callable[[Path], ProjectFileSystem] = fs_factory,
+    use_case_factory: Callable[[bool], DocumentationUpdateUseCase] = make_use_case,
+) -> AsyncIterator[UpdateResult]:
+    """
+    Document `paths` on the caller's event loop, yielding results as they finish.
+
+    Unlike `run_pipeline` this never calls ``asyncio.run`` and draws no progress
+    bars or summaries, so it can be used from async services and notebooks.
+    Reading, parsing and ordering the modules happen on a worker thread, so the
+    caller's loop keeps serving other work meanwhile. Calls
+    with the same settings and concurrency share one cached use case and connection
+    pool; the pool binds to the loop that first uses it, so keep to a single loop.
+
+    Parameters
+    ----------
+    paths : str | Path | Sequence[str | Path]
+        Project roots or package paths to process.
+    style : str | DocStyle
+        Docstring style to use (numpy or google).
+    concurrency : int
+        Maximum number of concurrent requests. Must be positive.
+    settings : Settings, optional
+        Model and gateway configuration. None uses the defaults.
+    stage : bool
+        Also stage each successful result in its project's ``.lovethedocs``
+        directory and keep its pending list for ``settings.resume`` up to date,
+        as the CLI does.
+    fs_factory : Callable[[Path], ProjectFileSystem]
+        Factory function to create a ProjectFileSystem instance.
+    use_case_factory : Callable[[bool], DocumentationUpdateUseCase]
+        Factory function to create a DocumentationUpdateUseCase instance.
+
+    Yields
+    ------
+    UpdateResult
+        One result per module, in completion order across all projects. Failures
+        are yielded, not raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if isinstance(style, str):
+        style = DocStyle.from_string(style)
+    settings, fs_factory = _prepare(settings, fs_factory)
+    use_case = use_case_factory(
+        async_mode=True, style=style, settings=settings, concurrency=concurrency
+    )
+
+    def _load() -> tuple[list, Iterable[SourceModule], dict[int, ProjectFileSystem]]:
+        projects = [
+            loaded
+            for raw in normalize_paths(paths)
+            if (
+                loaded := load_project(
+                    raw,
+                    fs_factory,
+                    lazy=settings.low_memory,
+                    resume=settings.resume,
+                    files=[Path(f) for f in settings.files] or None,
+                )
+            )
+        ]
+        modules, owners = merge_projects(projects, lazy=settings.low_memory)
+        if settings.low_memory:  # read and parsed one by one as slots free up
+            return projects, modules, owners
+        modules = list(modules)
+        for mod in modules:
+            mod.objects  # parse now; the use case builds every prompt from it
+        order_key = merged_order(settings.schedule, owners)
+        if order_key is not None:
+            modules.sort(key=order_key)
+        return projects, modules, owners
+
+    # Reading and parsing a large tree takes a while; keep the caller's loop free.
+    projects, modules, owners = await asyncio.to_thread(_load)
+    extra = {"low_memory": True} if settings.low_memory else {}
+    tracker = PendingTracker()
+    async for result in use_case.run_async(
+        modules, style=style, concurrency=concurrency, **extra
+    ):
+        fs = owners.pop(id(result.module))
+        if stage:
+            tracker.record(fs, result)
+            if result.ok:
+                await asyncio.to_thread(
+                    diff_stats.stage,
+                    fs,
+                    Path(result.module.path),
+                    result.module.code,
+                    result.new_code,
+                )
+        yield result
+    if stage:
+        for fs, _ in projects:
+            await asyncio.to_thread(fs.sync)
+        tracker.save()
+
+
+def run_watch(
+    path: str | Path,
+    *,
+    style: str,
+    threads: int = 0,
+    settings: Optional[Settings] = None,
+    debounce: float = 0.3,
+    poll: bool = False,
+    stop: Optional[threading.Event] = None,
+    fs_factory: Callable[[Path], ProjectFileSystem] = fs_factory,
+    use_case_factory: Callable[[bool], DocumentationUpdateUseCase] = make_use_case,
+) -> None:
+    """
+    Stage fresh docstrings for every module saved under `path` until stopped.
+
+    Uses the synchronous use case: its clients are not bound to an event loop, so
+    one instance and its open connections serve the whole session.
+
+    Parameters
+    ----------
+    path : str | Path
+        Project root to watch.
+    style : str
+        Docstring style to use (numpy or google).
+    threads : int
+        Worker threads for batches of several saved modules. 0 documents them one
+        at a time.
+    settings : Settings, optional
+        Model and gateway configuration. None uses the defaults.
+    debounce : float
+        Quiet period in seconds that ends a batch of saves.
+    poll : bool
+        Poll for changes even when ``watchfiles`` is installed.
+    stop : threading.Event, optional
+        Set to stop watching. Default watches until interrupted.
+    fs_factory : Callable[[Path], ProjectFileSystem]
+        Factory function to create a ProjectFileSystem instance.
+    use_case_factory : Callable[[bool], DocumentationUpdateUseCase]
+        Factory function to create a DocumentationUpdateUseCase instance.
+    """
+    style = DocStyle.from_string(style)
+    settings, fs_factory = _prepare(settings, fs_factory)
+    use_case = use_case_factory(
+        async_mode=False, style=style, settings=settings, concurrency=threads
+    )
+    watch.watch(
+        fs_factory(Path(path)),
+        use_case,
+        style,
+        workers=threads,
+        debounce=debounce,
+        poll=poll,
+        stop=stop,
     )
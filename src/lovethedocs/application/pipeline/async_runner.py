@@ -3,16 +3,25 @@ Concrete asynchronous pipeline.
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, Sequence, Union
+from typing import Callable, List, Optional, Sequence, Union
 
+from lovethedocs.application import diff_stats
 from lovethedocs.domain import docstyle
-from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.models.update_result import UpdateResult
 from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
-from lovethedocs.gateways.project_file_system import ProjectFileSystem
+from lovethedocs.gateways.project_file_system import IO_WORKERS, ProjectFileSystem
 
 from .progress import make_progress
-from .summary import summarize
+from .projects import (
+    PendingTracker,
+    load_project,
+    merge_projects,
+    merged_order,
+    normalize_paths,
+)
+from .summary import report_pending, report_stats, summarize
 
 
 async def _inner(
@@ -22,49 +31,105 @@ async def _inner(
     fs_factory: Callable[[Path], ProjectFileSystem],
     use_case: DocumentationUpdateUseCase,
     style: docstyle.DocStyle,
+    stream: bool,
+    low_memory: bool,
+    schedule: str,
+    resume: bool,
+    files: Optional[Sequence[Path]],
 ) -> List[ProjectFileSystem]:
+    tracker = PendingTracker()
     failures: list[tuple[Path, Exception]] = []
     processed = 0
     file_systems: list[ProjectFileSystem] = []
+    projects = []
+    loop = asyncio.get_running_loop()
+    writes: set[asyncio.Future] = set()
 
-    with make_progress() as progress:
+    def _stage(io_pool, fs: ProjectFileSystem, result: UpdateResult) -> None:
+        # Diff and write off the event loop so a slow disk never delays dispatch.
+        rel_path = Path(result.module.path)
+        write = loop.run_in_executor(
+            io_pool, diff_stats.stage, fs, rel_path, result.module.code, result.new_code
+        )
+        writes.add(write)
+
+        def _done(fut: asyncio.Future) -> None:
+            writes.discard(fut)
+            if not fut.cancelled() and fut.exception() is not None:
+                failures.append((rel_path, fut.exception()))
+
+        write.add_done_callback(_done)
+
+    with (
+        make_progress() as progress,
+        ThreadPoolExecutor(IO_WORKERS, thread_name_prefix="lovethedocs-io") as io_pool,
+    ):
         proj_task = progress.add_task("Projects", total=len(paths))
+        # Per-project bar and number of modules still outstanding.
+        bars: dict[int, list] = {}
 
         for raw in paths:
-            root = Path(raw).resolve()
-
-            # project-scoped FS
-            # TODO: DRY this up with the sync version
-            if root.is_file() and root.suffix == ".py":
-                fs = fs_factory(root.parent)
-                module_map = {root.relative_to(root.parent): root.read_text("utf-8")}
-            elif root.is_dir():
-                fs = fs_factory(root)
-                module_map = fs.load_modules()
-            else:
+            loaded = load_project(
+                raw, fs_factory, lazy=low_memory, resume=resume, files=files
+            )
+            if loaded is None:
+                progress.advance(proj_task)
+                continue
+            fs, src_modules = loaded
+            file_systems.append(fs)
+            projects.append(loaded)
+            if not len(src_modules):
                 progress.advance(proj_task)
                 continue
+            mod_task = progress.add_task(
+                f"[cyan]{Path(raw).resolve().name}", total=len(src_modules)
+            )
+            bars[id(fs)] = [mod_task, len(src_modules)]
 
-            src_modules = [
-                SourceModule(path, code) for path, code in module_map.items()
-            ]
-            mod_task = progress.add_task(f"[cyan]{root.name}", total=len(src_modules))
-            async for result in use_case.run_async(
-                src_modules, style=style, concurrency=concurrency
-            ):
-                rel_path = Path(result.module.path)
+        # One queue across every project, so no project's tail leaves slots idle.
+        modules, owners = merge_projects(projects, lazy=low_memory)
+        extra = {"low_memory": True} if low_memory else {}
+        order_key = merged_order(schedule, owners)
+        if order_key is not None:
+            extra["order_key"] = order_key
+        if stream:
+            # Counting objects would parse every module up front.
+            total = None if low_memory else sum(len(m.objects) for m in modules)
+            obj_task = progress.add_task("[magenta]objects", total=total)
+            extra["on_item"] = lambda *_: progress.advance(obj_task)
 
+        async for result in use_case.run_async(
+            modules, style=style, concurrency=concurrency, **extra
+        ):
+            rel_path = Path(result.module.path)
+            fs = owners.pop(id(result.module))
+
+            # Modules abandoned to an outage stay pending; they did not fail.
+            if not tracker.record(fs, result):
+                processed += 1
                 if result.ok:
-                    fs.stage_file(rel_path, result.new_code)
+                    _stage(io_pool, fs, result)
                 else:
                     failures.append((rel_path, result.error))
-                processed += 1
-                progress.advance(mod_task)
+            bar = bars[id(fs)]
+            progress.advance(bar[0])
+            bar[1] -= 1
+            if not bar[1]:
+                progress.advance(proj_task)
 
-            file_systems.append(fs)
-            progress.advance(proj_task)
+        if writes:
+            await asyncio.wait(list(writes))
+        await asyncio.gather(
+            *(loop.run_in_executor(io_pool, fs.sync) for fs in file_systems)
+        )
 
+    pending = tracker.save()
     summarize(failures, processed)
+    if pending:
+        report_pending(pending)
+    stats = getattr(use_case, "stats", None)
+    if callable(stats):
+        report_stats(stats())
     return file_systems
 
 
@@ -75,16 +140,34 @@ def run_async(
     fs_factory: Callable[[Path], ProjectFileSystem],
     use_case: DocumentationUpdateUseCase,
     style: docstyle.DocStyle,
+    stream: bool = False,
+    low_memory: bool = False,
+    schedule: str = "input",
+    resume: bool = False,
+    files: Optional[Sequence[Path]] = None,
 ) -> List[ProjectFileSystem]:
-    """Entry-point called by pipeline.__init__."""
-    if isinstance(paths, (str, Path)):
-        paths = [paths]
+    """
+    Entry-point called by pipeline.__init__.
+
+    With `stream`, responses are parsed incrementally and an extra progress bar
+    advances per documented object rather than per module. With `low_memory`,
+    modules are read lazily and only the in-flight ones are kept in memory.
+    `schedule` picks the order requests start in; see `projects.module_order`.
+    Modules abandoned to a provider outage are saved for a later run with
+    `resume`, which processes only those. With `files`, only those paths
+    (relative to each project root) are processed, without discovering modules.
+    """
     return asyncio.run(
         _inner(
-            paths=list(paths),
+            paths=normalize_paths(paths),
             concurrency=concurrency,
             fs_factory=fs_factory,
             use_case=use_case,
             style=style,
+            stream=stream,
+            low_memory=low_memory,
+            schedule=schedule,
+            resume=resume,
+            files=files,
         )
     )
@@ -7,14 +7,23 @@ from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
 
-from lovethedocs.application import config, mappers
+from lovethedocs.application import config
 from lovethedocs.domain import docstyle
 from lovethedocs.domain.services import PromptBuilder
 from lovethedocs.domain.services.generator import ModuleEditGenerator
+from lovethedocs.domain.services.model_router import ComplexityPolicy, ModelRouter
 from lovethedocs.domain.services.patcher import ModulePatcher
 from lovethedocs.domain.templates import PromptTemplateRepository
 from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
-from lovethedocs.gateways import schema_loader
+from lovethedocs.gateways.backend_pool import AsyncPooledClient, Backend, PooledClient
+from lovethedocs.gateways.circuit_breaker import (
+    AsyncCircuitBreakerClient,
+    CircuitBreaker,
+    CircuitBreakerClient,
+)
+from lovethedocs.gateways.edit_validator import parse_module_edit
+from lovethedocs.gateways.hedging import HedgedClient
+from lovethedocs.gateways.http_pool import PoolConfig
 from lovethedocs.gateways.openai_client import (
     AsyncOpenAIClientAdapter,
     OpenAIClientAdapter,
@@ -22,34 +31,122 @@ from lovethedocs.gateways.openai_client import (
 from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
 
-@lru_cache
 def make_use_case(
-    *, async_mode: bool = False, style: docstyle.DocStyle
+    *,
+    async_mode: bool = False,
+    style: docstyle.DocStyle,
+    settings: config.Settings | None = None,
+    concurrency: int = 0,
 ) -> DocumentationUpdateUseCase:
     """
     Return a configured DocumentationUpdateUseCase.
 
-    Cached so repeated calls share the same heavy objects.
+    Cached so repeated calls share the same heavy objects. `settings` defaults to
+    `config.Settings()`. Each distinct client configuration gets its own cached use
+    case; per-run fields such as `files`, `resume` or `schedule` are not part of
+    the key (see `Settings.client_settings`). The HTTP pool is sized from `concurrency`: concurrent requests
+    in async mode, worker threads in sync mode (0 keeps the SDK default). With
+    `settings.backends`, requests are load-balanced over one adapter per backend.
+    With `settings.small_model`, trivial modules are routed to that model (on the
+    same backends) and escalated to `settings.model` if its output is invalid.
+    With `settings.hedge_percentile` in async mode, straggling requests are hedged.
+    Unless `settings.breaker_error_rate` is 0, one circuit breaker guards them all.
     """
-    cfg = config.Settings()
-    Client = AsyncOpenAIClientAdapter if async_mode else OpenAIClientAdapter
-
-    generator = ModuleEditGenerator(
-        client=Client(model=cfg.model, style=style),
-        validator=schema_loader.VALIDATOR,
-        mapper=mappers.map_json_to_module_edit,
+    cfg = (settings or config.Settings()).client_settings()
+    return _make_use_case(
+        async_mode=async_mode, style=style, settings=cfg, concurrency=concurrency
     )
 
-    builder = PromptBuilder(PromptTemplateRepository())
+
+@lru_cache
+def _make_use_case(
+    *,
+    async_mode: bool,
+    style: docstyle.DocStyle,
+    settings: config.Settings,
+    concurrency: int,
+) -> DocumentationUpdateUseCase:
+    cfg = settings
+    builder = PromptBuilder(PromptTemplateRepository(cfg.template_dir))
+    instructions = builder.instructions(style)
+    adapter_cls = AsyncOpenAIClientAdapter if async_mode else OpenAIClientAdapter
+    # The sync runner only benefits from a sized pool when it uses worker threads.
+    pool = _pool_config(cfg, concurrency) if async_mode or concurrency else None
+
+    def _adapter(
+        backend: config.BackendConfig = config.BackendConfig("default"),
+        model: str | None = None,
+    ):
+        return adapter_cls(
+            model=model or backend.model or cfg.model,
+            style=style,
+            base_url=backend.base_url or cfg.base_url,
+            pool=pool,
+            instructions=instructions,
+            api_key_env=backend.api_key_env,
+        )
+
+    breaker = None
+    if cfg.breaker_error_rate:
+        breaker = CircuitBreaker(
+            error_rate=cfg.breaker_error_rate,
+            cooldown=cfg.breaker_cooldown,
+            abort_after=cfg.max_outage,
+        )
+    breaker_cls = AsyncCircuitBreakerClient if async_mode else CircuitBreakerClient
+
+    def _generator(model: str | None = None) -> ModuleEditGenerator:
+        if cfg.backends:
+            pool_cls = AsyncPooledClient if async_mode else PooledClient
+            client = pool_cls(
+                [Backend(b.name, _adapter(b, model), rpm=b.rpm) for b in cfg.backends],
+                style=style,
+            )
+        else:
+            client = _adapter(model=model)
+        if async_mode and cfg.hedge_percentile:
+            client = HedgedClient(
+                client, percentile=cfg.hedge_percentile, budget=cfg.hedge_budget
+            )
+        if breaker is not None:
+            client = breaker_cls(client, breaker)
+        # The compiled schema validates while it builds the edits, so no separate
+        # jsonschema pass is needed.
+        return ModuleEditGenerator(client=client, mapper=parse_module_edit)
+
+    generator = _generator()
+    router = None
+    if cfg.small_model:
+        router = ModelRouter(
+            small=_generator(cfg.small_model),
+            large=generator,
+            policy=ComplexityPolicy(cfg.tier_max_objects, cfg.tier_max_lines),
+        )
 
     return DocumentationUpdateUseCase(
         builder=builder,
         generator=generator,
         patcher=ModulePatcher(),
+        router=router,
+    )
+
+
+def _pool_config(cfg: config.Settings, concurrency: int) -> PoolConfig:
+    """Derive HTTP pool limits and timeouts from settings and concurrency."""
+    if cfg.hedge_percentile:
+        # Every in-flight request may have one duplicate; without spare
+        # connections the duplicate would queue behind the requests it hedges.
+        concurrency *= 2
+    return PoolConfig.for_concurrency(
+        concurrency,
+        keepalive_expiry=cfg.keepalive_expiry,
+        connect_timeout=cfg.connect_timeout,
+        read_timeout=cfg.read_timeout,
+        http2=cfg.http2,
     )
 
 
-def fs_factory(root: Path) -> ProjectFileSystem:
+def fs_factory(root: Path, *, fsync: str = "batch") -> ProjectFileSystem:
     """
     Create a `ProjectFileSystem` instance for the specified root directory.
 
@@ -57,6 +154,8 @@ def fs_factory(root: Path) -> ProjectFileSystem:
     ----------
     root : Path
         The root directory for the project file system.
+    fsync : str, optional
+        Flush policy for written files; see `ProjectFileSystem`.
 
     Returns
     -------
@@ -64,4 +163,4 @@ def fs_factory(root: Path) -> ProjectFileSystem:
         An instance of `ProjectFileSystem` rooted at the given directory.
     """
 
-    return ProjectFileSystem(root)
+    return ProjectFileSystem(root, fsync=fsync)
@@ -0,0 +1,240 @@
+"""
+Project discovery shared by every pipeline runner.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.domain.services.scheduling import estimate_cost, largest_first
+from lovethedocs.gateways.circuit_breaker import CircuitOpenError
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+
+def normalize_paths(
+    paths: Union[str | Path, Sequence[str | Path]],
+) -> list[str | Path]:
+    """Return `paths` as a list, wrapping a single path."""
+    if isinstance(paths, (str, Path)):
+        return [paths]
+    return list(paths)
+
+
+class LazyModules:
+    """
+    Sized view of a project's modules that reads each file as it is iterated.
+
+    Only the relative paths are held, so the sources of modules already processed
+    can be freed while the rest of the project is still pending.
+    """
+
+    def __init__(self, fs: ProjectFileSystem, paths: list[Path]) -> None:
+        self._fs = fs
+        self._paths = paths
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __iter__(self) -> Iterator[SourceModule]:
+        for path in self._paths:
+            yield SourceModule(path, self._fs.read_module(path))
+
+
+def load_project(
+    raw: str | Path,
+    fs_factory: Callable[[Path], ProjectFileSystem],
+    *,
+    lazy: bool = False,
+    resume: bool = False,
+    files: Optional[Sequence[Path]] = None,
+) -> Optional[tuple[ProjectFileSystem, Sequence[SourceModule] | LazyModules]]:
+    """
+    Open a project-scoped file system for `raw` and read its modules.
+
+    Parameters
+    ----------
+    raw : str | Path
+        A single ``.py`` file or a directory to scan recursively.
+    fs_factory : Callable[[Path], ProjectFileSystem]
+        Factory creating the file system rooted at the project directory.
+    lazy : bool, optional
+        Return a `LazyModules` that reads files as it is iterated instead of
+        loading the whole project up front.
+    resume : bool, optional
+        Only load the modules an interrupted run left in the project's pending
+        list; see `PendingTracker`.
+    files : Sequence[Path], optional
+        Only load these paths, relative to the project root, instead of
+        discovering modules; see `diff_stats.changed_modules`. Takes precedence over `resume`.
+
+    Returns
+    -------
+    tuple[ProjectFileSystem, Sequence[SourceModule] | LazyModules] | None
+        The file system and its modules, or None if `raw` is neither a Python file
+        nor a directory.
+    """
+    root = Path(raw).resolve()
+    if root.is_file() and root.suffix == ".py":
+        fs = fs_factory(root.parent)
+        rel = root.relative_to(root.parent)
+        if resume and rel not in fs.read_pending():
+            return fs, []
+        if lazy:
+            return fs, LazyModules(fs, [rel])
+        return fs, [SourceModule(rel, root.read_text("utf-8"))]
+    if not root.is_dir():
+        return None
+    fs = fs_factory(root)
+    if files is not None:
+        modules = LazyModules(fs, list(files))
+        return fs, modules if lazy else list(modules)
+    if resume:
+        pending = [p for p in fs.read_pending() if fs.original_path(p).exists()]
+        modules = LazyModules(fs, pending)
+        return fs, modules if lazy else list(modules)
+    if lazy:
+        return fs, LazyModules(fs, fs.module_paths())
+    return fs, [SourceModule(path, code) for path, code in fs.load_modules().items()]
+
+
+SCHEDULES = ("largest", "recent", "input")
+
+
+def module_order(
+    schedule: str, fs: ProjectFileSystem
+) -> Optional[Callable[[SourceModule], Any]]:
+    """
+    Return the `order_key` for `DocumentationUpdateUseCase.run_async`.
+
+    Parameters
+    ----------
+    schedule : str
+        ``"largest"`` starts the most expensive modules first, ``"recent"`` the
+        most recently modified files (largest first among equals), and
+        ``"input"`` keeps discovery order.
+    fs : ProjectFileSystem
+        The project the modules were read from, used to look up mtimes.
+
+    Returns
+    -------
+    Callable[[SourceModule], Any] | None
+        A sort key, or None for ``"input"``.
+
+    Raises
+    ------
+    ValueError
+        If `schedule` is not one of `SCHEDULES`.
+    """
+    if schedule == "largest":
+        return largest_first
+    if schedule == "recent":
+
+        def _recent_first(module: SourceModule) -> tuple[int, int]:
+            mtime = fs.original_path(module.path).stat().st_mtime_ns
+            return -mtime, -estimate_cost(module)
+
+        return _recent_first
+    if schedule == "input":
+        return None
+    raise ValueError(
+        f"Unknown schedule {schedule!r}; expected one of {', '.join(SCHEDULES)}."
+    )
+
+
+Project = tuple[ProjectFileSystem, Sequence[SourceModule] | LazyModules]
+
+
+class _ChainedModules:
+    """Sized, lazy concatenation of several projects' modules."""
+
+    def __init__(
+        self, projects: Sequence[Project], owners: dict[int, ProjectFileSystem]
+    ) -> None:
+        self._projects = projects
+        self._owners = owners
+
+    def __len__(self) -> int:
+        return sum(len(modules) for _, modules in self._projects)
+
+    def __iter__(self) -> Iterator[SourceModule]:
+        for fs, modules in self._projects:
+            for module in modules:
+                self._owners[id(module)] = fs
+                yield module
+
+
+def merge_projects(
+    projects: Sequence[Project], *, lazy: bool = False
+) -> tuple[Sequence[SourceModule] | _ChainedModules, dict[int, ProjectFileSystem]]:
+    """
+    Feed several projects into one run, remembering where each module came from.
+
+    Parameters
+    ----------
+    projects : Sequence[tuple[ProjectFileSystem, Sequence[SourceModule]]]
+        Loaded projects, as returned by `load_project`.
+    lazy : bool, optional
+        Chain the projects' modules without materializing them; owners are
+        recorded as modules are iterated.
+
+    Returns
+    -------
+    tuple
+        The merged modules and a map from ``id(module)`` to its file system.
+        Callers should pop each entry once the module's result is handled, so the
+        map only holds in-flight modules.
+    """
+    owners: dict[int, ProjectFileSystem] = {}
+    if lazy:
+        return _ChainedModules(projects, owners), owners
+    merged: list[SourceModule] = []
+    for fs, modules in projects:
+        for module in modules:
+            owners[id(module)] = fs
+            merged.append(module)
+    return merged, owners
+
+
+def merged_order(
+    schedule: str, owners: dict[int, ProjectFileSystem]
+) -> Optional[Callable[[SourceModule], Any]]:
+    """Return a `module_order` key that works across the projects in `owners`."""
+    if schedule == "input":
+        return None
+    keys: dict[int, Callable[[SourceModule], Any]] = {}
+
+    def _key(module: SourceModule) -> Any:
+        fs = owners[id(module)]
+        if id(fs) not in keys:
+            keys[id(fs)] = module_order(schedule, fs)
+        return keys[id(fs)](module)
+
+    return _key
+
+
+class PendingTracker:
+    """
+    Record which modules a run finished and which it abandoned to an outage.
+
+    Results failing with `CircuitOpenError` were never really attempted; they go
+    to the project's pending list for ``update --resume`` instead of being
+    reported as failures.
+    """
+
+    def __init__(self) -> None:
+        self._runs: dict[int, tuple[ProjectFileSystem, list[Path], list[Path]]] = {}
+
+    def record(self, fs: ProjectFileSystem, result: UpdateResult) -> bool:
+        """Note `result` for `fs`; return True if its module was abandoned."""
+        _, finished, unfinished = self._runs.setdefault(id(fs), (fs, [], []))
+        abandoned = isinstance(result.error, CircuitOpenError)
+        (unfinished if abandoned else finished).append(Path(result.module.path))
+        return abandoned
+
+    def save(self) -> int:
+        """Update every project's pending list; return how many modules remain."""
+        return sum(
+            len(fs.update_pending(finished, unfinished))
+            for fs, finished, unfinished in self._runs.values()
+        )
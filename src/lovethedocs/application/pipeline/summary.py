@@ -1,10 +1,10 @@
 """
-Failure-report rendering.
+Failure-report and run-statistics rendering.
 """
 
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Mapping, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -41,3 +41,31 @@ def summarize(failures: List[Failure], processed: int) -> None:
             style="red",
         )
     )
+
+
+def report_pending(count: int) -> None:
+    """
+    Tell the user how many modules an outage left for ``update --resume``.
+    """
+    console.print(
+        Panel.fit(
+            f"⏸ Provider unavailable; {count} modules left pending.\n"
+            "Rerun with `lovethedocs update --resume` once it recovers.",
+            style="bold yellow",
+        )
+    )
+
+
+def report_stats(sections: Mapping[str, Mapping[str, Any]]) -> None:
+    """
+    Print one compact table per statistics section (e.g. the HTTP pool).
+    """
+    for title, values in sections.items():
+        if not values:
+            continue
+        table = Table(title=title, show_header=False, box=None)
+        table.add_column("Metric", style="dim")
+        table.add_column("Value", justify="right")
+        for name, value in values.items():
+            table.add_row(name, str(value))
+        console.print(table)
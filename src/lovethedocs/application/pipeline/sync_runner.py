@@ -3,15 +3,16 @@ Concrete synchronous pipeline.
 """
 
 from pathlib import Path
-from typing import Callable, List, Sequence, Union
+from typing import Callable, List, Optional, Sequence, Union
 
+from lovethedocs.application import diff_stats
 from lovethedocs.domain import docstyle
-from lovethedocs.domain.models import SourceModule
 from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
 from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
 from .progress import make_progress
-from .summary import summarize
+from .projects import PendingTracker, load_project, normalize_paths
+from .summary import report_pending, report_stats, summarize
 
 
 def run_sync(
@@ -20,11 +21,22 @@ def run_sync(
     fs_factory: Callable[[Path], ProjectFileSystem],
     use_case: DocumentationUpdateUseCase,
     style: docstyle.DocStyle,
+    workers: int = 0,
+    low_memory: bool = False,
+    resume: bool = False,
+    files: Optional[Sequence[Path]] = None,
 ) -> List[ProjectFileSystem]:
-    """Serial but failure-tolerant pipeline."""
-    # — normalise input
-    if isinstance(paths, (str, Path)):
-        paths = [paths]
+    """
+    Failure-tolerant pipeline without an event loop.
+
+    Serial by default; with `workers` > 0 modules are documented on a bounded thread
+    pool and staged as they finish. With `low_memory`, modules are read lazily and
+    each one is released once staged. With `resume`, only the modules a previous
+    run abandoned to a provider outage are processed; with `files`, only those
+    paths (relative to each project root), without discovering modules.
+    """
+    paths = normalize_paths(paths)
+    tracker = PendingTracker()
 
     failures: list[tuple[Path, Exception]] = []
     processed = 0
@@ -34,36 +46,48 @@ def run_sync(
         proj_task = progress.add_task("Projects", total=len(paths))
 
         for raw in paths:
-            root = Path(raw).resolve()
-
-            # project-scoped FS
-            # TODO: refactor for better readability
-            if root.is_file() and root.suffix == ".py":
-                fs = fs_factory(root.parent)
-                module_map = {root.relative_to(root.parent): root.read_text("utf-8")}
-            elif root.is_dir():
-                fs = fs_factory(root)
-                module_map = fs.load_modules()
-            else:
+            loaded = load_project(
+                raw, fs_factory, lazy=low_memory, resume=resume, files=files
+            )
+            if loaded is None:
                 progress.advance(proj_task)
                 continue
+            fs, src_modules = loaded
 
-            src_modules = [
-                SourceModule(path, code) for path, code in module_map.items()
-            ]
-            mod_task = progress.add_task(f"[cyan]{root.name}", total=len(src_modules))
+            mod_task = progress.add_task(
+                f"[cyan]{Path(raw).resolve().name}", total=len(src_modules)
+            )
 
-            for result in use_case.run(src_modules, style=style):
+            extra = {"workers": workers, "ordered": False} if workers else {}
+            if low_memory:
+                extra["low_memory"] = True
+            for result in use_case.run(src_modules, style=style, **extra):
                 rel_path = result.module.path
-                if result.ok:
-                    fs.stage_file(rel_path, result.new_code)
-                else:
-                    failures.append((rel_path, result.error))
-                processed += 1
+                # Modules abandoned to an outage stay pending; they did not fail.
+                if not tracker.record(fs, result):
+                    processed += 1
+                    if result.ok:
+                        # A failed write is this module's failure, not the run's.
+                        try:
+                            diff_stats.stage(
+                                fs, rel_path, result.module.code, result.new_code
+                            )
+                        except Exception as exc:
+                            failures.append((rel_path, exc))
+                    else:
+                        failures.append((rel_path, result.error))
                 progress.advance(mod_task)
 
             file_systems.append(fs)
             progress.advance(proj_task)
 
+    for fs in file_systems:
+        fs.sync()
+    pending = tracker.save()
     summarize(failures, processed)
+    if pending:
+        report_pending(pending)
+    stats = getattr(use_case, "stats", None)
+    if callable(stats):
+        report_stats(stats())
     return file_systems
@@ -0,0 +1,284 @@
+"""
+Watch mode: re-document modules as they are saved.
+
+File changes come from ``watchfiles`` (inotify, FSEvents, ...) when it is installed
+and from polling modification times otherwise. Bursts of events are debounced
+into one batch, which goes through a single warm synchronous use case, so its
+HTTP connections stay open between batches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from rich.console import Console
+
+from lovethedocs.application import diff_stats
+from lovethedocs.domain import docstyle
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+console = Console()
+
+
+def watchfiles_available() -> bool:
+    """Return True if the optional ``watchfiles`` package is installed."""
+    return importlib.util.find_spec("watchfiles") is not None
+
+
+def _digest(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+# --------------------------------------------------------------------------- #
+#  Change sources                                                             #
+# --------------------------------------------------------------------------- #
+def _snapshot(fs: ProjectFileSystem) -> Dict[Path, int]:
+    """Modification time of every module in the project."""
+    mtimes = {}
+    for rel_path in fs.module_paths():
+        try:
+            mtimes[rel_path] = fs.original_path(rel_path).stat().st_mtime_ns
+        except FileNotFoundError:  # deleted while scanning
+            continue
+    return mtimes
+
+
+def poll_changes(
+    fs: ProjectFileSystem,
+    *,
+    interval: float = 1.0,
+    debounce: float = 0.3,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[Set[Path]]:
+    """
+    Yield batches of created or modified modules by comparing mtimes.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project to watch.
+    interval : float, optional
+        Seconds between scans while nothing is changing.
+    debounce : float, optional
+        A batch is yielded once a scan this long after the last change finds
+        nothing new.
+    stop : threading.Event, optional
+        Set to end the iteration.
+
+    Yields
+    ------
+    Set[Path]
+        Relative paths of the modules that changed.
+    """
+    stop = stop or threading.Event()
+    before = _snapshot(fs)
+    while not stop.wait(interval):
+        changed: Set[Path] = set()
+        while True:
+            now = _snapshot(fs)
+            new = {p for p, mtime in now.items() if before.get(p) != mtime}
+            before = now
+            if not new:
+                break
+            changed |= new
+            if stop.wait(debounce):
+                return
+        if changed:
+            yield changed
+
+
+def _watchfiles_changes(
+    fs: ProjectFileSystem,
+    *,
+    debounce: float,
+    stop: Optional[threading.Event],
+) -> Iterator[Set[Path]]:
+    """`poll_changes` counterpart driven by OS file events via ``watchfiles``."""
+    import watchfiles
+
+    def _is_module(change: watchfiles.Change, path: str) -> bool:
+        if change == watchfiles.Change.deleted:
+            return False
+        try:
+            return fs.is_module(Path(path).relative_to(fs.root))
+        except ValueError:
+            return False
+
+    for batch in watchfiles.watch(
+        fs.root,
+        watch_filter=_is_module,
+        debounce=int(debounce * 1000),
+        stop_event=stop,
+    ):
+        yield {Path(path).relative_to(fs.root) for _, path in batch}
+
+
+def changes(
+    fs: ProjectFileSystem,
+    *,
+    debounce: float = 0.3,
+    poll: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[Set[Path]]:
+    """
+    Yield debounced batches of saved modules, using OS events when possible.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project to watch.
+    debounce : float, optional
+        Quiet period in seconds that ends a batch.
+    poll : bool, optional
+        If True, poll even when ``watchfiles`` is installed.
+    stop : threading.Event, optional
+        Set to end the iteration.
+
+    Yields
+    ------
+    Set[Path]
+        Relative paths of the modules that changed.
+    """
+    if not poll and watchfiles_available():
+        return _watchfiles_changes(fs, debounce=debounce, stop=stop)
+    return poll_changes(fs, debounce=debounce, stop=stop)
+
+
+# --------------------------------------------------------------------------- #
+#  Re-documenting                                                             #
+# --------------------------------------------------------------------------- #
+class Watcher:
+    """Document changed modules of one project, skipping content already seen."""
+
+    def __init__(
+        self,
+        fs: ProjectFileSystem,
+        use_case: DocumentationUpdateUseCase,
+        style: docstyle.DocStyle,
+        *,
+        workers: int = 0,
+    ) -> None:
+        """
+        Create a watcher for the project behind `fs`.
+
+        Parameters
+        ----------
+        fs : ProjectFileSystem
+            Project to read modules from and stage results into.
+        use_case : DocumentationUpdateUseCase
+            A synchronous use case, reused for every batch.
+        style : docstyle.DocStyle
+            Docstring style to request.
+        workers : int, optional
+            Worker threads for batches of several modules. 0 documents them one by
+            one.
+        """
+        self.fs = fs
+        self._use_case = use_case
+        self._style = style
+        self._workers = workers
+        # Content hashes per module that must not trigger a run: the source last
+        # sent and the edit staged for it, which appears when the user accepts it.
+        self._seen: Dict[Path, Set[str]] = {}
+
+    def handle(self, changed: Iterable[Path]) -> List[UpdateResult]:
+        """
+        Document and stage the modules in `changed` whose content is new.
+
+        Parameters
+        ----------
+        changed : Iterable[Path]
+            Relative paths reported by a change source.
+
+        Returns
+        -------
+        List[UpdateResult]
+            One result per module that was sent to the model. A module whose edit
+            could not be staged is reported as failed with the staging error.
+        """
+        modules = []
+        for rel_path in sorted(changed):
+            try:
+                code = self.fs.read_module(rel_path)
+            except (FileNotFoundError, UnicodeDecodeError):
+                continue
+            if _digest(code) not in self._seen.get(rel_path, ()):
+                modules.append(SourceModule(rel_path, code))
+        if not modules:
+            return []
+
+        extra = {}
+        if self._workers and len(modules) > 1:
+            extra = {"workers": min(self._workers, len(modules)), "ordered": False}
+        results = list(self._use_case.run(modules, style=self._style, **extra))
+        for result in results:
+            rel_path = Path(result.module.path)
+            seen = self._seen[rel_path] = {_digest(result.module.code)}
+            if not result.ok:
+                continue
+            try:
+                diff_stats.stage(self.fs, rel_path, result.module.code, result.new_code)
+            except Exception as exc:  # one unwritable file must not end the watch
+                result.error = exc
+                continue
+            seen.add(_digest(result.new_code))
+        self.fs.sync()
+        return results
+
+
+def _report(results: List[UpdateResult]) -> None:
+    for result in results:
+        if result.ok:
+            console.print(f"[green]✓[/] staged {result.module.path}")
+        else:
+            console.print(f"[red]✗[/] {result.module.path}: {result.error}")
+
+
+def watch(
+    fs: ProjectFileSystem,
+    use_case: DocumentationUpdateUseCase,
+    style: docstyle.DocStyle,
+    *,
+    workers: int = 0,
+    debounce: float = 0.3,
+    poll: bool = False,
+    stop: Optional[threading.Event] = None,
+    on_results: Callable[[List[UpdateResult]], None] = _report,
+) -> None:
+    """
+    Re-document modules under `fs` as they are saved, until `stop` is set.
+
+    Staged edits are written under ``.lovethedocs``, which is never watched, so
+    staging cannot trigger another run.
+
+    Parameters
+    ----------
+    fs : ProjectFileSystem
+        The project to watch.
+    use_case : DocumentationUpdateUseCase
+        A synchronous use case, reused for every batch.
+    style : docstyle.DocStyle
+        Docstring style to request.
+    workers : int, optional
+        Worker threads for batches of several modules.
+    debounce : float, optional
+        Quiet period in seconds that ends a batch of saves.
+    poll : bool, optional
+        If True, poll for changes even when ``watchfiles`` is installed.
+    stop : threading.Event, optional
+        Set to stop watching. Default watches until interrupted.
+    on_results : Callable[[List[UpdateResult]], None], optional
+        Called after each batch. Default prints one line per module.
+    """
+    watcher = Watcher(fs, use_case, style, workers=workers)
+    for changed in changes(fs, debounce=debounce, poll=poll, stop=stop):
+        results = watcher.handle(changed)
+        if results:
+            on_results(results)
@@ -0,0 +1,284 @@
+"""
+CPU and memory profiling of a pipeline run, behind ``update --profile``.
+
+``cpu`` runs the pipeline under cProfile, in every thread it starts, and saves a
+``.prof`` file readable by ``pstats``, snakeviz and similar tools. ``mem`` traces
+allocations with tracemalloc and saves the snapshot taken at peak usage. Both
+print the top hot spots plus the share of the pipeline's own stages: parsing
+modules, validating responses, patching code and staging files.
+
+Tracing allocations deep enough to see those stages slows a run down many times
+over, so ``mem`` is for small runs; ``cpu`` costs far less.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+PROFILE_MODES = ("cpu", "mem")
+
+# Entry point of each pipeline stage: (file name, function name). Time and memory
+# below these calls are attributed to the stage.
+STAGES: Dict[str, Tuple[str, str]] = {
+    "parse": ("source_module.py", "objects"),
+    "validate": ("edit_validator.py", "parse_module_edit"),
+    "patch": ("patcher.py", "apply"),
+    "stage": ("diff_stats.py", "stage"),
+}
+
+_SAMPLE_INTERVAL = 0.05  # seconds between memory peak checks
+_SNAPSHOT_GROWTH = 1.10  # a snapshot costs a pass over every trace; skip small gains
+_TRACE_FRAMES = 32  # deep enough to reach a stage entry point from libcst internals
+
+console = Console()
+
+
+def _stamp() -> str:
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+# --------------------------------------------------------------------------- #
+#  CPU                                                                        #
+# --------------------------------------------------------------------------- #
+# Before 3.12 each thread needs its own profiler, which can then time that thread's
+# CPU use, so threads idling on a queue or socket do not drown out the hot spots.
+# From 3.12 one profiler sees every thread and only wall-clock time is meaningful.
+_PER_THREAD = sys.version_info < (3, 12)
+
+
+def _new_profile() -> cProfile.Profile:
+    return cProfile.Profile(time.thread_time) if _PER_THREAD else cProfile.Profile()
+
+
+class _CpuProfiler:
+    """cProfile across the calling thread and every thread started meanwhile."""
+
+    def __init__(self) -> None:
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        main = _new_profile()
+        self._profiles.append(main)
+        if _PER_THREAD:
+            threading.setprofile(self._start_in_thread)
+        main.enable()
+
+    def _start_in_thread(self, *_: Any) -> None:
+        profile = _new_profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()  # replaces this hook for the thread
+
+    def stop(self) -> pstats.Stats:
+        self._profiles[0].disable()
+        threading.setprofile(None)
+        stats = pstats.Stats(self._profiles[0])
+        with self._lock:
+            for profile in self._profiles[1:]:
+                stats.add(profile)
+        return stats
+
+
+def stage_times(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Return cumulative seconds spent under each of `STAGES`.
+
+    Parameters
+    ----------
+    stats : pstats.Stats
+        A finished CPU profile.
+
+    Returns
+    -------
+    Dict[str, float]
+        Stage name to seconds; stages that never ran are 0.
+    """
+    times = dict.fromkeys(STAGES, 0.0)
+    # Stage entry points do not recurse, so cumulative times never double count.
+    for (filename, _, func), (_, _, _, cumulative, _) in stats.stats.items():
+        for stage, (file_name, func_name) in STAGES.items():
+            if func == func_name and Path(filename).name == file_name:
+                times[stage] += cumulative
+    return times
+
+
+def _report_cpu(stats: pstats.Stats, top: int) -> None:
+    total = stats.total_tt or 1.0
+    stages = Table(title="CPU time by stage")
+    stages.add_column("stage")
+    stages.add_column("seconds", justify="right")
+    stages.add_column("share", justify="right")
+    for stage, seconds in stage_times(stats).items():
+        stages.add_row(stage, f"{seconds:.3f}", f"{seconds / total:.0%}")
+    console.print(stages)
+
+    hot = Table(title=f"Top {top} functions by own time")
+    hot.add_column("function")
+    hot.add_column("calls", justify="right")
+    hot.add_column("own s", justify="right")
+    hot.add_column("cumulative s", justify="right")
+    rows = sorted(stats.stats.items(), key=lambda kv: kv[1][2], reverse=True)
+    for (filename, line, func), (_, calls, own, cumulative, _) in rows[:top]:
+        hot.add_row(
+            f"{Path(filename).name}:{line}({func})",
+            str(calls),
+            f"{own:.3f}",
+            f"{cumulative:.3f}",
+        )
+    console.print(hot)
+
+
+# --------------------------------------------------------------------------- #
+#  Memory                                                                     #
+# --------------------------------------------------------------------------- #
+class _PeakSampler:
+    """Keep the tracemalloc snapshot taken closest to peak usage."""
+
+    def __init__(self) -> None:
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._best = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="lovethedocs-memprof", daemon=True
+        )
+
+    def start(self) -> None:
+        tracemalloc.start(_TRACE_FRAMES)
+        self._thread.start()
+
+    def _sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._best * _SNAPSHOT_GROWTH:
+            self._best = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def _run(self) -> None:
+        while not self._stop.wait(_SAMPLE_INTERVAL):
+            self._sample()
+
+    def stop(self) -> Tuple[tracemalloc.Snapshot, int]:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return self.snapshot, peak
+
+
+def stage_memory(
+    snapshot: tracemalloc.Snapshot,
+    by_traceback: Optional[List[tracemalloc.Statistic]] = None,
+) -> Dict[str, int]:
+    """
+    Return the bytes held at snapshot time by allocations made under each stage.
+
+    Parameters
+    ----------
+    snapshot : tracemalloc.Snapshot
+        A snapshot with enough frames to reach the stage entry points.
+    by_traceback : List[tracemalloc.Statistic], optional
+        ``snapshot.statistics("traceback")`` if already computed; grouping the
+        traces is the expensive part.
+
+    Returns
+    -------
+    Dict[str, int]
+        Stage name to bytes.
+    """
+    if by_traceback is None:
+        by_traceback = snapshot.statistics("traceback")
+    stage_of_file = {file_name: stage for stage, (file_name, _) in STAGES.items()}
+    sizes = dict.fromkeys(STAGES, 0)
+    for stat in by_traceback:
+        files = {Path(frame.filename).name for frame in stat.traceback}
+        for file_name in files & stage_of_file.keys():
+            sizes[stage_of_file[file_name]] += stat.size
+    return sizes
+
+
+def _mib(size: int) -> str:
+    return f"{size / 2**20:.1f} MiB"
+
+
+def _report_mem(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> None:
+    by_traceback = snapshot.statistics("traceback")
+    held = sum(stat.size for stat in by_traceback)
+    stages = Table(title=f"Memory at peak ({_mib(peak)} traced) by stage")
+    stages.add_column("stage")
+    stages.add_column("held", justify="right")
+    stages.add_column("share", justify="right")
+    for stage, size in stage_memory(snapshot, by_traceback).items():
+        stages.add_row(stage, _mib(size), f"{size / (held or 1):.0%}")
+    console.print(stages)
+
+    hot = Table(title=f"Top {top} allocation sites at peak")
+    hot.add_column("line")
+    hot.add_column("blocks", justify="right")
+    hot.add_column("size", justify="right")
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        hot.add_row(
+            f"{Path(frame.filename).name}:{frame.lineno}",
+            str(stat.count),
+            _mib(stat.size),
+        )
+    console.print(hot)
+
+
+# --------------------------------------------------------------------------- #
+#  Public entry point                                                         #
+# --------------------------------------------------------------------------- #
+@contextmanager
+def profile(mode: str, out_dir: Path, *, top: int = 15) -> Iterator[None]:
+    """
+    Profile the enclosed block, save the raw data and print the hot spots.
+
+    Parameters
+    ----------
+    mode : str
+        ``"cpu"`` for cProfile or ``"mem"`` for tracemalloc.
+    out_dir : Path
+        Directory for the profile, e.g. ``<project>/.lovethedocs/profiles``;
+        created if missing.
+    top : int, optional
+        Number of functions or allocation sites to print. Default is 15.
+
+    Raises
+    ------
+    ValueError
+        If `mode` is not one of `PROFILE_MODES`.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(
+            f"Unknown profile mode {mode!r}; expected one of {', '.join(PROFILE_MODES)}."
+        )
+    profiler = _CpuProfiler() if mode == "cpu" else _PeakSampler()
+    profiler.start()
+    try:
+        yield
+    finally:
+        result = profiler.stop()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        if mode == "cpu":
+            dest = out_dir / f"{_stamp()}-cpu.prof"
+            result.dump_stats(dest)
+            _report_cpu(result, top)
+        else:
+            snapshot, peak = result
+            dest = out_dir / f"{_stamp()}-mem.snapshot"
+            snapshot.dump(str(dest))
+            _report_mem(snapshot, peak, top)
+        console.print(f"📈 Profile saved to {dest}")
@@ -14,6 +14,7 @@ Generate docs for two packages, then open diffs:
 from __future__ import annotations
 
 import shutil
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List
 
@@ -21,8 +22,10 @@ import typer
 from rich.console import Console
 
 from lovethedocs import __version__
-from lovethedocs.application import diff_review
-from lovethedocs.application.pipeline import run_pipeline
+from lovethedocs.application import diff_review, profiling
+from lovethedocs.application.config import Settings, load_backends
+from lovethedocs.application.diff_stats import changed_modules
+from lovethedocs.gateways import git_files
 from lovethedocs.gateways.diff_viewers import DiffViewerError, resolve_viewer
 from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
@@ -35,11 +38,29 @@ app = typer.Typer(
         "lovethedocs update -c 8 <path>            # fast with 8 workers\n\n"
         "lovethedocs review <path>                 # open diffs (Cursor default)\n\n"
         "lovethedocs clean <path>                  # remove path/.lovethedocs\n\n"
+        "lovethedocs restore <path> --run ID       # undo an applied review\n\n"
+        "lovethedocs watch <path>                  # re-document files as you save\n\n"
         "lovethedocs update -s google -r <path>    # generate & review, Google style\n\n"
     ),
 )
 
 
+# The pipeline pulls in the OpenAI SDK, which takes most of a second to import; a
+# pre-commit run with nothing to document should not pay for it.
+def run_pipeline(*args, **kwargs):
+    """Import and call `lovethedocs.application.pipeline.run_pipeline`."""
+    from lovethedocs.application import pipeline
+
+    return pipeline.run_pipeline(*args, **kwargs)
+
+
+def run_watch(*args, **kwargs):
+    """Import and call `lovethedocs.application.pipeline.run_watch`."""
+    from lovethedocs.application import pipeline
+
+    return pipeline.run_watch(*args, **kwargs)
+
+
 @app.command()
 def version() -> None:
     """Show the version and exit."""
@@ -57,7 +78,7 @@ example = (
 @app.command(help="Generate & stage docstrings (use -s STYLE and -c N).\n\n" + example)
 def update(
     paths: List[Path] = typer.Argument(
-        ...,
+        None,
         exists=True,
         resolve_path=True,
         metavar="PATHS",
@@ -93,6 +114,128 @@ def update(
             "Use 2+ for more speed."
         ),
     ),
+    threads: int = typer.Option(
+        0,
+        "-t",
+        "--threads",
+        metavar="N",
+        min=0,
+        help="Worker threads for the synchronous runner (ignored with -c).",
+    ),
+    base_url: str = typer.Option(
+        None,
+        "--base-url",
+        metavar="URL",
+        help="OpenAI-compatible API base URL (e.g. a local stub server).",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Stream responses and track progress per object (needs -c 1+).",
+    ),
+    low_memory: bool = typer.Option(
+        False,
+        "--low-memory",
+        help="Read modules lazily and free each one once staged (for huge repos).",
+    ),
+    schedule: str = typer.Option(
+        "largest",
+        "--schedule",
+        metavar="ORDER",
+        help="Request order with -c: largest, recent (mtime) or input.",
+    ),
+    hedge: float = typer.Option(
+        0.0,
+        "--hedge",
+        min=0,
+        max=99.9,
+        metavar="PCT",
+        help="Duplicate requests slower than this latency percentile (needs -c).",
+    ),
+    hedge_budget: float = typer.Option(
+        0.05,
+        "--hedge-budget",
+        min=0,
+        max=1,
+        metavar="FRACTION",
+        help="Most duplicate requests as a fraction of all requests.",
+    ),
+    breaker: float = typer.Option(
+        0.5,
+        "--breaker",
+        min=0,
+        max=1,
+        metavar="RATE",
+        help="Pause requests when this share of recent ones failed (0 disables).",
+    ),
+    max_outage: float = typer.Option(
+        300.0,
+        "--max-outage",
+        min=0,
+        metavar="SECONDS",
+        help="Stop and leave modules pending after an outage this long.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Only process modules an earlier run left pending after an outage.",
+    ),
+    fsync: str = typer.Option(
+        "batch",
+        "--fsync",
+        metavar="POLICY",
+        help="Flush staged files to disk: none, file (each) or batch (per run).",
+    ),
+    templates: Path = typer.Option(
+        None,
+        "--templates",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        metavar="DIR",
+        help="Directory of <style>.txt prompt templates overriding the built-ins.",
+    ),
+    backends: Path = typer.Option(
+        None,
+        "--backends",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+        metavar="FILE",
+        help="JSON list of API backends to load-balance over (keys via env vars).",
+    ),
+    small_model: str = typer.Option(
+        None,
+        "--small-model",
+        metavar="MODEL",
+        help="Faster model for small modules; invalid output escalates to gpt-4.1.",
+    ),
+    files: bool = typer.Option(
+        False,
+        "--files",
+        help=(
+            "PATHS are files of the project in the current directory: process "
+            "only those, skipping files already documented (for pre-commit)."
+        ),
+    ),
+    staged_in_git: bool = typer.Option(
+        False,
+        "--staged-in-git",
+        help="Like --files, for the .py files staged in the git index.",
+    ),
+    profile: str = typer.Option(
+        None,
+        "--profile",
+        metavar="MODE",
+        help="Profile the run (cpu or mem) into .lovethedocs/profiles/.",
+    ),
+    profile_top: int = typer.Option(
+        15,
+        "--profile-top",
+        min=1,
+        metavar="N",
+        help="Hot spots to print with --profile.",
+    ),
 ) -> None:
     """
     Generate new docstrings for the given paths and stage diffs.
@@ -113,10 +256,100 @@ def update(
         is 'auto'.
     concurrency : int, optional
         Number of concurrent requests to the LLM.
+    threads : int, optional
+        Worker threads for synchronous runs. Ignored when `concurrency` > 0.
+    base_url : str, optional
+        OpenAI-compatible API base URL. Default is the SDK default.
+    stream : bool, optional
+        If True, stream responses and report progress per object. Default is False.
+    low_memory : bool, optional
+        If True, keep only in-flight modules in memory. Default is False.
+    schedule : str, optional
+        Order in which requests start ('largest', 'recent' or 'input'). Default is
+        'largest'.
+    hedge : float, optional
+        Latency percentile after which a request is duplicated. Default is 0 (off).
+    hedge_budget : float, optional
+        Cap on duplicate requests as a fraction of all requests. Default is 0.05.
+    breaker : float, optional
+        Error rate over recent requests that pauses dispatch. Default is 0.5.
+    max_outage : float, optional
+        Seconds of outage before the run stops. Default is 300.
+    resume : bool, optional
+        If True, only process modules left pending by an interrupted run.
+    fsync : str, optional
+        When staged files are flushed to disk ('none', 'file' or 'batch'). Default
+        is 'batch'.
+    templates : Path, optional
+        Directory of custom prompt templates. Default is the packaged templates.
+    backends : Path, optional
+        JSON file describing backends to load-balance over. Default is one client.
+    small_model : str, optional
+        Model used for trivial modules. Default sends everything to the main model.
+    files : bool, optional
+        If True, `paths` are files of the project rooted at the current directory;
+        only those not already documented are processed. Default is False.
+    staged_in_git : bool, optional
+        If True, process the Python files staged in git, as with `files`.
+    profile : str, optional
+        Run under cProfile ('cpu') or tracemalloc ('mem'), save the data in the
+        first project's .lovethedocs/profiles and print the hot spots per stage.
+    profile_top : int, optional
+        Number of hot spots to print. Default is 15.
     """
     style = style.lower() or "numpy"
+    selected: tuple[str, ...] = ()
+    if files or staged_in_git:
+        try:
+            root, candidates = _selected_files(paths or [], staged_in_git)
+        except ValueError as e:
+            typer.echo(f"❌ {e}")
+            raise typer.Exit(code=1)
+        todo = changed_modules(ProjectFileSystem(root), candidates)
+        if not todo:
+            typer.echo("✓ Nothing to document.")
+            return
+        paths, selected = [root], tuple(p.as_posix() for p in todo)
+    elif not paths:
+        typer.echo("❌ Give at least one path, or use --files / --staged-in-git.")
+        raise typer.Exit(code=1)
     try:
-        file_systems = run_pipeline(paths, concurrency=concurrency, style=style)
+        settings = Settings(
+            base_url=base_url,
+            stream=stream,
+            low_memory=low_memory,
+            schedule=schedule.lower(),
+            template_dir=str(templates) if templates else None,
+            backends=load_backends(backends) if backends else (),
+            small_model=small_model,
+            hedge_percentile=hedge,
+            hedge_budget=hedge_budget,
+            breaker_error_rate=breaker,
+            max_outage=max_outage,
+            resume=resume,
+            fsync=fsync.lower(),
+            files=selected,
+        )
+        profiler = nullcontext()
+        if profile:
+            # Import the pipeline (OpenAI SDK, httpx, libcst, ...) first, so the
+            # profile shows the run itself rather than module loading.
+            from lovethedocs.application import pipeline  # noqa: F401
+
+            first = paths[0] if paths[0].is_dir() else paths[0].parent
+            profiler = profiling.profile(
+                profile.lower(),
+                first / ".lovethedocs" / "profiles",
+                top=profile_top,
+            )
+        with profiler:
+            file_systems = run_pipeline(
+                paths,
+                concurrency=concurrency,
+                threads=threads,
+                style=style,
+                settings=settings,
+            )
     except ValueError as e:
         typer.echo(f"❌ {e}")
         raise typer.Exit(code=1)
@@ -132,9 +365,136 @@ def update(
             )
 
 
-    review_example = (
-        "Examples\n\n"
-        "--------\n\n"
+@app.command(help="Re-document modules whenever they are saved (Ctrl-C stops).")
+def watch(
+    path: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        metavar="PATH",
+        help="Project root to watch.",
+    ),
+    style: str = typer.Option(
+        "numpy",
+        "-s",
+        "--style",
+        help="Docstring style to use (numpy or google).",
+    ),
+    threads: int = typer.Option(
+        4,
+        "-t",
+        "--threads",
+        metavar="N",
+        min=0,
+        help="Worker threads when several files are saved at once.",
+    ),
+    debounce: float = typer.Option(
+        0.3,
+        "--debounce",
+        min=0,
+        metavar="SECONDS",
+        help="Wait this long after the last save before sending a batch.",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll modification times even if watchfiles is installed.",
+    ),
+    base_url: str = typer.Option(
+        None,
+        "--base-url",
+        metavar="URL",
+        help="OpenAI-compatible API base URL (e.g. a local stub server).",
+    ),
+    templates: Path = typer.Option(
+        None,
+        "--templates",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        metavar="DIR",
+        help="Directory of <style>.txt prompt templates overriding the built-ins.",
+    ),
+    small_model: str = typer.Option(
+        None,
+        "--small-model",
+        metavar="MODEL",
+        help="Faster model for small modules; invalid output escalates to gpt-4.1.",
+    ),
+) -> None:
+    """
+    Stage fresh docstrings for every module saved under a project root.
+
+    Saved files are picked up with ``watchfiles`` when it is installed and by
+    polling otherwise. Edits are staged as usual; review them with
+    ``lovethedocs review``. Accepting a staged edit does not trigger another run.
+
+    Parameters
+    ----------
+    path : Path
+        Project root to watch.
+    style : str, optional
+        Docstring style to use ('numpy' or 'google'). Default is 'numpy'.
+    threads : int, optional
+        Worker threads for batches of several saved files. Default is 4.
+    debounce : float, optional
+        Seconds of quiet that end a batch of saves. Default is 0.3.
+    poll : bool, optional
+        If True, poll even when ``watchfiles`` is installed. Default is False.
+    base_url : str, optional
+        OpenAI-compatible API base URL. Default is the SDK default.
+    templates : Path, optional
+        Directory of custom prompt templates. Default is the packaged templates.
+    small_model : str, optional
+        Model used for trivial modules. Default sends everything to the main model.
+    """
+    settings = Settings(
+        base_url=base_url,
+        template_dir=str(templates) if templates else None,
+        small_model=small_model,
+    )
+    typer.echo(f"👀 Watching {path} (Ctrl-C to stop)")
+    try:
+        run_watch(
+            path,
+            style=style.lower(),
+            threads=threads,
+            settings=settings,
+            debounce=debounce,
+            poll=poll,
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+
+
+def _selected_files(paths: List[Path], staged_in_git: bool) -> tuple[Path, List[Path]]:
+    """
+    Return the project root and the files to consider for ``--files`` runs.
+
+    Raises
+    ------
+    ValueError
+        If git cannot list staged files, or a path lies outside the root.
+    """
+    if staged_in_git:
+        return git_files.staged_python_files(Path.cwd())
+    root = Path.cwd().resolve()
+    rel_paths = []
+    for path in paths:
+        try:
+            rel_paths.append(path.relative_to(root))
+        except ValueError:
+            raise ValueError(f"{path} is outside the current directory {root}.")
+    return root, rel_paths
+
+
+review_example = (
+    "Examples\n\n"
+    "--------\n\n"
     "lovethedocs review src/                      # open diffs for review (Cursor default)\n\n"
     "lovethedocs review -v git src/               # use git as a diff viewer\n\n"
 )
@@ -163,10 +523,69 @@ def review(
         "--viewer",
         help="Diff viewer to use (auto, cursor, vscode, git, terminal).",
     ),
+    accept_all: bool = typer.Option(
+        False,
+        "--accept-all",
+        help="Apply every staged edit without opening a viewer.",
+    ),
+    accept_glob: List[str] = typer.Option(
+        None,
+        "--accept-glob",
+        metavar="PATTERN",
+        help="Apply staged edits whose path matches PATTERN (repeatable).",
+    ),
+    export: Path = typer.Option(
+        None,
+        "--export",
+        metavar="FILE",
+        dir_okay=False,
+        resolve_path=True,
+        help="Write all staged edits to one patch file for 'git apply'.",
+    ),
+    open_patch: bool = typer.Option(
+        False,
+        "--open",
+        help="With --export, open the patch once in the diff viewer.",
+    ),
+    sort: str = typer.Option(
+        "path",
+        "--sort",
+        help="Review order: path, lines, docstrings or signature (largest first).",
+    ),
+    where: List[str] = typer.Option(
+        None,
+        "--where",
+        metavar="RULE",
+        help="Only review edits matching RULE, e.g. signature-changed (repeatable).",
+    ),
+    page: int = typer.Option(1, "--page", min=1, help="Page of edits to review."),
+    page_size: int = typer.Option(
+        0, "--page-size", min=0, help="Edits per page; 0 shows all."
+    ),
+    list_only: bool = typer.Option(
+        False,
+        "--list",
+        help="Print a table of the selected edits instead of opening diffs.",
+    ),
+    reject_if: List[str] = typer.Option(
+        None,
+        "--reject-if",
+        metavar="RULE",
+        help=(
+            "With --accept-all/--accept-glob, keep edits staged that match RULE: "
+            "signature-changed, no-docstring-change or lines>N (repeatable)."
+        ),
+    ),
 ) -> None:
     """
     Open staged documentation edits in the specified diff viewer.
 
+    With ``--accept-all`` or ``--accept-glob`` no viewer is opened: edits are
+    filtered by rule and applied in one batch, which suits CI and large projects.
+    ``--export`` writes one combined patch instead, leaving the edits staged.
+    ``--sort``, ``--where`` and ``--page`` choose which edits a review shows, using
+    the statistics recorded while staging.
+
     Parameters
     ----------
     paths : List[Path]
@@ -176,25 +595,166 @@ def review(
     viewer : str, optional
         Diff viewer to use ('auto', 'cursor', 'vscode', 'git', 'terminal'). Default
         is 'auto'.
+    accept_all : bool, optional
+        If True, apply every staged edit that no `reject_if` rule matches.
+    accept_glob : List[str], optional
+        Apply only staged edits whose relative path matches one of these patterns.
+    export : Path, optional
+        Write a combined patch of all staged edits here instead of viewing them.
+    open_patch : bool, optional
+        If True, open the exported patch in the diff viewer. Default is False.
+    sort : str, optional
+        Order to review edits in. Default is 'path'.
+    where : List[str], optional
+        Rules an edit must match to be reviewed.
+    page : int, optional
+        Page of edits to review when `page_size` is set. Default is 1.
+    page_size : int, optional
+        Edits per page; 0 reviews all of them. Default is 0.
+    list_only : bool, optional
+        If True, list the selected edits instead of reviewing them.
+    reject_if : List[str], optional
+        Rules that keep an otherwise accepted edit staged.
     """
-    try:
-        selected_viewer = resolve_viewer(viewer)
-    except DiffViewerError as e:
-        typer.echo(f"❌ {e}")
+    bulk = accept_all or bool(accept_glob)
+    if reject_if and not bulk:
+        typer.echo("❌ --reject-if needs --accept-all or --accept-glob.")
         raise typer.Exit(code=1)
+    if export is not None:
+        if bulk or len(paths) > 1:
+            typer.echo("❌ --export takes one project and no --accept options.")
+            raise typer.Exit(code=1)
+        _export(paths[0], export, viewer if open_patch else None)
+        return
+    if bulk:
+        globs = ["*"] if accept_all else accept_glob
+        for root in paths:
+            fs = ProjectFileSystem(root)
+            if not fs.staged_root.exists():
+                typer.echo(f"ℹ️  No staged edits found in {root}")
+                continue
+            try:
+                diff_review.bulk_review(
+                    fs, accept_globs=globs, reject_if=reject_if or ()
+                )
+            except ValueError as e:
+                typer.echo(f"❌ {e}")
+                raise typer.Exit(code=1)
+        return
+
+    selected_viewer = None
+    if not list_only:
+        try:
+            selected_viewer = resolve_viewer(viewer)
+        except DiffViewerError as e:
+            typer.echo(f"❌ {e}")
+            raise typer.Exit(code=1)
+    selecting = list_only or sort != "path" or where or page_size
     for root in paths:
         fs = ProjectFileSystem(root)
         if not fs.staged_root.exists():
             typer.echo(f"ℹ️  No staged edits found in {root}")
             continue
 
+        rel_paths = None
+        if selecting:
+            try:
+                stats = diff_review.select(
+                    fs, sort=sort, where=where or (), page=page, page_size=page_size
+                )
+            except ValueError as e:
+                typer.echo(f"❌ {e}")
+                raise typer.Exit(code=1)
+            if list_only:
+                diff_review.print_table(stats)
+                continue
+            rel_paths = [s.path for s in stats]
         diff_review.batch_review(
             fs,
             diff_viewer=selected_viewer,
             interactive=interactive,
+            rel_paths=rel_paths,
         )
 
 
+def _export(root: Path, dest: Path, viewer: str | None) -> None:
+    """Write `root`'s staged edits to `dest` and optionally open it in `viewer`."""
+    fs = ProjectFileSystem(root)
+    if not fs.staged_root.exists():
+        typer.echo(f"ℹ️  No staged edits found in {root}")
+        return
+    count = diff_review.export_patch(fs, dest)
+    typer.echo(f"📝 Wrote {count} files to {dest}; apply with: git apply {dest.name}")
+    if viewer is None or not count:
+        return
+    try:
+        resolve_viewer(viewer).view_patch(dest)
+    except DiffViewerError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+
+
+@app.command(help="List backup runs, or restore the originals saved by one.")
+def restore(
+    path: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        metavar="PATH",
+        help="Project root that contains a .lovethedocs folder.",
+    ),
+    run: str = typer.Option(
+        None,
+        "--run",
+        metavar="ID",
+        help="Backup run to restore; omit to list the runs.",
+    ),
+    yes: bool = typer.Option(
+        False,
+        "-y",
+        "--yes",
+        help="Skip confirmation prompt.",
+    ),
+) -> None:
+    """
+    List backup runs, or restore the files saved by one of them.
+
+    Every review session that applies edits records one run. Restoring backs up the
+    current files first, so it can itself be undone.
+
+    Parameters
+    ----------
+    path : Path
+        Project root that contains a .lovethedocs folder.
+    run : str, optional
+        Identifier of the run to restore. Default lists the available runs.
+    yes : bool, optional
+        If True, skip the confirmation prompt. Default is False.
+    """
+    fs = ProjectFileSystem(path)
+    if run is None:
+        runs = fs.backups.runs()
+        if not runs:
+            typer.echo(f"No backups in {path}.")
+            return
+        for entry in runs:
+            typer.echo(f"{entry.run_id}  {entry.created}  {len(entry.files)} files")
+        return
+
+    if not yes and not typer.confirm(
+        f"Overwrite files in {path} with the originals from run {run}?", abort=False
+    ):
+        typer.echo("❌ Restore skipped.")
+        return
+    try:
+        restored = fs.restore(run)
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+    typer.echo(f"♻️  Restored {len(restored)} files from run {run}.")
+
+
 @app.command(help="Remove lovethedocs artifacts from a project.")
 def clean(
     paths: List[Path] = typer.Argument(
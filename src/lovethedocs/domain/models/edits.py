@@ -1,11 +1,20 @@
 # src/domain/models.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+# Edits are created in bulk and kept around for reporting and batch apply, so they
+# are slotted and frozen, and their qualnames interned: the same names recur across
+# responses and as keys of `ModuleEdit.map_qnames_to_edits`.
 
-@dataclass
+
+def _intern_qualname(edit: FunctionEdit | ClassEdit) -> None:
+    object.__setattr__(edit, "qualname", sys.intern(edit.qualname))
+
+
+@dataclass(frozen=True, slots=True)
 class FunctionEdit:
     """
     Represents an edit to a function's docstring and/or signature.
@@ -24,8 +33,11 @@ class FunctionEdit:
     docstring: Optional[str] = None
     signature: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        _intern_qualname(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ClassEdit:
     """
     Represents an edit to a class's docstring and its methods' docstrings/signatures.
@@ -44,12 +56,24 @@ class ClassEdit:
     docstring: Optional[str] = None
     method_edits: List[FunctionEdit] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        _intern_qualname(self)
+
 
-@dataclass
-class ModuleEdit:
+class _QnameIndexCache:
+    """Slot for the lazily built qualname index, kept out of the dataclass fields."""
+
+    __slots__ = ("_qname_index",)
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleEdit(_QnameIndexCache):
     """
     Represents a collection of edits to functions and classes within a module.
 
+    The edit lists are treated as immutable once the edit is built; the qualname
+    index is computed on first use and cached.
+
     Attributes
     ----------
     function_edits : List[FunctionEdit]
@@ -75,13 +99,19 @@ class ModuleEdit:
         Returns
         -------
         dict[str, FunctionEdit | ClassEdit]
-            A mapping from qualified names to their corresponding edit objects.
+            A mapping from qualified names to their corresponding edit objects. It is
+            built once and cached, so treat it as read-only.
         """
-        edits = []
-        for f_edit in self.function_edits:
-            edits.append(f_edit)
+        try:
+            return self._qname_index
+        except AttributeError:
+            pass
+        index: dict[str, FunctionEdit | ClassEdit] = {
+            f_edit.qualname: f_edit for f_edit in self.function_edits
+        }
         for c_edit in self.class_edits:
-            edits.append(c_edit)
+            index[c_edit.qualname] = c_edit
             for mtd_edit in c_edit.method_edits:
-                edits.append(mtd_edit)
-        return {edit.qualname: edit for edit in edits}
+                index[mtd_edit.qualname] = mtd_edit
+        object.__setattr__(self, "_qname_index", index)
+        return index
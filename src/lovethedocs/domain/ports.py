@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Callable, Protocol
 
 if TYPE_CHECKING:
     # Only for type checking, not runtime
@@ -17,6 +17,18 @@ class LLMClientPort(Protocol):
         """Convert a prompt to a JSON response using the client's style."""
         ...
 
+    # Optional: `def stats(self) -> dict[str, dict]` adds sections to the run report.
+
+
+class StreamingLLMClientPort(LLMClientPort, Protocol):
+    """An async client that can report edit objects while the response streams."""
+
+    async def request_stream(
+        self, prompt: str, on_item: Callable[[str, dict], None]
+    ) -> dict:
+        """Like `request`, calling `on_item(array_key, edit)` per completed edit."""
+        ...
+
 
 class JSONSchemaValidator(Protocol):
     """Implements a .validate(raw_json) that raises on failure."""
@@ -8,7 +8,7 @@ This service is pure domain logic:
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
 from lovethedocs.domain.models import ModuleEdit
 from lovethedocs.domain.ports import JSONSchemaValidator, LLMClientPort
@@ -17,6 +17,11 @@ from lovethedocs.domain.ports import JSONSchemaValidator, LLMClientPort
 #  Type aliases                                                               #
 # --------------------------------------------------------------------------- #
 JSONToEditMapper = Callable[[dict], ModuleEdit]
+EditItemCallback = Callable[[str, dict], None]
+
+
+class EditValidationError(ValueError):
+    """The model's response did not validate or could not be mapped to edits."""
 
 
 # --------------------------------------------------------------------------- #
@@ -32,7 +37,7 @@ class ModuleEditGenerator:
         self,
         *,
         client: LLMClientPort,
-        validator: JSONSchemaValidator,
+        validator: Optional[JSONSchemaValidator] = None,
         mapper: JSONToEditMapper,
     ) -> None:
         """
@@ -42,8 +47,9 @@ class ModuleEditGenerator:
         ----------
         client : LLMClientPort
             The LLM client used to generate raw JSON from prompts.
-        validator : JSONSchemaValidator
-            The validator used to check the raw JSON against a schema.
+        validator : JSONSchemaValidator, optional
+            The validator used to check the raw JSON against a schema. Omit it when
+            `mapper` validates as it builds the edit.
         mapper : JSONToEditMapper
             Function to map validated JSON to a ModuleEdit object.
         """
@@ -67,16 +73,43 @@ class ModuleEditGenerator:
         -------
         ModuleEdit
             Parsed and validated edit instructions.
+
+        Raises
+        ------
+        EditValidationError
+            If the response fails validation or mapping.
         """
         raw = self._client.request(prompt)
-        self._validator.validate(raw)
-        return self._mapper(raw)
+        return self._validate_and_map(raw)
+
+    def _validate_and_map(self, raw: dict) -> ModuleEdit:
+        """Check `raw` with the validator, if any, and map it to a ModuleEdit."""
+        try:
+            if self._validator is not None:
+                self._validator.validate(raw)
+            return self._mapper(raw)
+        except Exception as exc:
+            raise EditValidationError(str(exc)) from exc
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Return the client's run statistics, if it reports any.
+
+        Returns
+        -------
+        dict[str, dict]
+            Report sections keyed by title; empty if the client keeps no stats.
+        """
+        report = getattr(self._client, "stats", None)
+        return report() if callable(report) else {}
 
         # ------------------------------------------------------------------ #
 
     #  Async companion                                                   #
     # ------------------------------------------------------------------ #
-    async def generate_async(self, prompt: str) -> ModuleEdit:
+    async def generate_async(
+        self, prompt: str, *, on_item: Optional[EditItemCallback] = None
+    ) -> ModuleEdit:
         """
         Asynchronously generate a validated ModuleEdit from a prompt.
 
@@ -87,12 +120,19 @@ class ModuleEditGenerator:
         ----------
         prompt : str
             Fully-formed user prompt.
+        on_item : EditItemCallback, optional
+            If given, the response is streamed via the client's `request_stream` and
+            `on_item(array_key, edit)` is called for each edit as it arrives.
+            Validation still runs once on the complete response.
 
         Returns
         -------
         ModuleEdit
             Parsed and validated edit instructions.
         """
-        raw = await self._client.request(prompt)  # type: ignore[attr-defined]
-        self._validator.validate(raw)
-        return self._mapper(raw)
+        if on_item is not None:
+            stream = self._client.request_stream  # type: ignore[attr-defined]
+            raw = await stream(prompt, on_item)
+        else:
+            raw = await self._client.request(prompt)  # type: ignore[attr-defined]
+        return self._validate_and_map(raw)
@@ -0,0 +1,105 @@
+"""
+Route modules to a small or large model by how much there is to document.
+
+Pure domain logic: the policy looks only at `SourceModule.objects` and the line
+count, and the router hands back one of two ready-made generators.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.services.generator import ModuleEditGenerator
+
+
+@dataclass(frozen=True)
+class ComplexityPolicy:
+    """
+    Decide which modules are simple enough for the small model.
+
+    Attributes
+    ----------
+    max_objects : int
+        Most functions, classes and methods a trivial module may define.
+    max_lines : int
+        Most source lines a trivial module may have.
+    """
+
+    max_objects: int = 5
+    max_lines: int = 150
+
+    def is_trivial(self, module: SourceModule) -> bool:
+        """Return True if `module` is within both limits."""
+        return (
+            len(module.objects) <= self.max_objects
+            and module.code.count("\n") + 1 <= self.max_lines
+        )
+
+
+class ModelRouter:
+    """
+    Pick the generator for each module and count how the work was split.
+
+    Trivial modules go to `small`; everything else, and any small-model response
+    that fails validation, goes to `large`.
+    """
+
+    def __init__(
+        self,
+        *,
+        small: ModuleEditGenerator,
+        large: ModuleEditGenerator,
+        policy: ComplexityPolicy = ComplexityPolicy(),
+    ) -> None:
+        """
+        Create a router over two generators.
+
+        Parameters
+        ----------
+        small : ModuleEditGenerator
+            Generator backed by the small, fast model.
+        large : ModuleEditGenerator
+            Generator backed by the large model; also the escalation target.
+        policy : ComplexityPolicy, optional
+            Thresholds for treating a module as trivial.
+        """
+        self.small = small
+        self.large = large
+        self._policy = policy
+        self._counts = {"small": 0, "large": 0, "escalated": 0}
+        self._lock = threading.Lock()
+
+    def route(self, module: SourceModule) -> ModuleEditGenerator:
+        """Return the generator that should document `module` first."""
+        tier = "small" if self._policy.is_trivial(module) else "large"
+        with self._lock:
+            self._counts[tier] += 1
+        return self.small if tier == "small" else self.large
+
+    def escalated(self) -> None:
+        """Record that a small-model response was redone on the large model."""
+        with self._lock:
+            self._counts["escalated"] += 1
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the tier split plus the small generator's own report sections.
+
+        Sections identical to the large generator's (a shared HTTP pool, say) are
+        left to the caller, which reports the large generator already.
+        """
+        with self._lock:
+            sections: dict[str, dict[str, Any]] = {"Model tiers": dict(self._counts)}
+        large = _stats(self.large)
+        for title, values in _stats(self.small).items():
+            if large.get(title) != values:
+                sections[f"{title} (small model)"] = values
+        return sections
+
+
+def _stats(generator: Any) -> dict[str, dict[str, Any]]:
+    report = getattr(generator, "stats", None)
+    return report() if callable(report) else {}
@@ -2,8 +2,9 @@
 Build *user* prompts for every SourceModule.
 
 Pure domain logic—no I/O, no network, no OpenAI SDK calls.
-The gateway will prepend the system prompt; here we only construct
-the per-file user prompt that lists objects and embeds the source code.
+The gateway sends the static prefix from `PromptBuilder.instructions` first and the
+per-file user prompt (object list + source) last, so every request shares one
+byte-identical prefix that the provider can serve from its prompt cache.
 """
 
 from __future__ import annotations
@@ -15,25 +16,53 @@ from lovethedocs.domain.docstyle.base import DocStyle  # type: ignore
 from lovethedocs.domain.models import SourceModule
 from lovethedocs.domain.templates import PromptTemplateRepository
 
+# Static notes on the user-prompt layout, appended to every style's instructions.
+# Keep this text stable: any change invalidates the provider-side prompt cache.
+INPUT_FORMAT_NOTES = """
+
+### Input format
+Each request covers exactly one Python module and contains, in order:
+- a line `### Objects in <path>:` followed by one indented qualname per line;
+  document exactly these objects, using the qualnames verbatim;
+- the module source between the lines `BEGIN <path>` and `END <path>`.
+"""
+
 
 class PromptBuilder:
     """
-    Compose user-prompts for a collection of modules.
+    Compose the static instructions and the per-module user prompts.
+
+    `instructions` holds everything shared across a style's requests: the style
+    template followed by the input-format notes. `build` and `build_one` produce
+    only the per-module input (object list + source) that follows it.
 
     Parameters
     ----------
     templates : PromptTemplateRepository
-        Used mainly for `templates.get(style.name)` so we could (later)
-        embed few-shot examples or hints inside the user prompt. We don’t
-        use that text yet, but the dependency keeps wiring simple.
+        Source of the style template, fetched with `templates.get(style.name)`
+        and embedded in `instructions`.
     """
 
     def __init__(self, templates: PromptTemplateRepository) -> None:
         self._templates = templates
+        self._instructions: Dict[str, str] = {}
 
     # ------------------------------------------------------------------ #
     #  Public API                                                         #
     # ------------------------------------------------------------------ #
+    def instructions(self, style: DocStyle) -> str:
+        """
+        Return the static prompt prefix shared by every request in `style`.
+
+        Style guide, few-shot examples and input-format notes, composed once per
+        style so the exact same string is sent each time.
+        """
+        if style.name not in self._instructions:
+            self._instructions[style.name] = (
+                self._templates.get(style.name).rstrip() + INPUT_FORMAT_NOTES
+            )
+        return self._instructions[style.name]
+
     def build(
         self,
         modules: Sequence[SourceModule],
@@ -53,12 +82,21 @@ class PromptBuilder:
         _ = self._templates.get(style.name)
 
         for mod in modules:
-            header = (
-                f"### Objects in {mod.path}:\n"
-                + "\n".join(f"  {qn}" for qn in mod.objects)
-                + "\n\n"
-            )
-            body = f"BEGIN {mod.path}\n{mod.code.strip()}\nEND {mod.path}"
-            prompts[mod.path] = header + body
+            prompts[mod.path] = self.build_one(mod)
 
         return prompts
+
+    def build_one(self, module: SourceModule) -> str:
+        """
+        Return the user prompt for a single module.
+
+        Lets callers build prompts on demand instead of holding one per module in
+        memory for the whole run.
+        """
+        header = (
+            f"### Objects in {module.path}:\n"
+            + "\n".join(f"  {qn}" for qn in module.objects)
+            + "\n\n"
+        )
+        body = f"BEGIN {module.path}\n{module.code.strip()}\nEND {module.path}"
+        return header + body
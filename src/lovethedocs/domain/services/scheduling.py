@@ -0,0 +1,37 @@
+"""
+Cost estimates and orderings for scheduling modules onto a fixed number of slots.
+
+Pure domain logic. Starting the most expensive modules first (longest processing
+time first) keeps one large file from running alone at the end of a batch, which
+bounds the makespan at a fixed concurrency.
+"""
+
+from __future__ import annotations
+
+from lovethedocs.domain.models import SourceModule
+
+# Rough output tokens the model writes per documented object; response length,
+# not prompt length, dominates request latency.
+_TOKENS_PER_OBJECT = 120
+
+
+def estimate_cost(module: SourceModule) -> int:
+    """
+    Estimate the tokens a module costs to document: source in, docstrings out.
+
+    Parameters
+    ----------
+    module : SourceModule
+        The module to estimate.
+
+    Returns
+    -------
+    int
+        Approximate token count; only meaningful relative to other modules.
+    """
+    return len(module.code) // 4 + _TOKENS_PER_OBJECT * len(module.objects)
+
+
+def largest_first(module: SourceModule) -> int:
+    """Sort key placing the most expensive modules first."""
+    return -estimate_cost(module)
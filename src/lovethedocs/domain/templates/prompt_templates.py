@@ -1,3 +1,4 @@
+import threading
 from importlib import resources
 from pathlib import Path
 
@@ -11,13 +12,60 @@ class UnknownStyleError(KeyError):
 
 
 class PromptTemplateRepository:
-    """Return the long-lived system prompt for a given doc-style key."""
+    """
+    Return the long-lived system prompt for a given doc-style key.
+
+    Templates are read once per repository and memoized; the pipeline builds the
+    prompt prefix from them when it creates its clients, so edits to a custom
+    `template_dir` apply from the next process (or the next repository) on.
+    Styles missing from a custom directory fall back to the packaged templates.
+    """
 
     _template_dir = Path(resources.files(__package__))  # pkg-data directory
+    _builtin_dir = _template_dir
+
+    def __init__(self, template_dir: str | Path | None = None) -> None:
+        """
+        Create a repository, optionally layered over a custom template directory.
+
+        Parameters
+        ----------
+        template_dir : str | Path, optional
+            Directory holding ``<style>.txt`` files that override the packaged
+            ones. Resolved once, here. None uses only the packaged templates.
+        """
+        if template_dir is not None:
+            self._template_dir = Path(template_dir).expanduser().resolve()
+        self._cache: dict[Path, str] = {}
+        self._lock = threading.Lock()
 
     def get(self, style_key: str) -> str:
+        """
+        Return the template text for `style_key`.
+
+        Raises
+        ------
+        UnknownStyleError
+            If neither the configured nor the packaged directory has the style.
+        """
+        filename = f"{style_key}.txt"
+        if self._template_dir != self._builtin_dir:
+            try:
+                return self._read(self._template_dir / filename)
+            except FileNotFoundError:
+                pass
         try:
-            with open(self._template_dir / f"{style_key}.txt", encoding="utf-8") as fh:
-                return fh.read()
+            return self._read(self._builtin_dir / filename)
         except FileNotFoundError as exc:
             raise UnknownStyleError(style_key) from exc
+
+    def _read(self, path: Path) -> str:
+        """Return `path`'s text, reading it on first use only."""
+        cached = self._cache.get(path)
+        if cached is not None:
+            return cached
+        with open(path, encoding="utf-8") as fh:
+            text = fh.read()
+        with self._lock:
+            self._cache[path] = text
+        return text
@@ -9,15 +9,26 @@ No I/O, no logging, no retries.
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncIterator, Iterable, Iterator
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional
 
 from lovethedocs.domain.docstyle.base import DocStyle
-from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.models import ModuleEdit, SourceModule
 from lovethedocs.domain.models.update_result import UpdateResult
 from lovethedocs.domain.services import PromptBuilder
-from lovethedocs.domain.services.generator import ModuleEditGenerator
+from lovethedocs.domain.services.generator import (
+    EditItemCallback,
+    EditValidationError,
+    ModuleEditGenerator,
+)
+from lovethedocs.domain.services.model_router import ModelRouter
 from lovethedocs.domain.services.patcher import ModulePatcher
 
+# Called with (module, array_key, edit) for every edit streamed back by the model.
+ModuleItemCallback = Callable[[SourceModule, str, dict], None]
+
 
 class DocumentationUpdateUseCase:
     """Coordinates batch documentation updates for modules."""
@@ -28,6 +39,7 @@ class DocumentationUpdateUseCase:
         builder: PromptBuilder,
         generator: ModuleEditGenerator,
         patcher: ModulePatcher,
+        router: Optional[ModelRouter] = None,
     ) -> None:
         """
         Initialize the DocumentationUpdateUseCase with required services.
@@ -40,24 +52,47 @@ class DocumentationUpdateUseCase:
             Service to generate documentation edits.
         patcher : ModulePatcher
             Service to apply generated edits to module source code.
+        router : ModelRouter, optional
+            Sends simple modules to a smaller model, escalating to `generator`
+            when its output fails validation. None sends everything to `generator`.
         """
         self._builder = builder
         self._generator = generator
         self._patcher = patcher
+        self._router = router
 
     # The public API --------------------------------------------------------
     def run(
-        self, modules: Iterable[SourceModule], *, style: DocStyle
+        self,
+        modules: Iterable[SourceModule],
+        *,
+        style: DocStyle,
+        workers: int = 0,
+        ordered: bool = True,
+        low_memory: bool = False,
     ) -> Iterator[UpdateResult]:
         """
         Iterate over modules and yield their updated source code.
 
+        With `workers` > 0, modules are processed on a bounded thread pool so sync
+        callers get parallel requests without an event loop. At most ``2 * workers``
+        modules are queued at once.
+
         Parameters
         ----------
         modules : Iterable[SourceModule]
             Modules to update documentation for.
         style : DocStyle
             Documentation style to apply.
+        workers : int, optional
+            Number of worker threads. 0 processes modules serially (default).
+        ordered : bool, optional
+            With workers, yield results in input order (True, default) or as soon
+            as each module finishes (False).
+        low_memory : bool, optional
+            Build each prompt just before its request and drop failure tracebacks,
+            so only in-flight modules are held. `modules` may then be a lazy
+            iterable that is consumed once.
 
         Returns
         -------
@@ -65,22 +100,97 @@ class DocumentationUpdateUseCase:
             Iterator yielding results for each module, including updated code or
             errors.
         """
+        prompt_for = self._prompt_source(modules, style=style, low_memory=low_memory)
+
+        if workers <= 0:
+            for mod in modules:
+                yield self._update_one(mod, prompt_for, low_memory)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: deque[Future[UpdateResult]] = deque()
+            for mod in modules:
+                pending.append(
+                    pool.submit(self._update_one, mod, prompt_for, low_memory)
+                )
+                if len(pending) >= 2 * workers:
+                    yield from self._drain(pending, ordered=ordered, until=workers)
+            yield from self._drain(pending, ordered=ordered, until=0)
+
+    def _prompt_source(
+        self, modules: Iterable[SourceModule], *, style: DocStyle, low_memory: bool
+    ) -> Callable[[SourceModule], str]:
+        """Return a module -> prompt lookup, built upfront unless `low_memory`."""
+        if low_memory:
+            return self._builder.build_one
         user_prompts = self._builder.build(modules, style=style)
+        return lambda mod: user_prompts[mod.path]
 
-        for mod in modules:
-            try:
-                raw_edit = self._generator.generate(user_prompts[mod.path])
-                new_code = self._patcher.apply(raw_edit, mod.code)
-                yield UpdateResult(module=mod, new_code=new_code)
-            except Exception as exc:
-                yield UpdateResult(module=mod, new_code=None, error=exc)
+    def _update_one(
+        self,
+        mod: SourceModule,
+        prompt_for: Callable[[SourceModule], str],
+        low_memory: bool = False,
+    ) -> UpdateResult:
+        """Generate and apply edits for one module, capturing any failure."""
+        try:
+            raw_edit = self._generate(mod, prompt_for(mod))
+            new_code = self._patcher.apply(raw_edit, mod.code)
+            return UpdateResult(module=mod, new_code=new_code)
+        except Exception as exc:
+            return _failed(mod, exc, low_memory)
+
+    def _generate(self, mod: SourceModule, prompt: str) -> ModuleEdit:
+        """Generate edits on the routed model, escalating invalid small output."""
+        generator = self._router.route(mod) if self._router else self._generator
+        try:
+            return generator.generate(prompt)
+        except EditValidationError:
+            if generator is self._generator:
+                raise
+            self._router.escalated()  # type: ignore[union-attr]
+            return self._generator.generate(prompt)
+
+    async def _generate_async(
+        self, mod: SourceModule, prompt: str, *, on_item: Optional[EditItemCallback]
+    ) -> ModuleEdit:
+        """Async twin of `_generate`."""
+        generator = self._router.route(mod) if self._router else self._generator
+        try:
+            return await generator.generate_async(prompt, on_item=on_item)
+        except EditValidationError:
+            if generator is self._generator:
+                raise
+            self._router.escalated()  # type: ignore[union-attr]
+            return await self._generator.generate_async(prompt, on_item=on_item)
+
+    @staticmethod
+    def _drain(
+        pending: deque[Future[UpdateResult]], *, ordered: bool, until: int
+    ) -> Iterator[UpdateResult]:
+        """Yield finished results until at most `until` futures remain pending."""
+        while len(pending) > until:
+            if ordered:
+                yield pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in [f for f in pending if f in done]:
+                pending.remove(fut)
+                yield fut.result()
 
         # ------------------------------------------------------------------ #
 
     #  Async API                                                         #
     # ------------------------------------------------------------------ #
     async def run_async(
-        self, modules: Iterable[SourceModule], *, style: DocStyle, concurrency: int
+        self,
+        modules: Iterable[SourceModule],
+        *,
+        style: DocStyle,
+        concurrency: int,
+        on_item: Optional[ModuleItemCallback] = None,
+        low_memory: bool = False,
+        order_key: Optional[Callable[[SourceModule], Any]] = None,
     ) -> AsyncIterator[UpdateResult]:
         """
         Asynchronously update documentation for modules with limited concurrency.
@@ -96,13 +206,27 @@ class DocumentationUpdateUseCase:
             Documentation style to apply.
         concurrency : int, optional
             Maximum number of concurrent updates.
+        on_item : ModuleItemCallback, optional
+            If given, responses are streamed and `on_item(module, array_key, edit)`
+            fires for each edit object as soon as it arrives.
+        low_memory : bool, optional
+            Build prompts on demand, pull modules from `modules` only as slots free
+            up and drop failure tracebacks, so memory is bounded by `concurrency`
+            rather than by the number of modules.
+        order_key : Callable[[SourceModule], Any], optional
+            Start modules in ascending order of this key, e.g.
+            `scheduling.largest_first` so the longest requests do not end up in
+            the tail. Ignored with `low_memory`, which never holds every module.
+            None keeps the input order.
 
         Yields
         ------
         AsyncIterator[UpdateResult]
             Asynchronous iterator yielding results for each module.
         """
-        user_prompts = self._builder.build(modules, style=style)
+        if order_key is not None and not low_memory:
+            modules = sorted(modules, key=order_key)
+        prompt_for = self._prompt_source(modules, style=style, low_memory=low_memory)
         sem = asyncio.Semaphore(concurrency)
 
         async def _job(mod: SourceModule) -> UpdateResult:
@@ -121,13 +245,77 @@ class DocumentationUpdateUseCase:
             """
             async with sem:
                 try:
-                    raw_edit = await self._generator.generate_async(
-                        user_prompts[mod.path]
+                    callback = None if on_item is None else partial(on_item, mod)
+                    raw_edit = await self._generate_async(
+                        mod, prompt_for(mod), on_item=callback
                     )
                     new_code = self._patcher.apply(raw_edit, mod.code)
                     return UpdateResult(module=mod, new_code=new_code)
                 except Exception as exc:
-                    return UpdateResult(module=mod, new_code=None, error=exc)
+                    return _failed(mod, exc, low_memory)
+
+        if not low_memory:
+            # Create every task up front so the semaphore admits them FIFO, in
+            # schedule order. Finished tasks leave `pending`, and nothing else
+            # keeps them (unlike `as_completed`), so a result is freed once yielded.
+            pending: set[asyncio.Task[UpdateResult]] = set()
+
+            def _start(mod: SourceModule) -> asyncio.Task[UpdateResult]:
+                task = asyncio.ensure_future(_job(mod))
+                task.add_done_callback(pending.discard)
+                return task
+
+            pending.update(_start(m) for m in modules)
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    while done:
+                        yield done.pop().result()
+            finally:
+                for task in list(pending):
+                    task.cancel()
+            return
+
+        # Sliding window: at most `concurrency` modules are alive at once.
+        todo = iter(modules)
+        running: set[asyncio.Task[UpdateResult]] = set()
+        try:
+            while True:
+                for mod in todo:
+                    running.add(asyncio.ensure_future(_job(mod)))
+                    if len(running) >= concurrency:
+                        break
+                if not running:
+                    return
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+                del done, task
+        finally:
+            for task in running:
+                task.cancel()
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Return gateway statistics gathered so far, for the run report.
+
+        Returns
+        -------
+        dict[str, dict]
+            Report sections keyed by title.
+        """
+        sections = self._generator.stats()
+        if self._router is not None:
+            sections.update(self._router.stats())
+        return sections
+
 
-        for coro in asyncio.as_completed([_job(m) for m in modules]):
-            yield await coro
+def _failed(mod: SourceModule, exc: Exception, low_memory: bool) -> UpdateResult:
+    """Wrap a failure; in low-memory mode drop the traceback and the frames it pins."""
+    if low_memory:
+        exc = exc.with_traceback(None)
+    return UpdateResult(module=mod, new_code=None, error=exc)
@@ -0,0 +1,297 @@
+"""
+`LLMClientPort` over several backends: API keys, deployments or compatible endpoints.
+
+Each request goes to the backend with the fewest outstanding requests among those
+that are within their rate limit and not cooling down after an error. A failed
+request is retried on the next-best backend, so aggregate throughput scales with
+the number of backends and one bad endpoint does not stall the run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+import openai
+
+from lovethedocs.domain.docstyle import DocStyle
+
+_BASE_COOLDOWN = 1.0  # seconds; doubles per consecutive failure
+_MAX_COOLDOWN = 30.0
+
+
+class AllBackendsFailedError(RuntimeError):
+    """Every backend failed for one request; `__cause__` is the last error."""
+
+
+# 4xx statuses that say "try again later" rather than "this request is wrong".
+_RETRYABLE_4XX = frozenset({408, 409, 429})
+
+
+def is_request_error(exc: Exception) -> bool:
+    """
+    True if the provider answered but refused the request, so retrying is pointless.
+
+    Any 4xx other than timeout, conflict and rate limit counts: a malformed
+    request, but also a bad API key (401/403) or an unknown model (404). These
+    are per-request failures, not signs of an outage.
+    """
+    return (
+        isinstance(exc, openai.APIStatusError)
+        and 400 <= exc.status_code < 500
+        and exc.status_code not in _RETRYABLE_4XX
+    )
+
+
+@dataclass
+class Backend:
+    """
+    One upstream client plus its routing limits.
+
+    Attributes
+    ----------
+    name : str
+        Label used in the run report.
+    client : Any
+        An `OpenAIClientAdapter` (sync pool) or `AsyncOpenAIClientAdapter`.
+    rpm : int
+        Requests-per-minute ceiling for this backend; 0 means unlimited.
+    """
+
+    name: str
+    client: Any
+    rpm: int = 0
+    # routing state, guarded by the pool's lock
+    outstanding: int = field(default=0, init=False)
+    next_slot: float = field(default=0.0, init=False)
+    cooldown_until: float = field(default=0.0, init=False)
+    consecutive_failures: int = field(default=0, init=False)
+    ok: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+
+
+class _Balancer:
+    """Routing state shared by the sync and async pools."""
+
+    def __init__(self, backends: Sequence[Backend]) -> None:
+        if not backends:
+            raise ValueError("A backend pool needs at least one backend.")
+        self.backends = list(backends)
+        self._lock = threading.Lock()
+
+    def acquire(self, exclude: set[str]) -> tuple[Backend, float]:
+        """
+        Pick a backend and reserve a slot on it.
+
+        Returns the backend and how long to wait before sending, which is non-zero
+        only when every candidate is rate-limited or cooling down.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [b for b in self.backends if b.name not in exclude]
+            backend = min(
+                candidates,
+                key=lambda b: (
+                    max(b.next_slot, b.cooldown_until, now) - now,
+                    b.outstanding,
+                ),
+            )
+            start = max(backend.next_slot, backend.cooldown_until, now)
+            if backend.rpm:
+                backend.next_slot = start + 60.0 / backend.rpm
+            backend.outstanding += 1
+            return backend, start - now
+
+    def release(self, backend: Backend, *, failed: bool) -> None:
+        """Return `backend`'s slot, starting or extending its cooldown on failure."""
+        with self._lock:
+            backend.outstanding -= 1
+            if failed:
+                backend.failed += 1
+                backend.consecutive_failures += 1
+                cooldown = _BASE_COOLDOWN * 2 ** (backend.consecutive_failures - 1)
+                backend.cooldown_until = time.monotonic() + min(cooldown, _MAX_COOLDOWN)
+            else:
+                backend.ok += 1
+                backend.consecutive_failures = 0
+
+    def abandon(self, backend: Backend) -> None:
+        """Return `backend`'s slot without recording an outcome, e.g. on cancel."""
+        with self._lock:
+            backend.outstanding -= 1
+
+    def fail_over(self, backend: Backend, exc: Exception, tried: set[str]) -> None:
+        """
+        Record a failed attempt and re-raise unless another backend is worth trying.
+        """
+        if is_request_error(exc):
+            self.abandon(backend)
+            raise exc
+        self.release(backend, failed=True)
+        tried.add(backend.name)
+        if len(tried) == len(self.backends):
+            raise AllBackendsFailedError(str(exc)) from exc
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-backend outcomes and each backend client's own sections."""
+        with self._lock:
+            sections = {
+                "Backend pool": {
+                    b.name: f"{b.ok} ok / {b.failed} failed" for b in self.backends
+                }
+            }
+        by_title: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for b in self.backends:
+            report = getattr(b.client, "stats", None)
+            for title, values in (report() if callable(report) else {}).items():
+                by_title.setdefault(title, []).append((b.name, values))
+        for title, reports in by_title.items():
+            # Backends may share one resource (e.g. the HTTP pool); show it once.
+            if len(reports) == len(self.backends) and all(
+                values == reports[0][1] for _, values in reports
+            ):
+                sections[title] = reports[0][1]
+                continue
+            for name, values in reports:
+                sections[f"{title} ({name})"] = values
+        return sections
+
+
+# --------------------------------------------------------------------------- #
+#  Sync pool                                                                  #
+# --------------------------------------------------------------------------- #
+class PooledClient:
+    """
+    Synchronous `LLMClientPort` that load-balances over `backends`.
+
+    Safe to share between the worker threads of the sync runner.
+    """
+
+    def __init__(self, backends: Sequence[Backend], *, style: DocStyle) -> None:
+        """
+        Create a pool routing over `backends`.
+
+        Parameters
+        ----------
+        backends : Sequence[Backend]
+            Backends wrapping synchronous adapters, in preference order.
+        style : DocStyle
+            The documentation style shared by every backend.
+        """
+        self._balancer = _Balancer(backends)
+        self._style = style
+
+    def request(self, prompt: str) -> dict[str, Any]:
+        """
+        Send `prompt` to the best available backend, failing over on errors.
+
+        Raises
+        ------
+        AllBackendsFailedError
+            If every backend raised for this prompt.
+        openai.BadRequestError
+            Re-raised at once: a rejected request is not the backend's fault.
+        """
+        tried: set[str] = set()
+        while True:
+            backend, delay = self._balancer.acquire(tried)
+            if delay:
+                time.sleep(delay)
+            try:
+                result = backend.client.request(prompt)
+            except Exception as exc:
+                self._balancer.fail_over(backend, exc, tried)
+                continue
+            self._balancer.release(backend, failed=False)
+            return result
+
+    @property
+    def style(self) -> DocStyle:
+        """The documentation style used by this client."""
+        return self._style
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-backend outcomes plus each backend's own sections."""
+        return self._balancer.stats()
+
+
+# --------------------------------------------------------------------------- #
+#  Async pool                                                                 #
+# --------------------------------------------------------------------------- #
+class AsyncPooledClient:
+    """Asynchronous twin of `PooledClient`, including streaming requests."""
+
+    def __init__(self, backends: Sequence[Backend], *, style: DocStyle) -> None:
+        """
+        Create a pool routing over `backends`.
+
+        Parameters
+        ----------
+        backends : Sequence[Backend]
+            Backends wrapping asynchronous adapters, in preference order.
+        style : DocStyle
+            The documentation style shared by every backend.
+        """
+        self._balancer = _Balancer(backends)
+        self._style = style
+
+    async def request(self, prompt: str) -> dict[str, Any]:
+        """Async counterpart of `PooledClient.request`."""
+        return await self._send(lambda client: client.request(prompt))
+
+    async def request_stream(
+        self, prompt: str, on_item: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """
+        Stream from the best available backend.
+
+        Fails over only while nothing has been reported through `on_item`; once
+        edits were emitted, switching backends could report them twice.
+        """
+        emitted = False
+
+        def _on_item(key: str, item: dict[str, Any]) -> None:
+            nonlocal emitted
+            emitted = True
+            on_item(key, item)
+
+        return await self._send(
+            lambda client: client.request_stream(prompt, _on_item),
+            can_retry=lambda: not emitted,
+        )
+
+    async def _send(
+        self,
+        call: Callable[[Any], Any],
+        can_retry: Callable[[], bool] = lambda: True,
+    ) -> dict[str, Any]:
+        tried: set[str] = set()
+        while True:
+            backend, delay = self._balancer.acquire(tried)
+            try:
+                if delay:
+                    await asyncio.sleep(delay)
+                result = await call(backend.client)
+            except asyncio.CancelledError:  # e.g. a hedge loser: no outcome to count
+                self._balancer.abandon(backend)
+                raise
+            except Exception as exc:
+                if not can_retry():
+                    self._balancer.release(backend, failed=True)
+                    raise
+                self._balancer.fail_over(backend, exc, tried)
+                continue
+            self._balancer.release(backend, failed=False)
+            return result
+
+    @property
+    def style(self) -> DocStyle:
+        """The documentation style used by this client."""
+        return self._style
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-backend outcomes plus each backend's own sections."""
+        return self._balancer.stats()
@@ -0,0 +1,153 @@
+"""
+Content-addressed store for the originals replaced by applied edits.
+
+Each distinct file content is kept once, as ``objects/<hh>/<sha256>``, hardlinked to
+the original when the filesystem allows it and copied otherwise. Every apply
+session writes a small ``runs/<run-id>.json`` index mapping relative paths to
+digests, so history across runs is kept and any run can be restored.
+
+Hardlinking is safe because originals are only ever replaced by renaming a new
+file over them, never rewritten in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_CHUNK = 1 << 16
+
+
+def _digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of `path`'s bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class BackupRun:
+    """
+    One apply session's backups.
+
+    Attributes
+    ----------
+    run_id : str
+        Sortable identifier, e.g. ``20250101-120000``.
+    created : str
+        ISO-8601 local time the run started.
+    files : Dict[Path, str]
+        Relative path of each replaced original to its content digest.
+    """
+
+    run_id: str
+    created: str
+    files: Dict[Path, str] = field(default_factory=dict)
+
+
+class BackupStore:
+    """Hash-named blobs plus per-run indexes under one directory."""
+
+    def __init__(self, root: Path) -> None:
+        """
+        Create a store rooted at `root`; nothing is written until first use.
+
+        Parameters
+        ----------
+        root : Path
+            Directory holding ``objects/`` and ``runs/``.
+        """
+        self.root = root
+        self.objects_root = root / "objects"
+        self.runs_root = root / "runs"
+        self._lock = threading.Lock()
+
+    # ---------------------- blobs ----------------------------------------- #
+    def blob_path(self, digest: str) -> Path:
+        """Return where the blob for `digest` is stored."""
+        return self.objects_root / digest[:2] / digest
+
+    def put(self, path: Path) -> str:
+        """
+        Store `path`'s current content and return its digest.
+
+        Content already in the store costs one read and no write.
+        """
+        digest = _digest(path)
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return digest
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.link(path, tmp)
+        except OSError:  # other filesystem, or links unsupported
+            shutil.copy2(path, tmp)
+        os.replace(tmp, blob)
+        return digest
+
+    # ---------------------- runs ------------------------------------------ #
+    def new_run(self) -> BackupRun:
+        """Start a run with a fresh, unused identifier (not yet written)."""
+        now = datetime.now()
+        base = now.strftime("%Y%m%d-%H%M%S")
+        run_id, n = base, 1
+        with self._lock:
+            while (self.runs_root / f"{run_id}.json").exists():
+                n += 1
+                run_id = f"{base}-{n}"
+            # Reserve the id so a concurrent session cannot take it.
+            self.write_run(BackupRun(run_id, now.isoformat(timespec="seconds")))
+        return BackupRun(run_id, now.isoformat(timespec="seconds"))
+
+    def write_run(self, run: BackupRun) -> None:
+        """Atomically write `run`'s index."""
+        self.runs_root.mkdir(parents=True, exist_ok=True)
+        dest = self.runs_root / f"{run.run_id}.json"
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        payload = {
+            "run": run.run_id,
+            "created": run.created,
+            "files": {p.as_posix(): d for p, d in sorted(run.files.items())},
+        }
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, dest)
+
+    def load_run(self, run_id: str) -> BackupRun:
+        """
+        Read one run's index.
+
+        Raises
+        ------
+        KeyError
+            If there is no run called `run_id`.
+        """
+        path = self.runs_root / f"{run_id}.json"
+        if not path.is_file():
+            raise KeyError(run_id)
+        data = json.loads(path.read_text("utf-8"))
+        files = {Path(p): d for p, d in data["files"].items()}
+        return BackupRun(data["run"], data["created"], files)
+
+    def runs(self) -> List[BackupRun]:
+        """Return every run that backed up at least one file, oldest first."""
+        if not self.runs_root.exists():
+            return []
+        runs = (self.load_run(p.stem) for p in self.runs_root.glob("*.json"))
+        return sorted((r for r in runs if r.files), key=lambda r: r.run_id)
+
+    def latest(self, rel_path: Path) -> Optional[Path]:
+        """Return the newest blob backing up `rel_path`, or None."""
+        for run in reversed(self.runs()):
+            if rel_path in run.files:
+                return self.blob_path(run.files[rel_path])
+        return None
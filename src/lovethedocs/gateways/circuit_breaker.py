@@ -0,0 +1,249 @@
+"""
+Circuit breaker around an `LLMClientPort`, so provider outages fail fast.
+
+While the recent error rate stays below the threshold the breaker is *closed* and
+requests pass through. Above it the breaker *opens*: dispatch pauses for
+`cooldown` seconds, then a single *half-open* probe is let through. A successful
+probe closes the breaker; a failed one re-opens it. Once the outage has lasted
+`abort_after` seconds the breaker is *aborted*: requests raise `CircuitOpenError`
+instead of waiting, which the pipeline records as resumable work instead of a
+failure. Probes still go out every `cooldown` seconds, so a long-lived process
+(watch mode, a service awaiting `run_pipeline_async`) recovers with the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Any, Callable
+
+from lovethedocs.domain.docstyle import DocStyle
+from lovethedocs.gateways.backend_pool import is_request_error
+
+_PROBE_POLL = 0.5  # seconds between checks while a probe is in flight
+
+
+class CircuitOpenError(RuntimeError):
+    """The provider stayed unavailable for too long; the run should stop."""
+
+
+class CircuitBreaker:
+    """Thread-safe closed / open / half-open state machine."""
+
+    def __init__(
+        self,
+        *,
+        error_rate: float = 0.5,
+        window: int = 20,
+        cooldown: float = 30.0,
+        abort_after: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a closed breaker.
+
+        Parameters
+        ----------
+        error_rate : float, optional
+            Fraction of failed requests among the last `window` that opens it.
+        window : int, optional
+            Number of recent outcomes considered; the breaker cannot open before
+            this many requests have finished.
+        cooldown : float, optional
+            Seconds to pause dispatch before each half-open probe.
+        abort_after : float, optional
+            Seconds of continuous outage after which requests raise
+            `CircuitOpenError` instead of waiting.
+        clock : Callable[[], float], optional
+            Monotonic time source, replaceable in tests.
+        """
+        self._error_rate = error_rate
+        self._outcomes: collections.deque[bool] = collections.deque(maxlen=window)
+        self._cooldown = cooldown
+        self._abort_after = abort_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._opened_at = 0.0  # start of the current outage
+        self._retry_at = 0.0
+        self._probing = False
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        """One of ``closed``, ``open``, ``half-open`` or ``aborted``."""
+        return self._state
+
+    def acquire(self) -> tuple[float, bool]:
+        """
+        Ask to send a request.
+
+        Returns
+        -------
+        tuple[float, bool]
+            Seconds to wait before asking again (0 means send now), and whether
+            the request is the half-open probe.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the breaker has given up on the provider and no probe is due.
+        """
+        with self._lock:
+            if self._state == "closed":
+                return 0.0, False
+            now = self._clock()
+            if self._state == "aborted" and now < self._retry_at:
+                raise CircuitOpenError(
+                    f"provider unavailable for over {self._abort_after:.0f}s"
+                )
+            if self._state == "open" and now < self._retry_at:
+                return self._retry_at - now, False
+            if self._probing:
+                return _PROBE_POLL, False
+            self._state = "half-open"
+            self._probing = True
+            return 0.0, True
+
+    def record(self, *, ok: bool, probe: bool) -> None:
+        """Record the outcome of a request admitted by `acquire`."""
+        with self._lock:
+            if probe:
+                self._probing = False
+                if ok:
+                    self._state = "closed"
+                    self._outcomes.clear()
+                else:
+                    self._reopen()
+                return
+            if self._state != "closed":
+                return  # sent before the breaker opened; says nothing new
+            self._outcomes.append(ok)
+            if len(self._outcomes) == self._outcomes.maxlen and self._outcomes.count(
+                False
+            ) >= self._error_rate * len(self._outcomes):
+                self._trips += 1
+                self._opened_at = self._clock()
+                self._state = "open"
+                self._retry_at = self._opened_at + self._cooldown
+
+    def cancelled(self, *, probe: bool) -> None:
+        """Release a request that was cancelled before it had an outcome."""
+        if probe:
+            with self._lock:
+                self._probing = False
+                self._state = self._outage_state(self._clock())
+
+    def _reopen(self) -> None:
+        now = self._clock()
+        self._state = self._outage_state(now)
+        self._retry_at = now + self._cooldown
+
+    def _outage_state(self, now: float) -> str:
+        return "aborted" if now - self._opened_at >= self._abort_after else "open"
+
+    def stats(self) -> dict[str, Any]:
+        """State and number of times the breaker opened."""
+        with self._lock:
+            return {"state": self._state, "trips": self._trips}
+
+
+# --------------------------------------------------------------------------- #
+#  Client wrappers                                                            #
+# --------------------------------------------------------------------------- #
+class _BreakerClientBase:
+    def __init__(self, client: Any, breaker: CircuitBreaker) -> None:
+        """
+        Wrap `client` so its requests go through `breaker`.
+
+        Parameters
+        ----------
+        client : Any
+            The client to protect, e.g. an adapter or a backend pool.
+        breaker : CircuitBreaker
+            The breaker deciding when requests may be sent.
+        """
+        self._client = client
+        self._breaker = breaker
+
+    @property
+    def style(self) -> DocStyle:
+        """The documentation style used by this client."""
+        return self._client.style
+
+    def _record(self, exc: Exception | None, probe: bool) -> None:
+        if exc is not None and is_request_error(exc):
+            # The provider answered but refused the request (bad payload, key or
+            # model): not an outage, and not a success either, so the error window
+            # is left alone. A probe still learned the provider is reachable.
+            if probe:
+                self._breaker.record(ok=True, probe=True)
+            return
+        self._breaker.record(ok=exc is None, probe=probe)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Breaker state plus the wrapped client's own sections."""
+        sections = {"Circuit breaker": self._breaker.stats()}
+        report = getattr(self._client, "stats", None)
+        if callable(report):
+            sections.update(report())
+        return sections
+
+
+class CircuitBreakerClient(_BreakerClientBase):
+    """Synchronous client guarded by a `CircuitBreaker`."""
+
+    def request(self, prompt: str) -> dict[str, Any]:
+        """
+        Send `prompt` once the breaker allows it.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the breaker gave up on the provider.
+        """
+        while True:
+            delay, probe = self._breaker.acquire()
+            if not delay:
+                break
+            time.sleep(delay)
+        try:
+            result = self._client.request(prompt)
+        except Exception as exc:
+            self._record(exc, probe)
+            raise
+        self._record(None, probe)
+        return result
+
+
+class AsyncCircuitBreakerClient(_BreakerClientBase):
+    """Asynchronous twin of `CircuitBreakerClient`, including streaming requests."""
+
+    async def request(self, prompt: str) -> dict[str, Any]:
+        """Async counterpart of `CircuitBreakerClient.request`."""
+        return await self._send(lambda: self._client.request(prompt))
+
+    async def request_stream(
+        self, prompt: str, on_item: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Stream `prompt` once the breaker allows it."""
+        return await self._send(lambda: self._client.request_stream(prompt, on_item))
+
+    async def _send(self, call: Callable[[], Any]) -> dict[str, Any]:
+        while True:
+            delay, probe = self._breaker.acquire()
+            if not delay:
+                break
+            await asyncio.sleep(delay)
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            self._breaker.cancelled(probe=probe)
+            raise
+        except Exception as exc:
+            self._record(exc, probe)
+            raise
+        self._record(None, probe)
+        return result
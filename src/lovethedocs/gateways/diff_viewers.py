@@ -1,3 +1,4 @@
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -40,6 +41,13 @@ class CodeCLIDiffViewer(DiffViewerPort):
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise DiffViewerError("Code CLI ('code') not found on PATH.")
 
+    def view_patch(self, patch: Path) -> None:
+        """Open a patch file in VS Code."""
+        try:
+            subprocess.run(["code", str(patch)], check=True, capture_output=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            raise DiffViewerError("Code CLI ('code') not found on PATH.")
+
 
 class TerminalDiffViewer(DiffViewerPort):
     """Diff viewer that displays a colorized unified diff in the terminal using Rich."""
@@ -65,6 +73,13 @@ class TerminalDiffViewer(DiffViewerPort):
         diff = "".join(unified_diff(a, b, fromfile=str(original), tofile=str(improved)))
         Console().print(Syntax(diff, "diff"))
 
+    def view_patch(self, patch: Path) -> None:
+        """Print a patch file with diff highlighting."""
+        from rich.console import Console
+        from rich.syntax import Syntax
+
+        Console().print(Syntax(patch.read_text(), "diff"))
+
 
 class GitDiffViewer(DiffViewerPort):
     """Diff viewer that pipes 'git diff --no-index' output to the user's pager."""
@@ -88,6 +103,23 @@ class GitDiffViewer(DiffViewerPort):
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise DiffViewerError("Git ('git') not found on PATH.")
 
+    def view_patch(self, patch: Path) -> None:
+        """
+        Show a patch file in git's pager, as 'git diff' would.
+
+        The pager is the one git is configured with ($GIT_PAGER, core.pager, $PAGER,
+        then less), run with git's default ``LESS=FRX``.
+        """
+        try:
+            pager = subprocess.run(
+                ["git", "var", "GIT_PAGER"], check=True, capture_output=True, text=True
+            ).stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            raise DiffViewerError("Git ('git') not found on PATH.")
+        env = {**os.environ, "LESS": os.environ.get("LESS", "FRX")}
+        with open(patch, "rb") as fh:
+            subprocess.run(pager or "cat", shell=True, stdin=fh, env=env, check=False)
+
 
 class CursorDiffViewer(DiffViewerPort):
     """Diff viewer that launches Cursor to show file differences."""
@@ -118,6 +150,13 @@ class CursorDiffViewer(DiffViewerPort):
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise DiffViewerError("Cursor CLI ('cursor') not found on PATH.")
 
+    def view_patch(self, patch: Path) -> None:
+        """Open a patch file in Cursor."""
+        try:
+            subprocess.run(["cursor", str(patch)], check=True, capture_output=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            raise DiffViewerError("Cursor CLI ('cursor') not found on PATH.")
+
 
 _VIEWER_REGISTRY = {
     "cursor": CursorDiffViewer,
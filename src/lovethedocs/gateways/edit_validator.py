@@ -0,0 +1,125 @@
+"""
+Single-pass validation of model responses straight into domain edit objects.
+
+`lovethedocs_schema.json` is compiled once, at import time, into a pydantic-core
+validator whose object nodes construct `FunctionEdit` / `ClassEdit` / `ModuleEdit`
+directly. One call therefore both validates and maps a response, and runs in Rust
+rather than walking the schema with jsonschema on every response.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic_core import SchemaValidator, ValidationError, core_schema as cs
+
+from lovethedocs.domain.models import ClassEdit, FunctionEdit, ModuleEdit
+from lovethedocs.gateways.schema_loader import _RAW_SCHEMA
+
+# Schema node (the root, or a `$defs` name) -> dataclass built from it.
+_TARGETS: dict[str, type] = {
+    "#": ModuleEdit,
+    "function_edit": FunctionEdit,
+    "class_edit": ClassEdit,
+}
+
+# Keywords the compiler honours, per node kind. Anything else (`pattern`, `enum`,
+# ...) would be silently dropped, so it is rejected instead.
+_KEYWORDS: dict[str, frozenset[str]] = {
+    "$ref": frozenset({"$ref"}),
+    "string": frozenset({"type"}),
+    "array": frozenset({"type", "items"}),
+    "object": frozenset({"type", "properties", "required", "additionalProperties"}),
+}
+# Annotations with no effect on validation, allowed on any node.
+_ANNOTATIONS = frozenset({"$schema", "$defs", "title", "description"})
+
+
+# --------------------------------------------------------------------------- #
+#  Schema compiler                                                            #
+# --------------------------------------------------------------------------- #
+def _compile(node: dict, name: str | None = None) -> cs.CoreSchema:
+    """Translate one JSON-schema node into the equivalent pydantic-core schema."""
+    kind = "$ref" if "$ref" in node else node.get("type")
+    if kind not in _KEYWORDS or node.keys() - _KEYWORDS[kind] - _ANNOTATIONS:
+        raise ValueError(f"Unsupported schema node: {node!r}")
+
+    if kind == "$ref":
+        return cs.definition_reference_schema(node["$ref"].rsplit("/", 1)[-1])
+    if kind == "string":
+        return cs.str_schema(strict=True)
+    if kind == "array":
+        return cs.list_schema(_compile(node["items"]), strict=True)
+    if kind == "object" and name in _TARGETS:
+        return _compile_object(node, _TARGETS[name])
+    raise ValueError(f"Unsupported schema node: {node!r}")
+
+
+def _compile_object(node: dict, target: type) -> cs.CoreSchema:
+    """Compile an object node into a schema that instantiates `target`."""
+    required = set(node.get("required", ()))
+    fields = [
+        cs.dataclass_field(
+            prop,
+            _compile(sub)
+            if prop in required
+            else cs.with_default_schema(_compile(sub), default=None),
+        )
+        for prop, sub in node["properties"].items()
+    ]
+    forbid = node.get("additionalProperties") is False
+    return cs.dataclass_schema(
+        target,
+        cs.dataclass_args_schema(
+            target.__name__,
+            fields,
+            extra_behavior="forbid" if forbid else "ignore",
+        ),
+        [f.name for f in target.__dataclass_fields__.values()],
+        post_init=hasattr(target, "__post_init__"),
+        slots=hasattr(target, "__slots__"),
+        frozen=target.__dataclass_params__.frozen,
+        revalidate_instances="never",
+    )
+
+
+def _compile_root(schema: dict) -> SchemaValidator:
+    definitions = [
+        {**_compile(sub, name), "ref": name}
+        for name, sub in schema.get("$defs", {}).items()
+    ]
+    return SchemaValidator(
+        cs.definitions_schema(_compile(schema, "#"), definitions),
+    )
+
+
+_VALIDATOR = _compile_root(_RAW_SCHEMA)
+
+
+# --------------------------------------------------------------------------- #
+#  Public API                                                                 #
+# --------------------------------------------------------------------------- #
+def parse_module_edit(raw: dict[str, Any]) -> ModuleEdit:
+    """
+    Validate a raw model response and build its `ModuleEdit` in one pass.
+
+    Parameters
+    ----------
+    raw : dict[str, Any]
+        Decoded JSON returned by the LLM client.
+
+    Returns
+    -------
+    ModuleEdit
+        The validated edits.
+
+    Raises
+    ------
+    pydantic_core.ValidationError
+        If `raw` does not match ``lovethedocs_schema.json``. It subclasses
+        ValueError and lists every offending location.
+    """
+    return _VALIDATOR.validate_python(raw)
+
+
+__all__ = ["parse_module_edit", "ValidationError"]
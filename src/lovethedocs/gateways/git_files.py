@@ -0,0 +1,59 @@
+"""
+Ask git which Python files are staged for commit.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import List
+
+
+class GitError(ValueError):
+    """Git is missing, or the directory is not inside a repository."""
+
+
+def _git(cwd: Path, *args: str) -> str:
+    try:
+        done = subprocess.run(
+            ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        raise GitError("Git ('git') not found on PATH.")
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.strip() or f"git {args[0]} failed")
+    return done.stdout
+
+
+def staged_python_files(cwd: Path) -> tuple[Path, List[Path]]:
+    """
+    Return the repository root and the ``.py`` files added or modified in its index.
+
+    Parameters
+    ----------
+    cwd : Path
+        Any directory inside the repository.
+
+    Returns
+    -------
+    tuple[Path, List[Path]]
+        The top-level directory and the staged files relative to it. Deleted files
+        are left out.
+
+    Raises
+    ------
+    GitError
+        If git is unavailable or `cwd` is not in a repository.
+    """
+    root = Path(_git(cwd, "rev-parse", "--show-toplevel").strip())
+    out = _git(
+        root,
+        "diff",
+        "--cached",
+        "--name-only",
+        "--diff-filter=ACMR",
+        "-z",
+        "--",
+        "*.py",
+    )
+    return root, [Path(name) for name in out.split("\0") if name]
@@ -0,0 +1,175 @@
+"""
+Async `LLMClientPort` wrapper that hedges straggling requests.
+
+A request still running after the `percentile` latency of recent requests gets a
+duplicate; whichever finishes first wins and the other is cancelled. Duplicates
+are capped at `budget` times the number of requests, so a slow upstream is not
+hit with twice the load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from typing import Any, Awaitable, Callable, Optional
+
+from lovethedocs.domain.docstyle import DocStyle
+
+Attempt = Callable[[int], Awaitable[dict[str, Any]]]
+
+
+class HedgedClient:
+    """Wrap an async client, duplicating requests slower than recent peers."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        """
+        Create a hedging wrapper around `client`.
+
+        Parameters
+        ----------
+        client : Any
+            An async client such as `AsyncOpenAIClientAdapter` or
+            `AsyncPooledClient`.
+        percentile : float, optional
+            Latency percentile of recent successful requests after which a request
+            is duplicated.
+        budget : float, optional
+            Most duplicates per request sent, e.g. 0.05 for at most 5 % extra.
+        min_samples : int, optional
+            Requests to observe before hedging starts; until then there is no
+            meaningful threshold.
+        window : int, optional
+            Number of recent latencies the threshold is computed from.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self._client = client
+        self._percentile = percentile
+        self._budget = budget
+        self._min_samples = min_samples
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self._requests = self._hedged = self._hedge_wins = 0
+
+    @property
+    def style(self) -> DocStyle:
+        """The documentation style used by this client."""
+        return self._client.style
+
+    async def request(self, prompt: str) -> dict[str, Any]:
+        """Send `prompt`, hedging it if it runs past the latency threshold."""
+        return await self._race(lambda _: self._client.request(prompt))
+
+    async def request_stream(
+        self, prompt: str, on_item: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """
+        Stream `prompt`, hedging it while no edit has been reported yet.
+
+        The first attempt to report an edit owns the output and the other attempt
+        is cancelled, so each edit reaches `on_item` once.
+        """
+        owner: Optional[int] = None
+        attempts: list[asyncio.Future] = []
+
+        def _gate(index: int) -> Callable[[str, dict[str, Any]], None]:
+            def _on_item(key: str, item: dict[str, Any]) -> None:
+                nonlocal owner
+                if owner is None:
+                    owner = index
+                    for other, task in enumerate(attempts):
+                        if other != index:
+                            task.cancel()
+                if owner == index:
+                    on_item(key, item)
+
+            return _on_item
+
+        return await self._race(
+            lambda index: self._client.request_stream(prompt, _gate(index)),
+            attempts,
+            can_hedge=lambda: owner is None,
+        )
+
+    async def _race(
+        self,
+        attempt: Attempt,
+        attempts: Optional[list[asyncio.Future]] = None,
+        can_hedge: Callable[[], bool] = lambda: True,
+    ) -> dict[str, Any]:
+        """Run `attempt(0)`, add `attempt(1)` if it straggles, return the winner."""
+        attempts = [] if attempts is None else attempts
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self._requests += 1
+        attempts.append(asyncio.ensure_future(attempt(0)))
+        try:
+            threshold = self._threshold()
+            if threshold is not None:
+                done, _ = await asyncio.wait(attempts, timeout=threshold)
+                if (
+                    not done
+                    and can_hedge()
+                    and self._hedged + 1 <= self._budget * self._requests
+                ):
+                    self._hedged += 1
+                    attempts.append(asyncio.ensure_future(attempt(1)))
+            index, result = await _first_success(attempts)
+        finally:
+            for task in attempts:
+                task.cancel()
+        if index:
+            self._hedge_wins += 1
+        self._latencies.append(loop.time() - started)
+        return result
+
+    def _threshold(self) -> Optional[float]:
+        """Return the current hedging delay, or None while warming up."""
+        if len(self._latencies) < self._min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[round(self._percentile / 100 * (len(ordered) - 1))]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Hedging counters plus the wrapped client's own sections."""
+        threshold = self._threshold()
+        sections = {
+            "Hedging": {
+                "requests": self._requests,
+                "hedged": self._hedged,
+                "hedge wins": self._hedge_wins,
+                "threshold": "warming up" if threshold is None else f"{threshold:.2f}s",
+            }
+        }
+        report = getattr(self._client, "stats", None)
+        if callable(report):
+            sections.update(report())
+        return sections
+
+
+async def _first_success(attempts: list[asyncio.Future]) -> tuple[int, Any]:
+    """
+    Wait for the first attempt that succeeds and return its index and result.
+
+    Raises the first attempt's error if none succeeds.
+    """
+    pending = set(attempts)
+    errors: list[BaseException] = []
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in sorted(done, key=attempts.index):
+            if task.cancelled():
+                continue
+            if task.exception() is None:
+                return attempts.index(task), task.result()
+            errors.append(task.exception())
+    if errors:
+        raise errors[0]
+    raise asyncio.CancelledError()
@@ -0,0 +1,218 @@
+"""
+Pooled, instrumented HTTP transport for the OpenAI SDK clients.
+
+The SDK's default client caps keep-alive connections at 100 and uses generic
+timeouts. At high ``-c`` that causes connection churn and queueing inside httpx, so
+the pool is sized from the requested concurrency instead. Each pooled client records
+request and connection statistics for the run report.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any
+
+import httpx
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection-pool and timeout settings for one HTTP client.
+
+    Attributes
+    ----------
+    max_connections : int
+        Upper bound on open connections.
+    max_keepalive : int
+        Idle connections kept open for reuse.
+    keepalive_expiry : float
+        Seconds an idle connection stays in the pool.
+    connect_timeout : float
+        Seconds allowed to establish a connection.
+    read_timeout : float
+        Seconds allowed between bytes of a response.
+    http2 : bool
+        Negotiate HTTP/2 (only honoured when ``h2`` is installed).
+    """
+
+    max_connections: int = 100
+    max_keepalive: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    http2: bool = True
+
+    @classmethod
+    def for_concurrency(cls, concurrency: int, **overrides: Any) -> "PoolConfig":
+        """
+        Size the pool so every concurrent request can hold its own kept-alive socket.
+
+        Parameters
+        ----------
+        concurrency : int
+            Maximum number of in-flight requests the caller will issue.
+        **overrides
+            Any other `PoolConfig` field.
+
+        Returns
+        -------
+        PoolConfig
+            A config with ``max_connections == max_keepalive == concurrency``.
+        """
+        size = max(1, concurrency)
+        return cls(max_connections=size, max_keepalive=size, **overrides)
+
+    def resolved(self) -> "PoolConfig":
+        """Return a copy with `http2` switched off when ``h2`` is unavailable."""
+        if self.http2 and not http2_available():
+            return replace(self, http2=False)
+        return self
+
+
+class PoolStats:
+    """
+    Thread-safe counters describing how a pooled client was used.
+
+    Connection counts are sampled from the underlying httpcore pool after each
+    request, so they are approximate but cheap.
+    """
+
+    def __init__(self, config: PoolConfig) -> None:
+        self.config = config
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peak_connections = 0
+        self._seen_connections: set[int] = set()
+        self._lock = threading.Lock()
+
+    def started(self) -> None:
+        """Record a request entering the transport."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self, connections: list[Any], *, failed: bool) -> None:
+        """Record a request leaving the transport and sample the pool."""
+        with self._lock:
+            self.in_flight -= 1
+            self.errors += int(failed)
+            self.peak_connections = max(self.peak_connections, len(connections))
+            self._seen_connections.update(id(c) for c in connections)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the counters as a plain dict for reporting."""
+        with self._lock:
+            return {
+                "max connections": self.config.max_connections,
+                "http/2": self.config.http2,
+                "requests": self.requests,
+                "transport errors": self.errors,
+                "peak in flight (incl. queued)": self.peak_in_flight,
+                "peak open connections": self.peak_connections,
+                "connections opened": len(self._seen_connections),
+            }
+
+
+class _InstrumentedAsyncTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport that reports every request to a `PoolStats`."""
+
+    def __init__(self, stats: PoolStats, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.started()
+        failed = True
+        try:
+            response = await super().handle_async_request(request)
+            failed = False
+            return response
+        finally:
+            self.stats.finished(self._pool.connections, failed=failed)
+
+
+class _InstrumentedTransport(httpx.HTTPTransport):
+    """Synchronous twin of `_InstrumentedAsyncTransport`, used by worker threads."""
+
+    def __init__(self, stats: PoolStats, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.started()
+        failed = True
+        try:
+            response = super().handle_request(request)
+            failed = False
+            return response
+        finally:
+            self.stats.finished(self._pool.connections, failed=failed)
+
+
+def _transport_kwargs(cfg: PoolConfig) -> dict[str, Any]:
+    return {
+        "http2": cfg.http2,
+        "limits": httpx.Limits(
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive,
+            keepalive_expiry=cfg.keepalive_expiry,
+        ),
+    }
+
+
+def _timeout(cfg: PoolConfig) -> httpx.Timeout:
+    return httpx.Timeout(cfg.read_timeout, connect=cfg.connect_timeout)
+
+
+@lru_cache(maxsize=None)
+def get_async_http_client(config: PoolConfig) -> httpx.AsyncClient:
+    """
+    Return a cached pooled async client; its `PoolStats` is at ``client.pool_stats``.
+
+    Parameters
+    ----------
+    config : PoolConfig
+        Pool settings; HTTP/2 is dropped silently if ``h2`` is missing.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        A client suitable for ``AsyncOpenAI(http_client=...)``.
+    """
+    cfg = config.resolved()
+    stats = PoolStats(cfg)
+    client = httpx.AsyncClient(
+        transport=_InstrumentedAsyncTransport(stats, **_transport_kwargs(cfg)),
+        timeout=_timeout(cfg),
+        follow_redirects=True,
+    )
+    client.pool_stats = stats  # type: ignore[attr-defined]
+    return client
+
+
+@lru_cache(maxsize=None)
+def get_http_client(config: PoolConfig) -> httpx.Client:
+    """
+    Synchronous counterpart of `get_async_http_client`; safe to share across threads.
+    """
+    cfg = config.resolved()
+    stats = PoolStats(cfg)
+    client = httpx.Client(
+        transport=_InstrumentedTransport(stats, **_transport_kwargs(cfg)),
+        timeout=_timeout(cfg),
+        follow_redirects=True,
+    )
+    client.pool_stats = stats  # type: ignore[attr-defined]
+    return client
@@ -0,0 +1,107 @@
+"""
+Incremental parser for streamed `code_documentation_edits` JSON.
+
+The model's structured output arrives as text deltas. `EditStreamParser` scans them
+once, character by character, and emits every element of the top-level arrays
+(``function_edits`` / ``class_edits``) as soon as its closing brace arrives. Only the
+text of the element currently being received is buffered.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class EditStreamParser:
+    """
+    Emit ``(array_key, item)`` pairs from a JSON object fed in arbitrary chunks.
+
+    Expects the shape ``{"key": [ {...}, {...} ], "other": [ ... ]}``. Items are
+    decoded with `json.loads` one at a time; `result` rebuilds the full object from
+    the emitted items once the stream is complete.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._last_string: list[str] = []
+        self._key: str | None = None
+        self._item: list[str] = []
+        self._done = False
+        self._result: dict[str, list[Any]] = {}
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume a text delta and return the items it completed.
+
+        Parameters
+        ----------
+        chunk : str
+            The next slice of the JSON document.
+
+        Returns
+        -------
+        list[tuple[str, Any]]
+            ``(array_key, decoded_item)`` for every item closed within `chunk`.
+        """
+        emitted: list[tuple[str, Any]] = []
+        item_start = 0 if self._depth >= 3 else None
+        string_start: int | None = 0 if self._in_string else None
+
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and string_start is not None:
+                        self._last_string.append(chunk[string_start:i])
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._last_string = []
+                    string_start = i + 1
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 2 and ch == "[":
+                    self._key = "".join(self._last_string)
+                    self._result[self._key] = []
+                elif self._depth == 3:
+                    item_start = i
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 2 and item_start is not None:
+                    self._item.append(chunk[item_start : i + 1])
+                    item = json.loads("".join(self._item))
+                    self._item = []
+                    item_start = None
+                    self._result[self._key].append(item)
+                    emitted.append((self._key, item))
+                elif self._depth == 0:
+                    self._done = True
+
+        # carry partial item / key text over to the next chunk
+        if item_start is not None:
+            self._item.append(chunk[item_start:])
+        if self._in_string and self._depth == 1 and string_start is not None:
+            self._last_string.append(chunk[string_start:])
+        return emitted
+
+    def result(self) -> dict[str, list[Any]]:
+        """
+        Return the full decoded object.
+
+        Raises
+        ------
+        ValueError
+            If the stream ended before the top-level object was closed.
+        """
+        if not self._done:
+            raise ValueError("Streamed JSON ended before the document was complete.")
+        return self._result
@@ -5,27 +5,59 @@ Concrete adapter that satisfies `LLMClientPort`.
 from __future__ import annotations
 
 import json
+import os
 from functools import lru_cache
-from typing import Any
+from typing import Any, Callable
 
+import httpx
 from dotenv import find_dotenv, load_dotenv
 from openai import AsyncOpenAI, OpenAI, OpenAIError
 
 from lovethedocs.domain.docstyle import DocStyle
 from lovethedocs.domain.templates import PromptTemplateRepository
+from lovethedocs.gateways.http_pool import (
+    PoolConfig,
+    get_async_http_client,
+    get_http_client,
+)
+from lovethedocs.gateways.json_stream import EditStreamParser
 from lovethedocs.gateways.schema_loader import _RAW_SCHEMA
+from lovethedocs.gateways.token_usage import TokenUsage
 
 
 # --------------------------------------------------------------------------- #
 #  One-time helpers                                                           #
 # --------------------------------------------------------------------------- #
-@lru_cache(maxsize=1)
-def _get_sdk_client() -> OpenAI:
+def _api_key(env_var: str | None) -> str | None:
+    """Read the key from `env_var`; None lets the SDK use ``OPENAI_API_KEY``."""
+    if env_var is None:
+        return None
+    try:
+        return os.environ[env_var]
+    except KeyError:
+        raise OpenAIError(f"Environment variable {env_var} is not set.") from None
+
+
+@lru_cache(maxsize=None)
+def _get_sdk_client(
+    base_url: str | None = None,
+    http_client: httpx.Client | None = None,
+    api_key_env: str | None = None,
+) -> OpenAI:
     """
     Return a cached synchronous OpenAI SDK client.
 
     Loads environment variables from a .env file if present. Raises a RuntimeError if
-    the API key is missing.
+    the API key is missing. One client is cached per argument combination.
+
+    Parameters
+    ----------
+    base_url : str, optional
+        API base URL override (e.g. a local stub server). None keeps the SDK default.
+    http_client : httpx.Client, optional
+        Pre-configured transport (see `http_pool`). None keeps the SDK default.
+    api_key_env : str, optional
+        Environment variable holding the API key. None means ``OPENAI_API_KEY``.
 
     Returns
     -------
@@ -39,7 +71,9 @@ def _get_sdk_client() -> OpenAI:
     load_dotenv(find_dotenv(usecwd=True), override=False)
 
     try:
-        return OpenAI()
+        return OpenAI(
+            base_url=base_url, http_client=http_client, api_key=_api_key(api_key_env)
+        )
     except OpenAIError as err:
         raise RuntimeError(
             "OpenAI API key not found. Set OPENAI_API_KEY or add it to a .env file "
@@ -51,13 +85,26 @@ def _get_sdk_client() -> OpenAI:
 # --------------------------------------------------------------------------- #
 #  Asynchronous one-time helper                                              #
 # --------------------------------------------------------------------------- #
-@lru_cache(maxsize=1)
-def _get_async_sdk_client() -> AsyncOpenAI:
+@lru_cache(maxsize=None)
+def _get_async_sdk_client(
+    base_url: str | None = None,
+    http_client: httpx.AsyncClient | None = None,
+    api_key_env: str | None = None,
+) -> AsyncOpenAI:
     """
     Return a cached asynchronous OpenAI SDK client.
 
     Loads environment variables from a .env file if present. Raises a RuntimeError if
-    the API key is missing.
+    the API key is missing. One client is cached per argument combination.
+
+    Parameters
+    ----------
+    base_url : str, optional
+        API base URL override (e.g. a local stub server). None keeps the SDK default.
+    http_client : httpx.AsyncClient, optional
+        Pre-configured transport (see `http_pool`). None keeps the SDK default.
+    api_key_env : str, optional
+        Environment variable holding the API key. None means ``OPENAI_API_KEY``.
 
     Returns
     -------
@@ -71,7 +118,9 @@ def _get_async_sdk_client() -> AsyncOpenAI:
     load_dotenv(find_dotenv(usecwd=True), override=False)
 
     try:
-        return AsyncOpenAI()
+        return AsyncOpenAI(
+            base_url=base_url, http_client=http_client, api_key=_api_key(api_key_env)
+        )
     except OpenAIError as err:
         raise RuntimeError(
             "OpenAI API key not found. Set OPENAI_API_KEY or add it to a .env file "
@@ -94,7 +143,16 @@ class OpenAIClientAdapter:
     method to send requests and retrieve responses in a structured format.
     """
 
-    def __init__(self, *, style: DocStyle, model: str = "gpt-4.1") -> None:
+    def __init__(
+        self,
+        *,
+        style: DocStyle,
+        model: str = "gpt-4.1",
+        base_url: str | None = None,
+        pool: PoolConfig | None = None,
+        instructions: str | None = None,
+        api_key_env: str | None = None,
+    ) -> None:
         """
         Initialize the OpenAIClientAdapter with a documentation style and model.
 
@@ -104,11 +162,29 @@ class OpenAIClientAdapter:
             The documentation style to use for requests.
         model : str, optional
             The OpenAI model to use (default is 'gpt-4.1').
+        base_url : str, optional
+            API base URL override, e.g. a local stub server (default is None).
+        pool : PoolConfig, optional
+            Connection-pool settings for threaded use; None keeps the SDK default.
+        instructions : str, optional
+            Static prompt prefix, e.g. from `PromptBuilder.instructions`. None falls
+            back to the style's template.
+        api_key_env : str, optional
+            Environment variable holding the API key (default ``OPENAI_API_KEY``).
         """
         self._style = style
-        self._dev_prompt = _PROMPTS.get(style.name)
+        # Sent first and byte-identical on every request, so the provider can
+        # serve it from its prompt cache.
+        self._dev_prompt = (
+            instructions if instructions is not None else _PROMPTS.get(style.name)
+        )
+        self._usage = TokenUsage()
         self._model = model
-        self._client = _get_sdk_client()
+        http_client = get_http_client(pool) if pool else None
+        self._pool_stats = getattr(http_client, "pool_stats", None)
+        self._client = _get_sdk_client(
+            base_url=base_url, http_client=http_client, api_key_env=api_key_env
+        )
 
     def request(self, prompt: str) -> dict[str, Any]:
         """
@@ -138,6 +214,7 @@ class OpenAIClientAdapter:
             },
             temperature=0,
         )
+        self._usage.record(getattr(response, "usage", None))
         return json.loads(response.output_text)
 
     @property
@@ -152,6 +229,18 @@ class OpenAIClientAdapter:
         """
         return self._style
 
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return run statistics for the report, keyed by section name.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            ``"Token usage"`` once responses arrived, plus ``"HTTP pool"`` when a
+            pool is configured.
+        """
+        return _report(self._usage, self._pool_stats)
+
 
 # --------------------------------------------------------------------------- #
 #  Async Adapter                                                              #
@@ -163,7 +252,16 @@ class AsyncOpenAIClientAdapter:
     Provides an async method to send requests and retrieve responses concurrently.
     """
 
-    def __init__(self, *, style: DocStyle, model: str = "gpt-4.1") -> None:
+    def __init__(
+        self,
+        *,
+        style: DocStyle,
+        model: str = "gpt-4.1",
+        base_url: str | None = None,
+        pool: PoolConfig | None = None,
+        instructions: str | None = None,
+        api_key_env: str | None = None,
+    ) -> None:
         """
         Initialize the AsyncOpenAIClientAdapter with a documentation style and model.
 
@@ -173,11 +271,29 @@ class AsyncOpenAIClientAdapter:
             The documentation style to use for requests.
         model : str, optional
             The OpenAI model to use (default is 'gpt-4.1').
+        base_url : str, optional
+            API base URL override, e.g. a local stub server (default is None).
+        pool : PoolConfig, optional
+            Connection-pool settings; None keeps the SDK's default transport.
+        instructions : str, optional
+            Static prompt prefix, e.g. from `PromptBuilder.instructions`. None falls
+            back to the style's template.
+        api_key_env : str, optional
+            Environment variable holding the API key (default ``OPENAI_API_KEY``).
         """
         self._style = style
-        self._dev_prompt = _PROMPTS.get(style.name)
+        # Sent first and byte-identical on every request, so the provider can
+        # serve it from its prompt cache.
+        self._dev_prompt = (
+            instructions if instructions is not None else _PROMPTS.get(style.name)
+        )
+        self._usage = TokenUsage()
         self._model = model
-        self._client = _get_async_sdk_client()
+        http_client = get_async_http_client(pool) if pool else None
+        self._pool_stats = getattr(http_client, "pool_stats", None)
+        self._client = _get_async_sdk_client(
+            base_url=base_url, http_client=http_client, api_key_env=api_key_env
+        )
 
     async def request(self, prompt: str) -> dict[str, Any]:
         """
@@ -207,8 +323,54 @@ class AsyncOpenAIClientAdapter:
             },
             temperature=0,
         )
+        self._usage.record(getattr(response, "usage", None))
         return json.loads(response.output_text)
 
+    async def request_stream(
+        self, prompt: str, on_item: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """
+        Stream the response and report each edit object as soon as it is complete.
+
+        The structured output is parsed incrementally, so `on_item` fires per
+        function or class edit while the rest of the response is still generating.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt to send to the OpenAI API.
+        on_item : Callable[[str, dict[str, Any]], None]
+            Called with ``(array_key, edit)``, e.g. ``("function_edits", {...})``.
+
+        Returns
+        -------
+        dict[str, Any]
+            The full parsed JSON response, identical to what `request` returns.
+        """
+        stream = await self._client.responses.create(
+            model=self._model,
+            instructions=self._dev_prompt,
+            input=[{"role": "user", "content": prompt}],
+            text={
+                "format": {
+                    "type": "json_schema",
+                    "name": "code_documentation_edits",
+                    "schema": _RAW_SCHEMA,
+                    "strict": True,
+                }
+            },
+            temperature=0,
+            stream=True,
+        )
+        parser = EditStreamParser()
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                for key, item in parser.feed(event.delta):
+                    on_item(key, item)
+            elif event.type == "response.completed":
+                self._usage.record(event.response.usage)
+        return parser.result()
+
     @property
     def style(self) -> DocStyle:  # keep parity with sync adapter
         """
@@ -220,3 +382,23 @@ class AsyncOpenAIClientAdapter:
             The documentation style used by this client.
         """
         return self._style
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return run statistics for the report, keyed by section name.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            ``"Token usage"`` once responses arrived, plus ``"HTTP pool"`` when a
+            pool is configured.
+        """
+        return _report(self._usage, self._pool_stats)
+
+
+def _report(usage: TokenUsage, pool_stats: Any) -> dict[str, dict[str, Any]]:
+    """Assemble the adapters' `stats()` sections, skipping empty ones."""
+    sections = {"Token usage": usage.snapshot()}
+    if pool_stats is not None:
+        sections["HTTP pool"] = pool_stats.snapshot()
+    return {title: values for title, values in sections.items() if values}
@@ -1,7 +1,13 @@
+import errno
+import json
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+from lovethedocs.gateways.backup_store import BackupRun, BackupStore
 from lovethedocs.ports import FileSystemPort
 
 IGNORED_DIRS = [
@@ -35,6 +41,36 @@ IGNORED_DIRS = [
     ".lovethedocs",
 ]
 
+# Threads for bulk file I/O; enough to hide network-filesystem latency without
+# exhausting file descriptors.
+IO_WORKERS = 8
+
+# When written files are flushed to disk: never, after every file, or on `sync()`.
+FSYNC_POLICIES = ("none", "file", "batch")
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush one file's data to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a directory entry (a rename); a no-op where that is unsupported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # e.g. directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
 class ProjectFileSystem(FileSystemPort):
     """
@@ -44,7 +80,7 @@ class ProjectFileSystem(FileSystemPort):
     project, while ignoring specified directories.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, *, fsync: str = "batch"):
         """
         Initialize the ProjectFileSystem with the given project root directory.
 
@@ -52,11 +88,35 @@ class ProjectFileSystem(FileSystemPort):
         ----------
         project_root : Path
             The root directory of the project.
+        fsync : str, optional
+            When writes are flushed to disk: ``"none"`` leaves it to the OS,
+            ``"file"`` syncs every file as it is written and ``"batch"`` syncs
+            everything written so far when `sync` is called. Writes are atomic
+            under every policy.
+
+        Raises
+        ------
+        ValueError
+            If `fsync` is not one of `FSYNC_POLICIES`.
         """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync policy {fsync!r}; "
+                f"expected one of {', '.join(FSYNC_POLICIES)}."
+            )
+        self.fsync = fsync
         self.root = project_root.resolve()
         self.ltd_root = self.root / ".lovethedocs"
         self.staged_root = self.ltd_root / "staged"
         self.backup_root = self.ltd_root / "backups"
+        self.backups = BackupStore(self.backup_root)
+        self._run: Optional[BackupRun] = None  # started on the first apply
+        self.pending_file = self.ltd_root / "pending.json"
+        self.index_file = self.ltd_root / "staged_index.json"
+        self._index_updates: Dict[str, Dict[str, Any]] = {}
+        self._created_dirs: set[Path] = set()
+        self._unsynced: set[Path] = set()
+        self._lock = threading.Lock()
 
     # ---------- internal guard ------------------------------------------- #
     def _ensure_relative(self, rel_path: Path) -> None:
@@ -84,37 +144,178 @@ class ProjectFileSystem(FileSystemPort):
         """
         Load all Python modules in the project, excluding an ignored set.
 
+        Files are read on up to `IO_WORKERS` threads, so slow disks and network
+        filesystems are not paid for one file at a time.
+
         Returns
         -------
         Dict[Path, str]
             Mapping of relative file paths to their contents.
         """
-        modules: Dict[Path, str] = {}
-        for file in self.root.rglob("*.py"):
-            if any(part in IGNORED_DIRS for part in file.parts):
-                continue
-            if file.name in {"__init__.py", "__main__.py"}:
-                continue
-            rel = file.relative_to(self.root)
-            modules[rel] = file.read_text(encoding="utf-8")
-        return modules
+        paths = self.module_paths()
+        if len(paths) < 2:
+            return {rel: self.read_module(rel) for rel in paths}
+        with ThreadPoolExecutor(min(IO_WORKERS, len(paths))) as pool:
+            return dict(zip(paths, pool.map(self.read_module, paths)))
+
+    def module_paths(self) -> List[Path]:
+        """
+        List the relative paths `load_modules` would read, without reading them.
+
+        Returns
+        -------
+        List[Path]
+            Relative paths of the project's Python modules.
+        """
+        return [
+            file.relative_to(self.root)
+            for file in self.root.rglob("*.py")
+            if self.is_module(file)
+        ]
+
+    def is_module(self, path: Path) -> bool:
+        """
+        Return True if `path` is a module `load_modules` would read.
+
+        Parameters
+        ----------
+        path : Path
+            Absolute path, or path relative to the project root.
+
+        Returns
+        -------
+        bool
+            False for non-Python files, package markers and anything in
+            `IGNORED_DIRS`.
+        """
+        if path.suffix != ".py" or path.name in {"__init__.py", "__main__.py"}:
+            return False
+        return not any(part in IGNORED_DIRS for part in path.parts)
+
+    def read_module(self, rel_path: Path) -> str:
+        """
+        Read one module's source.
+
+        Parameters
+        ----------
+        rel_path : Path
+            Relative path of the module.
+
+        Returns
+        -------
+        str
+            The file contents.
+        """
+        self._ensure_relative(rel_path)
+        return self.original_path(rel_path).read_text(encoding="utf-8")
+
+    def read_pending(self) -> List[Path]:
+        """
+        Return the modules an interrupted run left for ``update --resume``.
+
+        Returns
+        -------
+        List[Path]
+            Relative paths, or an empty list if nothing is pending.
+        """
+        if not self.pending_file.exists():
+            return []
+        return [Path(p) for p in json.loads(self.pending_file.read_text("utf-8"))]
+
+    def read_index(self, *, current: bool = True) -> Dict[Path, Dict[str, Any]]:
+        """
+        Return the recorded statistics of staged files.
+
+        Parameters
+        ----------
+        current : bool, optional
+            If True (default), leave out entries whose original or staged file
+            changed since they were recorded, including files applied or unstaged
+            since. Only file metadata is checked; no file is read. If False, return
+            the last entry recorded for every path.
+
+        Returns
+        -------
+        Dict[Path, Dict[str, Any]]
+            Relative path to the entry given to `stage_file` or `update_index`.
+        """
+        entries = {}
+        for name, entry in self._load_index().items():
+            rel_path = Path(name)
+            stamp = entry.pop("stamp", None)
+            if not current or (stamp is not None and stamp == self._stamp(rel_path)):
+                entries[rel_path] = entry
+        return entries
 
     # ---------------------- write ----------------------------------------- #
-    def stage_file(self, rel_path: Path, code: str) -> None:
+    def stage_file(
+        self, rel_path: Path, code: str, *, stats: Optional[Mapping[str, Any]] = None
+    ) -> None:
         """
         Write code to the staged area for the given relative path.
 
+        The file is written to a temporary name and renamed into place, so a crash
+        never leaves a truncated staged file. Safe to call from several threads.
+
         Parameters
         ----------
         rel_path : Path
             Relative path of the file to stage.
         code : str
             File contents to write.
+        stats : Mapping[str, Any], optional
+            JSON-serializable facts about the edit to keep in the staged index; it is
+            written on the next `sync`.
         """
         self._ensure_relative(rel_path)
         dest = self.staged_path(rel_path)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(code, encoding="utf-8")
+        self._ensure_dir(dest.parent)
+        self._write_atomic(dest, code)
+        if stats is not None:
+            self._queue_index(rel_path, stats)
+
+    def update_index(self, entries: Mapping[Path, Mapping[str, Any]]) -> None:
+        """
+        Record statistics for already staged files and write the index.
+
+        Parameters
+        ----------
+        entries : Mapping[Path, Mapping[str, Any]]
+            Relative path to JSON-serializable facts about its staged edit.
+        """
+        for rel_path, stats in entries.items():
+            self._ensure_relative(rel_path)
+            self._queue_index(rel_path, stats)
+        self._flush_index()
+
+    def update_pending(
+        self, finished: Iterable[Path], unfinished: Iterable[Path]
+    ) -> List[Path]:
+        """
+        Drop `finished` modules from the pending list and add `unfinished` ones.
+
+        Parameters
+        ----------
+        finished : Iterable[Path]
+            Relative paths this run got a final result for, successful or not.
+        unfinished : Iterable[Path]
+            Relative paths this run had to abandon.
+
+        Returns
+        -------
+        List[Path]
+            The pending list as written; the file is removed when it is empty.
+        """
+        pending = set(self.read_pending()).difference(finished).union(unfinished)
+        if not pending:
+            self.pending_file.unlink(missing_ok=True)
+            return []
+        ordered = sorted(pending)
+        self._ensure_dir(self.ltd_root)
+        self._write_atomic(
+            self.pending_file, json.dumps([p.as_posix() for p in ordered], indent=2)
+        )
+        return ordered
 
     def apply_stage(self, rel_path: Path) -> None:
         """
@@ -131,16 +332,239 @@ class ProjectFileSystem(FileSystemPort):
             If the staged file does not exist.
         """
         self._ensure_relative(rel_path)
-        orig = self.original_path(rel_path)
         staged = self.staged_path(rel_path)
-
         if not staged.exists():
             raise FileNotFoundError(staged)
 
-        self.backup_path(rel_path).parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(orig, self.backup_path(rel_path))
-        shutil.copy2(staged, orig)
-        self.delete_staged(rel_path)
+        self._replace_with_staged(rel_path)
+        self._save_run()
+        self._prune_parents(staged)
+        if self.fsync == "batch":
+            self.sync()
+
+    def apply_all(self, rel_paths: Iterable[Path]) -> List[Path]:
+        """
+        Apply many staged files, pruning the staged tree once at the end.
+
+        Every path is checked before anything is touched, so a missing staged file
+        leaves the project unchanged.
+
+        Parameters
+        ----------
+        rel_paths : Iterable[Path]
+            Relative paths of the files to apply.
+
+        Returns
+        -------
+        List[Path]
+            The paths applied, in order.
+
+        Raises
+        ------
+        FileNotFoundError
+            If any of the staged files does not exist.
+        """
+        rel_paths = list(rel_paths)
+        for rel_path in rel_paths:
+            self._ensure_relative(rel_path)
+            if not self.staged_path(rel_path).exists():
+                raise FileNotFoundError(self.staged_path(rel_path))
+
+        try:
+            for rel_path in rel_paths:
+                self._replace_with_staged(rel_path)
+        finally:
+            self._save_run()
+        self._prune_staged()
+        if self.fsync == "batch":
+            self.sync()
+        return rel_paths
+
+    def restore(self, run_id: str) -> List[Path]:
+        """
+        Put back the originals a backup run saved.
+
+        The current contents are themselves backed up first, in this session's run,
+        so a restore can be undone with another restore.
+
+        Parameters
+        ----------
+        run_id : str
+            Identifier of the run, as listed by `BackupStore.runs`.
+
+        Returns
+        -------
+        List[Path]
+            Relative paths restored.
+
+        Raises
+        ------
+        ValueError
+            If no run is called `run_id`.
+        """
+        try:
+            run = self.backups.load_run(run_id)
+        except KeyError:
+            raise ValueError(f"No backup run {run_id!r} in {self.backup_root}.")
+
+        restored = []
+        try:
+            for rel_path, digest in sorted(run.files.items()):
+                orig = self.original_path(rel_path)
+                if orig.exists():
+                    self._back_up(rel_path)
+                self._ensure_dir(orig.parent)
+                tmp = orig.with_name(f".{orig.name}.{os.getpid()}.restore.tmp")
+                # Copy, never link: the blob must not change if the file is edited.
+                shutil.copy2(self.backups.blob_path(digest), tmp)
+                if self.fsync == "file":
+                    _fsync_file(tmp)
+                os.replace(tmp, orig)
+                self._written(orig)
+                restored.append(rel_path)
+        finally:
+            self._save_run()
+        if self.fsync == "batch":
+            self.sync()
+        return restored
+
+    def sync(self) -> None:
+        """
+        Write the staged index, then flush everything written since the last call.
+
+        Only the ``"batch"`` policy defers fsyncs to this call; under the other
+        policies only the index is written.
+        """
+        self._flush_index()
+        with self._lock:
+            paths, self._unsynced = self._unsynced, set()
+        for path in paths:
+            try:
+                _fsync_file(path)
+            except FileNotFoundError:  # applied or deleted since it was written
+                continue
+        for directory in {path.parent for path in paths}:
+            _fsync_dir(directory)
+
+    # ---------------------- staged index internals ------------------------ #
+    def _stamp(self, rel_path: Path) -> Optional[List[int]]:
+        """Modification time and size of the original and staged file, or None."""
+        try:
+            orig = self.original_path(rel_path).stat()
+            staged = self.staged_path(rel_path).stat()
+        except FileNotFoundError:
+            return None
+        return [orig.st_mtime_ns, orig.st_size, staged.st_mtime_ns, staged.st_size]
+
+    def _queue_index(self, rel_path: Path, stats: Mapping[str, Any]) -> None:
+        entry = {**stats, "stamp": self._stamp(rel_path)}
+        with self._lock:
+            self._index_updates[rel_path.as_posix()] = entry
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_file.exists():
+            return {}
+        return json.loads(self.index_file.read_text("utf-8"))
+
+    def _flush_index(self) -> None:
+        """Merge queued entries into the index."""
+        with self._lock:
+            updates, self._index_updates = self._index_updates, {}
+        if not updates:
+            return
+        merged = self._load_index()
+        merged.update(updates)
+        merged = dict(sorted(merged.items()))
+        self._ensure_dir(self.ltd_root)
+        self._write_atomic(self.index_file, json.dumps(merged, separators=(",", ":")))
+
+    # ---------------------- write internals -------------------------------- #
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create `directory` and its parents, once per instance."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _write_atomic(self, dest: Path, text: str) -> None:
+        """
+        Write `text` to a temporary sibling of `dest`, then rename it over.
+
+        If the directory is gone, e.g. pruned by another instance applying the last
+        staged file in it, it is created again and the write retried once.
+        """
+        try:
+            self._replace_with_text(dest, text)
+        except FileNotFoundError:
+            self._created_dirs.discard(dest.parent)
+            self._ensure_dir(dest.parent)
+            self._replace_with_text(dest, text)
+        self._written(dest)
+
+    def _replace_with_text(self, dest: Path, text: str) -> None:
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(text)
+                if self.fsync == "file":
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def _written(self, path: Path) -> None:
+        """Apply the fsync policy to a file that was just written or renamed."""
+        if self.fsync == "file":
+            _fsync_dir(path.parent)
+        elif self.fsync == "batch":
+            with self._lock:
+                self._unsynced.add(path)
+
+    def _replace_with_staged(self, rel_path: Path) -> None:
+        """Back up the original, then rename the staged file over it."""
+        orig = self.original_path(rel_path)
+        staged = self.staged_path(rel_path)
+        self._back_up(rel_path)
+        shutil.copymode(orig, staged)  # keep the original's permissions
+        try:
+            os.replace(staged, orig)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            # .lovethedocs lives on another filesystem; fall back to a copy. The
+            # original may be hardlinked into the backup store, so give the new
+            # content a new inode instead of writing through it.
+            orig.unlink()
+            shutil.copy2(staged, orig)
+            staged.unlink()
+        if self.fsync == "file":
+            _fsync_file(orig)
+        self._written(orig)
+
+    def _back_up(self, rel_path: Path) -> None:
+        """Add the original to this session's backup run (first version wins)."""
+        digest = self.backups.put(self.original_path(rel_path))
+        with self._lock:
+            if self._run is None:
+                self._run = self.backups.new_run()
+            self._run.files.setdefault(rel_path, digest)
+
+    def _save_run(self) -> None:
+        """Write this session's backup index, if anything was backed up."""
+        if self._run is not None:
+            self.backups.write_run(self._run)
+
+    def _prune_staged(self) -> None:
+        """Remove every empty directory under the staged root in one sweep."""
+        if not self.staged_root.exists():
+            return
+        for dirpath, _, _ in os.walk(self.staged_root, topdown=False):
+            try:
+                os.rmdir(dirpath)
+            except OSError:  # not empty
+                continue
+            self._created_dirs.discard(Path(dirpath))
 
     # ---------------------- helpers --------------------------------------- #
     def original_path(self, rel_path: Path) -> Path:
@@ -177,7 +601,10 @@ class ProjectFileSystem(FileSystemPort):
 
     def backup_path(self, rel_path: Path) -> Path:
         """
-        Return the absolute path to the backup file for the given relative path.
+        Return the absolute path to the newest backup of the given relative path.
+
+        Backups live in the content-addressed store; paths backed up before it
+        existed resolve to their old per-path location.
 
         Parameters
         ----------
@@ -187,9 +614,11 @@ class ProjectFileSystem(FileSystemPort):
         Returns
         -------
         Path
-            Absolute path to the backup file.
+            Absolute path to the backup file. Treat it as read-only: identical
+            contents share one file.
         """
-        return self.backup_root / rel_path
+        latest = self.backups.latest(rel_path)
+        return latest if latest is not None else self.backup_root / rel_path
 
     # ---------- clean up ---------------------------------------------- #
     def delete_staged(self, rel_path: Path) -> None:
@@ -208,11 +637,16 @@ class ProjectFileSystem(FileSystemPort):
             return
 
         staged.unlink()  # remove the file
+        self._prune_parents(staged)
 
+    def _prune_parents(self, staged: Path) -> None:
+        """Remove the now-empty directories above `staged`, up to the staged root."""
         cur = staged.parent
         while cur != self.staged_root and not any(cur.iterdir()):
             cur.rmdir()
+            self._created_dirs.discard(cur)
             cur = cur.parent  # walk upward
 
         if not any(self.staged_root.iterdir()):
             self.staged_root.rmdir()
+            self._created_dirs.discard(self.staged_root)
@@ -1,18 +1,16 @@
 """
-Loads the JSON schema that defines the model's response format and exposes a reusable
-jsonschema.Validator instance.
+Loads the JSON schema that defines the model's response format.
+
+`edit_validator` compiles it into the validator used at runtime; the OpenAI client
+sends it as the structured-output format.
 """
 
 import json
 from pathlib import Path
 
-from jsonschema import Draft202012Validator
-
 _SCHEMAPATH = Path(__file__).with_name("lovethedocs_schema.json")
 
 with _SCHEMAPATH.open("r") as fp:
     _RAW_SCHEMA = json.load(fp)
 
-VALIDATOR = Draft202012Validator(_RAW_SCHEMA)
-
-__all__ = ["_RAW_SCHEMA", "VALIDATOR"]
+__all__ = ["_RAW_SCHEMA"]
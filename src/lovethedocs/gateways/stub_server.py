@@ -0,0 +1,463 @@
+"""
+Local stand-in for the OpenAI Responses endpoint, used to load-test the pipeline.
+
+Implements just enough of ``POST /v1/responses`` for `OpenAIClientAdapter` and
+`AsyncOpenAIClientAdapter`: the reply is a schema-valid `code_documentation_edits`
+object built from the objects listed in the user prompt, sent whole or as
+server-sent events when the request asks to ``stream``. Latency, injected 429/500
+errors and ``Retry-After`` headers are configurable so concurrency, rate limiting and
+SDK retries can be exercised without a real account.
+
+Run it with::
+
+    python -m lovethedocs.gateways.stub_server --latency lognormal:0.8,0.5 --p429 0.05
+
+then point lovethedocs at it (any non-empty key works)::
+
+    OPENAI_API_KEY=stub lovethedocs update --base-url http://127.0.0.1:8765/v1 -c 64 src/
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+import typer
+
+_DELTA_SIZE = 64  # characters per streamed text delta
+# OpenAI caches prompt prefixes of at least 1024 tokens, in 128-token increments.
+_CACHE_MIN_TOKENS = 1024
+_CACHE_STEP_TOKENS = 128
+
+
+# --------------------------------------------------------------------------- #
+#  Configuration                                                              #
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class LatencyModel:
+    """
+    Distribution used to delay every response.
+
+    Attributes
+    ----------
+    kind : str
+        One of 'none', 'fixed', 'uniform' or 'lognormal'.
+    params : tuple[float, ...]
+        Distribution parameters in seconds: ``fixed:s``, ``uniform:lo,hi`` or
+        ``lognormal:median,sigma``.
+    """
+
+    kind: str = "none"
+    params: tuple[float, ...] = ()
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Build a LatencyModel from a spec such as ``'uniform:0.1,0.5'``.
+
+        Raises
+        ------
+        ValueError
+            If the kind is unknown or the number of parameters is wrong.
+        """
+        kind, _, raw = spec.partition(":")
+        params = tuple(float(p) for p in raw.split(",") if p.strip())
+        arity = {"none": 0, "fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in arity:
+            raise ValueError(
+                f"Unknown latency kind: {kind} (choose from: [{', '.join(arity)}])"
+            )
+        if len(params) != arity[kind]:
+            raise ValueError(f"Latency '{kind}' expects {arity[kind]} parameter(s).")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Return one delay in seconds."""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        return 0.0
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """
+    Behaviour of the stub server.
+
+    Attributes
+    ----------
+    latency : LatencyModel
+        Delay applied before every response (errors included).
+    p429 : float
+        Probability of answering with ``429 Too Many Requests``.
+    p500 : float
+        Probability of answering with ``500 Internal Server Error``.
+    retry_after : float, optional
+        Value of the ``Retry-After`` header sent with injected errors.
+    seed : int, optional
+        Seed for the random generator, for reproducible runs.
+    """
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    p429: float = 0.0
+    p500: float = 0.0
+    retry_after: Optional[float] = None
+    seed: Optional[int] = None
+
+
+# --------------------------------------------------------------------------- #
+#  Response construction                                                      #
+# --------------------------------------------------------------------------- #
+def _prompt_text(body: dict[str, Any]) -> str:
+    """Return the concatenated text of every input message in a request body."""
+    items = body.get("input", "")
+    if isinstance(items, str):
+        return items
+    parts = []
+    for item in items:
+        content = item.get("content", "")
+        if isinstance(content, str):
+            parts.append(content)
+        else:
+            parts.extend(c.get("text", "") for c in content)
+    return "\n".join(parts)
+
+
+def _listed_objects(prompt: str) -> list[str]:
+    """Return the qualnames listed under the ``### Objects in`` header."""
+    names: list[str] = []
+    in_header = False
+    for line in prompt.splitlines():
+        if line.startswith("### Objects in"):
+            in_header = True
+        elif in_header and line.startswith("  "):
+            names.append(line.strip())
+        elif in_header:
+            break
+    return names
+
+
+def build_edits(prompt: str) -> dict[str, Any]:
+    """
+    Return a schema-valid edit payload that documents every listed object.
+
+    Objects whose last name component is capitalized are treated as classes, and
+    their direct children become method edits. Signatures are left empty so the
+    patcher keeps the original ones.
+
+    Parameters
+    ----------
+    prompt : str
+        The user prompt produced by `PromptBuilder`.
+
+    Returns
+    -------
+    dict[str, Any]
+        A payload matching ``lovethedocs_schema.json``.
+    """
+    names = _listed_objects(prompt)
+    classes = {n for n in names if n.rsplit(".", 1)[-1][:1].isupper()}
+
+    def _fn(qualname: str) -> dict[str, str]:
+        return {
+            "qualname": qualname,
+            "docstring": f"Stub documentation for `{qualname}`.",
+            "signature": "",
+        }
+
+    class_edits = {
+        c: {"qualname": c, "docstring": f"Stub class `{c}`.", "method_edits": []}
+        for c in classes
+    }
+    function_edits = []
+    for name in names:
+        if name in classes:
+            continue
+        parent = name.rpartition(".")[0]
+        if parent in class_edits:
+            class_edits[parent]["method_edits"].append(_fn(name))
+        else:
+            function_edits.append(_fn(name))
+
+    return {"function_edits": function_edits, "class_edits": list(class_edits.values())}
+
+
+def _response_body(
+    model: str, payload: dict[str, Any], prompt: str, cached_tokens: int = 0
+) -> dict:
+    """Wrap `payload` in an object shaped like an OpenAI ``Response``."""
+    text = json.dumps(payload)
+    input_tokens = max(1, len(prompt) // 4)
+    output_tokens = max(1, len(text) // 4)
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": input_tokens,
+            "input_tokens_details": {"cached_tokens": cached_tokens},
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
+
+
+# --------------------------------------------------------------------------- #
+#  HTTP server                                                                #
+# --------------------------------------------------------------------------- #
+class StubServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering ``POST .../responses`` like the OpenAI API.
+
+    Each request runs in its own thread, so simulated latency overlaps the way it
+    would against the real service. Counters in `stats` track what was served.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, config: StubConfig, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Bind the server without starting it.
+
+        Parameters
+        ----------
+        config : StubConfig
+            Latency and error-injection settings.
+        host : str, optional
+            Interface to bind (default is '127.0.0.1').
+        port : int, optional
+            Port to bind; 0 picks a free one (default is 0).
+        """
+        super().__init__((host, port), _Handler)
+        self.config = config
+        self.stats = {"requests": 0, "ok": 0, "429": 0, "500": 0}
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._seen_prefixes: set[int] = set()
+
+    @property
+    def base_url(self) -> str:
+        """The ``/v1`` base URL to hand to the OpenAI SDK."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def roll(self) -> tuple[float, Optional[int]]:
+        """Return ``(delay, error_status)`` for the next request, thread-safely."""
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.config.latency.sample(self._rng)
+            draw = self._rng.random()
+            if draw < self.config.p429:
+                status = 429
+            elif draw < self.config.p429 + self.config.p500:
+                status = 500
+            else:
+                status = None
+            self.stats[str(status) if status else "ok"] += 1
+        return delay, status
+
+    def cached_tokens(self, prefix: str) -> int:
+        """
+        Return the prompt-cache hit for `prefix`, mimicking the provider.
+
+        The first request with a given prefix is a miss; later ones hit for the
+        prefix rounded down to 128 tokens, provided it reaches 1024 tokens. Tokens
+        are estimated as four characters each.
+        """
+        tokens = len(prefix) // 4
+        with self._lock:
+            seen = hash(prefix) in self._seen_prefixes
+            self._seen_prefixes.add(hash(prefix))
+        if not seen or tokens < _CACHE_MIN_TOKENS:
+            return 0
+        return tokens // _CACHE_STEP_TOKENS * _CACHE_STEP_TOKENS
+
+    # ---- background helpers -------------------------------------------- #
+    def start(self) -> "StubServer":
+        """Serve requests from a daemon thread and return self."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler bound to a `StubServer`."""
+
+    server: StubServer
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.rstrip("/").endswith("/responses"):
+            self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        delay, status = self.server.roll()
+        if status is not None or not body.get("stream"):
+            time.sleep(delay)
+
+        if status is not None:
+            kind = "rate_limit_exceeded" if status == 429 else "server_error"
+            headers = {}
+            if self.server.config.retry_after is not None:
+                headers["Retry-After"] = f"{self.server.config.retry_after:g}"
+            self._send(
+                status,
+                {"error": {"message": f"Injected {status}", "type": kind}},
+                headers,
+            )
+            return
+
+        instructions = body.get("instructions") or ""
+        prompt = _prompt_text(body)
+        payload = build_edits(prompt)
+        response = _response_body(
+            body.get("model", "stub"),
+            payload,
+            instructions + prompt,
+            self.server.cached_tokens(instructions),
+        )
+        if body.get("stream"):
+            self._send_stream(response, delay)
+        else:
+            self._send(200, response)
+
+    def _send_stream(self, response: dict, delay: float) -> None:
+        """
+        Replay `response` as server-sent events using chunked transfer encoding.
+
+        Half of `delay` passes before the first event (time to first token); the
+        rest is spread evenly across the text deltas.
+        """
+        text = response["output"][0]["content"][0]["text"]
+        deltas = [text[i : i + _DELTA_SIZE] for i in range(0, len(text), _DELTA_SIZE)]
+        item_id = response["output"][0]["id"]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        time.sleep(delay / 2)
+        self._send_event(
+            {"type": "response.created", "response": {**response, "output": []}}
+        )
+        for delta in deltas:
+            time.sleep(delay / 2 / len(deltas))
+            self._send_event(
+                {
+                    "type": "response.output_text.delta",
+                    "item_id": item_id,
+                    "output_index": 0,
+                    "content_index": 0,
+                    "delta": delta,
+                }
+            )
+        self._send_event({"type": "response.completed", "response": response})
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_event(self, event: dict) -> None:
+        data = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send(
+        self, status: int, body: dict, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_args) -> None:  # keep load tests quiet
+        pass
+
+
+# --------------------------------------------------------------------------- #
+#  CLI                                                                        #
+# --------------------------------------------------------------------------- #
+def main(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind."),
+    port: int = typer.Option(8765, help="Port to bind."),
+    latency: str = typer.Option(
+        "none", help="none | fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA"
+    ),
+    p429: float = typer.Option(0.0, help="Probability of a 429 response."),
+    p500: float = typer.Option(0.0, help="Probability of a 500 response."),
+    retry_after: Optional[float] = typer.Option(
+        None, help="Retry-After header (seconds) sent with injected errors."
+    ),
+    seed: Optional[int] = typer.Option(None, help="Random seed."),
+) -> None:
+    """Serve a stand-in OpenAI Responses endpoint until interrupted."""
+    try:
+        model = LatencyModel.parse(latency)
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+    config = StubConfig(
+        latency=model, p429=p429, p500=p500, retry_after=retry_after, seed=seed
+    )
+    server = StubServer(config, host, port)
+    typer.echo(f"Stub OpenAI server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        typer.echo(f"Served: {server.stats}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,59 @@
+"""
+Token accounting for the run report, including provider-side prompt-cache hits.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+class TokenUsage:
+    """
+    Thread-safe totals of the ``usage`` block returned with each response.
+
+    `cached input tokens` counts prompt tokens served from OpenAI's prefix cache;
+    its share of all input tokens is the figure to watch when tuning the prompt
+    layout.
+    """
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, usage: Any) -> None:
+        """
+        Add one response's usage. Missing fields (or a missing block) count as 0.
+
+        Parameters
+        ----------
+        usage : openai.types.responses.ResponseUsage | None
+            The ``response.usage`` object.
+        """
+        if usage is None:
+            return
+        details = getattr(usage, "input_tokens_details", None)
+        with self._lock:
+            self.responses += 1
+            self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+            self.cached_tokens += getattr(details, "cached_tokens", 0) or 0
+            self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the totals as a plain dict for reporting; empty before any use."""
+        with self._lock:
+            if not self.responses:
+                return {}
+            hit_rate = (
+                self.cached_tokens / self.input_tokens if self.input_tokens else 0
+            )
+            return {
+                "responses": self.responses,
+                "input tokens": self.input_tokens,
+                "cached input tokens": self.cached_tokens,
+                "cache hit rate": f"{hit_rate:.1%}",
+                "output tokens": self.output_tokens,
+            }
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Iterable, Mapping, Optional, Protocol
 
 
 class FileSystemPort(Protocol):
@@ -10,10 +10,26 @@ class FileSystemPort(Protocol):
 
     # ----- read ------------------------------------------------------------ #
     def load_modules(self) -> dict[Path, str]: ...
+    def module_paths(self) -> list[Path]: ...
+    def read_module(self, rel_path: Path) -> str: ...
+    def read_pending(self) -> list[Path]: ...
+    def read_index(self, *, current: bool = True) -> dict[Path, dict[str, Any]]: ...
 
     # ----- write ----------------------------------------------------------- #
-    def stage_file(self, rel_path: Path, code: str) -> None:
-        # writes to <root>/_improved/…
+    def stage_file(
+        self, rel_path: Path, code: str, *, stats: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        # writes to <root>/_improved/…; `stats` goes to the staged index
+        ...
+
+    def update_index(self, entries: Mapping[Path, Mapping[str, Any]]) -> None:
+        # records diff statistics in <root>/.lovethedocs/staged_index.json
+        ...
+
+    def update_pending(
+        self, finished: Iterable[Path], unfinished: Iterable[Path]
+    ) -> list[Path]:
+        # rewrites <root>/.lovethedocs/pending.json for `update --resume`
         ...
 
     def apply_stage(self, rel_path: Path) -> None:
@@ -21,6 +37,18 @@ class FileSystemPort(Protocol):
         # copy staged file over original
         ...
 
+    def apply_all(self, rel_paths: Iterable[Path]) -> list[Path]:
+        # apply_stage for many files, pruning the staged tree once
+        ...
+
+    def restore(self, run_id: str) -> list[Path]:
+        # put back the originals saved by one backup run
+        ...
+
+    def sync(self) -> None:
+        # write the staged index; flush files written so far (fsync policy "batch")
+        ...
+
     # ----- helpers --------------------------------------------------------- #
     def original_path(self, rel_path: Path) -> Path: ...
     def staged_path(self, rel_path: Path) -> Path: ...
@@ -31,3 +59,5 @@ class DiffViewerPort(Protocol):
     """How the UI surfaces a diff. Keeps any editor/tool details out of app code."""
 
     def view(self, original: Path, improved: Path) -> None: ...
+
+    def view_patch(self, patch: Path) -> None: ...
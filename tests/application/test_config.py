@@ -1,6 +1,8 @@
+import json
+
 import pytest
 
-from lovethedocs.application.config import Settings
+from lovethedocs.application.config import BackendConfig, Settings, load_backends
 
 
 def test_settings_default_values():
@@ -22,6 +24,11 @@ def test_settings_immutability():
         settings.model = "different-model"
 
 
+def test_client_settings_drop_per_run_fields():
+    settings = Settings(model="m", files=("a.py",), resume=True, fsync="file")
+    assert settings.client_settings() == Settings(model="m")
+
+
 def test_settings_equality():
     """Test that Settings instances compare correctly."""
     settings1 = Settings(model="model-a")
@@ -31,3 +38,38 @@ def test_settings_equality():
     assert settings1 == settings2
     assert settings1 != settings3
     assert hash(settings1) == hash(settings2)
+
+
+def test_load_backends(tmp_path):
+    path = tmp_path / "backends.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "east", "api_key_env": "KEY_EAST", "rpm": 500},
+                {"name": "west", "base_url": "http://west/v1", "model": "gpt-4.1"},
+            ]
+        )
+    )
+
+    east, west = load_backends(path)
+
+    assert east == BackendConfig("east", api_key_env="KEY_EAST", rpm=500)
+    assert west.base_url == "http://west/v1"
+    hash(Settings(backends=(east, west)))  # still usable as a cache key
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        '{"name": "a"}',
+        '[{"rpm": 1}]',
+        '[{"name": "a", "key": "sk-..."}]',
+        '[{"name": "a"}, {"name": "a"}]',
+    ],
+)
+def test_load_backends_rejects_bad_files(tmp_path, content):
+    path = tmp_path / "backends.json"
+    path.write_text(content)
+    with pytest.raises(ValueError):
+        load_backends(path)
@@ -1,4 +1,6 @@
 import builtins
+import shutil
+import subprocess
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -65,3 +67,87 @@ def test_noninteractive_never_applies(tmp_project, dummy_viewer):
     # no prompt, nothing applied
     assert any(tmp_project.staged_root.rglob("*.py"))
     dummy_viewer.view.assert_called_once()
+
+
+# ---------- bulk review --------------------------------------------------- #
+@pytest.fixture()
+def bulk_project(tmp_path: Path):
+    fs = ProjectFileSystem(tmp_path)
+    for rel, new in {
+        "pkg/a.py": 'def f(x):\n    """Doc."""\n    return x\n',
+        "pkg/b.py": 'def f(x: int):\n    """Doc."""\n    return x\n',
+        "tools/c.py": 'def f(x):\n    """Doc."""\n    return x\n',
+    }.items():
+        (tmp_path / rel).parent.mkdir(exist_ok=True)
+        (tmp_path / rel).write_text("def f(x):\n    return x\n")
+        fs.stage_file(Path(rel), new)
+    return fs
+
+
+def test_bulk_review_applies_all_but_rejected(bulk_project):
+    counts = diff_review.bulk_review(bulk_project, reject_if=["signature-changed"])
+
+    assert counts == (2, 1, 0)
+    assert '"""Doc."""' in (bulk_project.root / "pkg/a.py").read_text()
+    assert "int" not in (bulk_project.root / "pkg/b.py").read_text()
+    assert bulk_project.staged_path(Path("pkg/b.py")).exists()
+
+
+def test_bulk_review_glob(bulk_project):
+    counts = diff_review.bulk_review(bulk_project, accept_globs=["pkg/*"])
+
+    assert counts == (2, 0, 1)
+    assert bulk_project.staged_path(Path("tools/c.py")).exists()
+    assert not bulk_project.staged_path(Path("pkg/b.py")).exists()
+
+
+def test_bulk_review_unknown_rule_changes_nothing(bulk_project):
+    with pytest.raises(ValueError):
+        diff_review.bulk_review(bulk_project, reject_if=["nope"])
+    assert len(list(bulk_project.staged_root.rglob("*.py"))) == 3
+
+
+# ---------- patch export -------------------------------------------------- #
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_export_patch_round_trips_through_git_apply(bulk_project, tmp_path):
+    bulk_project.stage_file(Path("tools/c.py"), "no newline at end")
+    staged = {
+        rel: bulk_project.staged_path(rel).read_text()
+        for rel in map(Path, ["pkg/a.py", "pkg/b.py", "tools/c.py"])
+    }
+    patch = tmp_path / "out.patch"
+
+    assert diff_review.export_patch(bulk_project, patch) == 3
+    assert bulk_project.staged_path(Path("pkg/a.py")).exists()  # nothing applied
+
+    subprocess.run(["git", "apply", str(patch)], cwd=bulk_project.root, check=True)
+    for rel, text in staged.items():
+        assert (bulk_project.root / rel).read_text() == text
+
+
+def test_export_skips_unchanged_files(tmp_project, tmp_path):
+    tmp_project.stage_file(Path("same.py"), "x = 1\n")
+    (tmp_project.root / "same.py").write_text("x = 1\n")
+    patch = tmp_path / "out.patch"
+
+    assert diff_review.export_patch(tmp_project, patch) == 1
+    assert "same.py" not in patch.read_text()
+
+
+# ---------- selecting edits ----------------------------------------------- #
+def test_select_sorts_filters_and_pages(bulk_project):
+    bulk_project.stage_file(Path("pkg/big.py"), '"""Doc."""\n' + "x = 1\n" * 10)
+
+    by_lines = [
+        s.path.as_posix() for s in diff_review.select(bulk_project, sort="lines")
+    ]
+    assert by_lines[0] == "pkg/big.py"
+
+    changed = diff_review.select(bulk_project, where=["signature-changed"])
+    assert [s.path for s in changed] == [Path("pkg/b.py")]
+
+    page = diff_review.select(bulk_project, page=2, page_size=3)
+    assert [s.path.as_posix() for s in page] == ["tools/c.py"]
+
+    with pytest.raises(ValueError):
+        diff_review.select(bulk_project, sort="size")
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+
+from lovethedocs.application import diff_stats
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+ORIGINAL = """\
+def f(x):
+    return x
+
+
+class C:
+    def m(self):
+        pass
+"""
+
+DOCUMENTED = '''\
+"""Module doc."""
+
+
+def f(x):
+    """Return x."""
+    return x
+
+
+class C:
+    def m(self):
+        """Do nothing."""
+        pass
+'''
+
+
+def test_compare_counts_lines_and_docstrings():
+    stats = diff_stats.compare(Path("a.py"), ORIGINAL, DOCUMENTED)
+
+    assert stats.added == 5 and stats.removed == 0
+    assert stats.docstrings_changed == 3  # module, f, C.m
+    assert not stats.signature_changed
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        DOCUMENTED.replace("def f(x):", "def f(x: int):"),
+        DOCUMENTED.replace("def f(x):", "def f(x) -> int:"),
+        DOCUMENTED.replace("def m(self):", "def m(self, y=1):"),
+        "def f(:\n",
+    ],
+)
+def test_compare_flags_signature_changes(new):
+    assert diff_stats.compare(Path("a.py"), ORIGINAL, new).signature_changed
+
+
+def test_parse_rule():
+    big = diff_stats.DiffStats(Path("a.py"), 150, 60, 2, False)
+
+    assert diff_stats.parse_rule("lines>200")(big)
+    assert not diff_stats.parse_rule("lines>210")(big)
+    assert not diff_stats.parse_rule("signature-changed")(big)
+    with pytest.raises(ValueError):
+        diff_stats.parse_rule("bogus")
+
+
+def test_collect_keeps_order(tmp_path):
+    fs = ProjectFileSystem(tmp_path)
+    paths = [Path(f"m{i}.py") for i in range(20)]
+    for i, rel in enumerate(paths):
+        (tmp_path / rel).write_text(ORIGINAL)
+        fs.stage_file(rel, DOCUMENTED if i % 2 else ORIGINAL)
+
+    stats = diff_stats.collect(fs, paths, workers=4)
+
+    assert [s.path for s in stats] == paths
+    assert [s.added for s in stats] == [0, 5] * 10
+
+
+def test_staged_stats_are_served_from_the_index(tmp_path, monkeypatch):
+    fs = ProjectFileSystem(tmp_path)
+    (tmp_path / "a.py").write_text(ORIGINAL)
+    diff_stats.stage(fs, Path("a.py"), ORIGINAL, DOCUMENTED)
+    fs.sync()
+
+    def _no_recompute(*_):
+        raise AssertionError("diff recomputed")
+
+    monkeypatch.setattr(diff_stats, "compare", _no_recompute)
+    [stats] = diff_stats.collect(ProjectFileSystem(tmp_path), [Path("a.py")])
+    assert stats.docstrings_changed == 3 and stats.added == 5
+
+
+def test_stale_or_missing_entries_are_recomputed_and_cached(tmp_path):
+    fs = ProjectFileSystem(tmp_path)
+    (tmp_path / "a.py").write_text(ORIGINAL)
+    (tmp_path / "b.py").write_text(ORIGINAL)
+    diff_stats.stage(fs, Path("a.py"), ORIGINAL, DOCUMENTED)
+    fs.stage_file(Path("b.py"), DOCUMENTED)  # staged without statistics
+    fs.sync()
+    (tmp_path / "a.py").write_text(DOCUMENTED)  # original edited since staging
+
+    assert list(fs.read_index()) == []
+    stats = diff_stats.collect(fs, [Path("a.py"), Path("b.py")])
+
+    assert [s.added for s in stats] == [0, 5]
+    assert sorted(fs.read_index()) == [Path("a.py"), Path("b.py")]
+
+
+def test_changed_modules_skips_files_already_documented(tmp_path):
+    fs = ProjectFileSystem(tmp_path)
+    for name in ("a.py", "b.py", "c.py", "__init__.py"):
+        (tmp_path / name).write_text(ORIGINAL)
+    diff_stats.stage(fs, Path("a.py"), ORIGINAL, DOCUMENTED)  # awaiting review
+    diff_stats.stage(fs, Path("b.py"), ORIGINAL, DOCUMENTED)
+    fs.sync()
+    fs.apply_stage(Path("b.py"))  # accepted: b.py now holds our edit
+
+    files = ["a.py", "b.py", "c.py", "__init__.py", "gone.py"]
+    assert diff_stats.changed_modules(fs, map(Path, files)) == [Path("c.py")]
+
+    (tmp_path / "b.py").write_text(DOCUMENTED + "x = 1\n")  # edited after accepting
+    assert diff_stats.changed_modules(fs, [Path("b.py")]) == [Path("b.py")]
+
+
+def test_compare_counts_replaced_and_unordered_lines():
+    old = "a\nb\nb\nc\n"
+    new = "c\nb\nd\n"
+
+    stats = diff_stats.compare(Path("m.py"), old, new)
+
+    assert (stats.added, stats.removed) == (1, 2)  # +d, -a and one b
@@ -0,0 +1,47 @@
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from lovethedocs.application import diff_stats, profiling
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+ORIGINAL = "def f(x):\n    return x\n"
+DOCUMENTED = 'def f(x):\n    """Return x."""\n    return x\n'
+
+
+def _stage_modules(root: Path, n: int = 20) -> None:
+    fs = ProjectFileSystem(root)
+    for i in range(n):
+        diff_stats.stage(fs, Path(f"m{i}.py"), ORIGINAL * 20, DOCUMENTED * 20)
+    fs.sync()
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown profile mode"):
+        with profiling.profile("wall", tmp_path):
+            pass
+
+
+def test_cpu_profile_saves_stats_and_attributes_stages(tmp_path):
+    out = tmp_path / "profiles"
+    with profiling.profile("cpu", out, top=3):
+        _stage_modules(tmp_path)
+
+    (dump,) = out.glob("*-cpu.prof")
+    times = profiling.stage_times(pstats.Stats(str(dump)))
+    assert set(times) == set(profiling.STAGES)
+    assert times["stage"] > 0
+    assert times["parse"] == 0
+
+
+def test_mem_profile_saves_peak_snapshot(tmp_path):
+    out = tmp_path / "profiles"
+    with profiling.profile("mem", out, top=3):
+        _stage_modules(tmp_path)
+
+    (dump,) = out.glob("*-mem.snapshot")
+    snapshot = tracemalloc.Snapshot.load(str(dump))
+    assert set(profiling.stage_memory(snapshot)) == set(profiling.STAGES)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,63 @@
+"""
+Benchmark: memory held by 100k edits, slotted + interned vs plain dataclasses.
+
+Run with ``pytest -m slow -s tests/benchmarks`` to see the numbers.
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from lovethedocs.domain.models import FunctionEdit
+
+pytestmark = pytest.mark.slow
+
+N_MODULES = 1_000
+EDITS_PER_MODULE = 100
+DOCSTRING = "Return the thing.\n\nParameters\n----------\nx : int\n"
+
+
+@dataclass
+class _PlainFunctionEdit:
+    """The pre-slots layout, kept here as the baseline."""
+
+    qualname: str
+    docstring: Optional[str] = None
+    signature: Optional[str] = None
+
+
+def _build(cls):
+    # Every module repeats the same qualnames, as a codebase-wide run would for
+    # common names (`__init__`, `run`, ...); they arrive as fresh strings each time.
+    return [
+        [
+            cls(qualname=f"Klass{j // 10}.method_{j % 10}", docstring=DOCSTRING)
+            for j in range(EDITS_PER_MODULE)
+        ]
+        for _ in range(N_MODULES)
+    ]
+
+
+def _measure(cls) -> int:
+    tracemalloc.start()
+    try:
+        edits = _build(cls)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del edits
+    return size
+
+
+def test_slotted_edits_use_less_memory():
+    plain = _measure(_PlainFunctionEdit)
+    slotted = _measure(FunctionEdit)
+
+    n = N_MODULES * EDITS_PER_MODULE
+    print(
+        f"\n{n} edits: plain {plain / 2**20:.1f} MiB, "
+        f"slotted+interned {slotted / 2**20:.1f} MiB ({plain / slotted:.1f}x)"
+    )
+    assert slotted < plain / 2
@@ -0,0 +1,74 @@
+"""
+Benchmark: compiled single-pass validation vs jsonschema + hand mapping.
+
+Run with ``pytest -m slow -s tests/benchmarks`` to see the timings.
+"""
+
+import timeit
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from lovethedocs.domain.models import ClassEdit, FunctionEdit, ModuleEdit
+from lovethedocs.gateways.edit_validator import parse_module_edit
+from lovethedocs.gateways.schema_loader import _RAW_SCHEMA
+
+pytestmark = pytest.mark.slow
+
+# The validate-then-map path that parse_module_edit replaced, kept as a baseline.
+_VALIDATOR = Draft202012Validator(_RAW_SCHEMA)
+
+
+def _response(n_classes: int, methods: int) -> dict:
+    """A schema-valid response with `n_classes * (methods + 1)` class-side edits."""
+
+    def fn(name: str) -> dict:
+        return {"qualname": name, "docstring": f"Doc for {name}.", "signature": ""}
+
+    return {
+        "function_edits": [fn(f"func_{i}") for i in range(n_classes)],
+        "class_edits": [
+            {
+                "qualname": f"C{i}",
+                "docstring": "A class.",
+                "method_edits": [fn(f"C{i}.m{j}") for j in range(methods)],
+            }
+            for i in range(n_classes)
+        ],
+    }
+
+
+def _map_json_to_module_edit(raw: dict) -> ModuleEdit:
+    return ModuleEdit(
+        function_edits=[FunctionEdit(**f) for f in raw["function_edits"]],
+        class_edits=[
+            ClassEdit(
+                qualname=c["qualname"],
+                docstring=c["docstring"],
+                method_edits=[FunctionEdit(**m) for m in c["method_edits"]],
+            )
+            for c in raw["class_edits"]
+        ],
+    )
+
+
+def _jsonschema_path(raw: dict):
+    _VALIDATOR.validate(raw)
+    return _map_json_to_module_edit(raw)
+
+
+@pytest.mark.parametrize("n_classes", [20, 100])
+def test_compiled_validation_is_faster(n_classes):
+    raw = _response(n_classes, methods=5)
+    assert parse_module_edit(raw) == _jsonschema_path(raw)
+
+    number = 20
+    old = min(timeit.repeat(lambda: _jsonschema_path(raw), number=number, repeat=3))
+    new = min(timeit.repeat(lambda: parse_module_edit(raw), number=number, repeat=3))
+
+    edits = n_classes * 7
+    print(
+        f"\n{edits} edits: jsonschema+mapper {old / number * 1e3:.2f} ms, "
+        f"compiled {new / number * 1e3:.2f} ms ({old / new:.0f}x)"
+    )
+    assert new < old
@@ -1,3 +1,6 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
@@ -27,6 +30,37 @@ def test_update_triggers_pipeline_and_optional_review(
     mock_review.assert_called_once()
 
 
+@patch("lovethedocs.cli.app.run_pipeline")
+def test_update_files_runs_only_what_needs_documenting(
+    mock_run_pipeline, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "__init__.py").write_text("")
+    mock_run_pipeline.return_value = []
+
+    result = runner.invoke(app, ["update", "--files", "a.py", "__init__.py"])
+
+    assert result.exit_code == 0
+    [paths], kwargs = mock_run_pipeline.call_args
+    assert paths == [tmp_path.resolve()]
+    assert kwargs["settings"].files == ("a.py",)
+
+
+@patch("lovethedocs.cli.app.run_pipeline")
+def test_update_files_exits_early_when_nothing_to_do(
+    mock_run_pipeline, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "__init__.py").write_text("")
+
+    result = runner.invoke(app, ["update", "--files", "__init__.py"])
+
+    assert result.exit_code == 0
+    assert "Nothing to document" in result.output
+    mock_run_pipeline.assert_not_called()
+
+
 @patch("lovethedocs.cli.app.ProjectFileSystem")
 @patch("lovethedocs.cli.app.diff_review.batch_review")
 def test_review_skips_if_no_staged_edits(mock_review, mock_fs_class, tmp_path):
@@ -51,6 +85,64 @@ def test_review_runs_if_staged_edits_exist(mock_review, mock_fs_class, tmp_path)
     mock_review.assert_called_once()
 
 
+@patch("lovethedocs.cli.app.ProjectFileSystem")
+@patch("lovethedocs.cli.app.diff_review.bulk_review")
+@patch("lovethedocs.cli.app.diff_review.batch_review")
+def test_review_accept_all_skips_viewer(mock_batch, mock_bulk, mock_fs_class, tmp_path):
+    mock_fs_class.return_value.staged_root.exists.return_value = True
+
+    result = runner.invoke(
+        app,
+        ["review", "--accept-all", "--reject-if", "signature-changed", str(tmp_path)],
+    )
+
+    assert result.exit_code == 0
+    mock_batch.assert_not_called()
+    mock_bulk.assert_called_once_with(
+        mock_fs_class.return_value,
+        accept_globs=["*"],
+        reject_if=["signature-changed"],
+    )
+
+
+@patch("lovethedocs.cli.app.resolve_viewer")
+@patch("lovethedocs.cli.app.diff_review.export_patch", return_value=2)
+def test_review_export_opens_patch_once(mock_export, mock_resolve, tmp_path):
+    (tmp_path / ".lovethedocs" / "staged").mkdir(parents=True)
+    dest = tmp_path / "docs.patch"
+
+    result = runner.invoke(
+        app, ["review", "--export", str(dest), "--open", "-v", "git", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0
+    assert "Wrote 2 files" in result.output
+    mock_export.assert_called_once()
+    mock_resolve.return_value.view_patch.assert_called_once_with(dest)
+    mock_resolve.return_value.view.assert_not_called()
+
+
+def test_review_list_prints_table_without_viewer(tmp_path):
+    from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+    (tmp_path / "a.py").write_text("def f(x):\n    return x\n")
+    ProjectFileSystem(tmp_path).stage_file(
+        Path("a.py"), "def f(x: int):\n    return x\n"
+    )
+
+    result = runner.invoke(
+        app, ["review", "--list", "--where", "signature-changed", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0
+    assert "a.py" in result.output and "changed" in result.output
+
+
+def test_review_reject_if_needs_accept(tmp_path):
+    result = runner.invoke(app, ["review", "--reject-if", "lines>5", str(tmp_path)])
+    assert result.exit_code == 1
+
+
 @patch("lovethedocs.cli.app.shutil.rmtree")
 def test_clean_removes_lovethedocs_with_yes(mock_rmtree, tmp_path):
     clean_path = tmp_path / ".lovethedocs"
@@ -76,8 +168,59 @@ def test_update_fails_cleanly_on_unknown_style(tmp_path):
     assert "Unknown documentation style" in result.output
 
 
+def test_update_fails_cleanly_on_unknown_profile_mode(tmp_path):
+    result = runner.invoke(app, ["update", "--profile", "wall", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "Unknown profile mode" in result.stdout
+
+
+@patch("lovethedocs.cli.app.run_pipeline")
+def test_update_profile_starts_after_pipeline_import(
+    mock_run_pipeline, tmp_path, monkeypatch
+):
+    import lovethedocs.application as application_pkg
+
+    # Simulate a fresh process in which the pipeline has not been imported yet.
+    monkeypatch.delitem(sys.modules, "lovethedocs.application.pipeline")
+    monkeypatch.delattr(application_pkg, "pipeline")
+    imported_at_start = []
+
+    @contextmanager
+    def _profile(mode, out_dir, *, top):
+        imported_at_start.append("lovethedocs.application.pipeline" in sys.modules)
+        yield
+
+    monkeypatch.setattr("lovethedocs.application.profiling.profile", _profile)
+    mock_run_pipeline.return_value = []
+
+    result = runner.invoke(app, ["update", "--profile", "cpu", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert imported_at_start == [True]
+
+
 def test_review_fails_cleanly_on_unknown_viewer(tmp_path):
     # Simulate bad viewer input
     result = runner.invoke(app, ["review", "-v", "sublime", str(tmp_path)])
     assert result.exit_code != 0
     assert "Viewer 'sublime' is not yet supported." in result.output
+
+
+def test_restore_lists_runs_and_restores(tmp_path):
+    from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+    (tmp_path / "a.py").write_text("v1\n")
+    fs = ProjectFileSystem(tmp_path)
+    fs.stage_file(Path("a.py"), "v2\n")
+    fs.apply_stage(Path("a.py"))
+    [run] = fs.backups.runs()
+
+    listed = runner.invoke(app, ["restore", str(tmp_path)])
+    assert run.run_id in listed.output and "1 files" in listed.output
+
+    result = runner.invoke(app, ["restore", "-y", "--run", run.run_id, str(tmp_path)])
+    assert result.exit_code == 0
+    assert (tmp_path / "a.py").read_text() == "v1\n"
+
+    missing = runner.invoke(app, ["restore", "-y", "--run", "nope", str(tmp_path)])
+    assert missing.exit_code == 1
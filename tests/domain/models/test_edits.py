@@ -1,4 +1,7 @@
-from dataclasses import asdict
+import sys
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
 
 from lovethedocs.domain.models import ClassEdit, FunctionEdit, ModuleEdit
 
@@ -49,3 +52,18 @@ def test_moduleedit_all_objects():
     assert qname_to_edit["foo"].qualname == "foo"
     assert qname_to_edit["Bar.baz"].qualname == "Bar.baz"
     assert qname_to_edit["Bar"].docstring == "?"
+
+
+def test_edits_are_frozen_and_interned():
+    edit = FunctionEdit(qualname="".join(["Bar.", "baz"]))
+
+    assert edit.qualname is sys.intern("Bar.baz")
+    with pytest.raises(FrozenInstanceError):
+        edit.docstring = "changed"
+
+
+def test_qname_index_is_cached():
+    obj = ModuleEdit(function_edits=[FunctionEdit(qualname="foo")])
+
+    assert obj.map_qnames_to_edits() is obj.map_qnames_to_edits()
+    assert "_qname_index" not in asdict(obj)
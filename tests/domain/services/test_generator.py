@@ -136,3 +136,39 @@ def test_generate_client_error():
     # client attempted, validator never reached
     assert client.called_with == ("PROMPT",)
     assert validator.validated is None
+
+
+# --------------------------------------------------------------------------- #
+#  4 ── streaming path forwards each item and still validates                #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_generate_async_streams_items():
+    raw = {"function_edits": [{"qualname": "f"}], "class_edits": []}
+    gen, client, validator, sentinel = _make_service(raw)
+
+    async def request_stream(prompt, on_item):
+        client.called_with = (prompt,)
+        for item in raw["function_edits"]:
+            on_item("function_edits", item)
+        return raw
+
+    client.request_stream = request_stream
+    seen = []
+
+    out = await gen.generate_async("PROMPT", on_item=lambda k, e: seen.append(k))
+
+    assert out is sentinel
+    assert seen == ["function_edits"]
+    assert validator.validated is raw
+
+
+# --------------------------------------------------------------------------- #
+#  5 ── a validating mapper can stand in for the separate validator          #
+# --------------------------------------------------------------------------- #
+def test_generate_without_validator_uses_mapper_only():
+    raw = {"ok": True}
+    client = FakeClient(raw, style=STYLE)
+    sentinel = ModuleEdit()
+    gen = ModuleEditGenerator(client=client, mapper=lambda data: sentinel)
+
+    assert gen.generate("PROMPT") is sentinel
@@ -0,0 +1,49 @@
+"""
+Unit-tests for lovethedocs.domain.services.model_router.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.services.model_router import ComplexityPolicy, ModelRouter
+
+SMALL = "def a():\n    pass\n"
+BIG = "".join(f"def f{i}():\n    pass\n" for i in range(10))
+
+
+def _mod(code: str) -> SourceModule:
+    return SourceModule(Path("m.py"), code)
+
+
+class _Gen:
+    def __init__(self, stats):
+        self._stats = stats
+
+    def stats(self):
+        return self._stats
+
+
+def test_policy_counts_objects_and_lines():
+    policy = ComplexityPolicy(max_objects=3, max_lines=10)
+
+    assert policy.is_trivial(_mod(SMALL))
+    assert not policy.is_trivial(_mod(BIG))  # 10 objects
+    assert not policy.is_trivial(_mod(SMALL + "\n" * 20))  # too long
+
+
+def test_router_picks_tier_and_reports_split():
+    pool = {"max connections": 8}
+    small = _Gen({"HTTP pool": pool, "Token usage": {"responses": 1}})
+    large = _Gen({"HTTP pool": pool, "Token usage": {"responses": 2}})
+    router = ModelRouter(small=small, large=large)
+
+    assert router.route(_mod(SMALL)) is small
+    assert router.route(_mod(BIG)) is large
+    router.escalated()
+
+    assert router.stats() == {
+        "Model tiers": {"small": 1, "large": 1, "escalated": 1},
+        "Token usage (small model)": {"responses": 1},
+    }
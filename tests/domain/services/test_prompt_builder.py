@@ -99,3 +99,14 @@ def test_build_multiple_modules(builder):
 
     # Template fetched only once despite two modules
     assert repo.called_with.count(style.name) == 1
+
+
+def test_instructions_are_a_stable_static_prefix(builder):
+    pb, repo, style = builder
+
+    first = pb.instructions(style)
+
+    assert first.startswith("<template stub>")
+    assert "### Input format" in first
+    assert pb.instructions(style) is first  # composed once, byte-identical
+    assert repo.called_with == ["numpy"]
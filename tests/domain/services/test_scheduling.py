@@ -0,0 +1,30 @@
+"""
+Unit-tests for lovethedocs.domain.services.scheduling.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lovethedocs.domain.models import SourceModule
+from lovethedocs.domain.services.scheduling import estimate_cost, largest_first
+
+
+def _mod(code: str) -> SourceModule:
+    return SourceModule(Path("m.py"), code)
+
+
+def test_cost_grows_with_source_and_objects():
+    constants = _mod("X = 1\n" * 40)
+    functions = _mod("def f():\n    pass\n" * 3)
+    assert estimate_cost(_mod("")) == 0
+    # fewer characters, but each function means docstrings to write
+    assert estimate_cost(functions) > estimate_cost(constants)
+
+
+def test_largest_first_sorts_descending_by_cost():
+    mods = [_mod("x = 1\n"), _mod("def f():\n    pass\n" * 5), _mod("")]
+    ordered = sorted(mods, key=largest_first)
+    assert [estimate_cost(m) for m in ordered] == sorted(
+        (estimate_cost(m) for m in mods), reverse=True
+    )
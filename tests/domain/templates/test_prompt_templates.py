@@ -39,3 +39,36 @@ def test_get_unknown_style(tmp_path):
         repo.get("missing")
 
     assert exc.value.style_key == "missing"
+
+
+# --------------------------------------------------------------------------- #
+# 3 ── Custom directory: memoized, falls back                                 #
+# --------------------------------------------------------------------------- #
+def test_custom_dir_is_read_once_per_repository(tmp_path, monkeypatch):
+    path = tmp_path / "numpy.txt"
+    path.write_text("v1", encoding="utf-8")
+    repo = PromptTemplateRepository(tmp_path)
+
+    reads = []
+    real_open = open
+
+    def counting_open(file, *args, **kwargs):
+        reads.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+
+    assert repo.get("numpy") == "v1"
+    assert repo.get("numpy") == "v1"
+    assert len(reads) == 1
+
+    path.write_text("v2", encoding="utf-8")
+    assert repo.get("numpy") == "v1"
+    assert len(reads) == 1
+    assert PromptTemplateRepository(tmp_path).get("numpy") == "v2"
+
+
+def test_custom_dir_falls_back_to_packaged_templates(tmp_path):
+    repo = PromptTemplateRepository(tmp_path)
+
+    assert repo.get("google") == PromptTemplateRepository().get("google")
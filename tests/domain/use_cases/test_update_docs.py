@@ -7,11 +7,20 @@ These tests therefore focus on call-ordering and propagation of data/​errors.
 
 from __future__ import annotations
 
+import asyncio
+import gc
+import threading
+import time
+import weakref
 from pathlib import Path
 from typing import Dict, List
 
+import pytest
+
 from lovethedocs.domain.models import ModuleEdit, SourceModule
 from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.domain.services.generator import EditValidationError
+from lovethedocs.domain.services.model_router import ModelRouter
 from lovethedocs.domain.use_cases.update_docs import DocumentationUpdateUseCase
 
 
@@ -27,6 +36,9 @@ class FakeBuilder:
         self.called_with = {"mods": list(mods), "style": style}
         return {m.path: f"prompt<{m.path}>" for m in self.called_with["mods"]}
 
+    def build_one(self, mod):
+        return f"prompt<{mod.path}>"
+
 
 class FakeGenerator:
     def __init__(self) -> None:
@@ -106,3 +118,178 @@ def test_update_docs_propagates_generator_error():
     assert isinstance(res, UpdateResult)
     assert isinstance(res.error, RuntimeError)
     assert res.new_code is None
+
+
+# --------------------------------------------------------------------------- #
+#  3 ── thread-pool mode: ordering, bounded parallelism, failure tolerance    #
+# --------------------------------------------------------------------------- #
+class SlowGenerator(FakeGenerator):
+    """Sleeps longer for earlier modules and records peak parallelism."""
+
+    def __init__(self, n: int) -> None:
+        super().__init__()
+        self._n = n
+        self._lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def generate(self, prompt):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        idx = int(prompt.split("<m")[1].split(".")[0])
+        time.sleep(0.005 * (self._n - idx))
+        with self._lock:
+            self.active -= 1
+        if idx == 3:
+            raise RuntimeError("boom")
+        return ModuleEdit()
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run_with_workers(ordered):
+    mods = [_make_module(f"m{i}") for i in range(8)]
+    gen = SlowGenerator(len(mods))
+    uc = DocumentationUpdateUseCase(
+        builder=FakeBuilder(), generator=gen, patcher=FakePatcher(postfix="#p")
+    )
+
+    out = list(uc.run(mods, style=STYLE, workers=3, ordered=ordered))
+
+    assert 1 < gen.peak <= 3
+    assert sorted(r.module.path for r in out) == sorted(m.path for m in mods)
+    if ordered:
+        assert [r.module for r in out] == mods
+    [failed] = [r for r in out if not r.ok]
+    assert failed.module.path == Path("m3.py")
+
+
+# --------------------------------------------------------------------------- #
+#  4 ── low-memory mode: lazy input, on-demand prompts, bounded window        #
+# --------------------------------------------------------------------------- #
+class _AsyncGen(FakeGenerator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = self.peak = 0
+
+    async def generate_async(self, prompt, *, on_item=None):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        if "m3" in prompt:
+            raise RuntimeError("boom")
+        return ModuleEdit()
+
+
+@pytest.mark.asyncio
+async def test_run_async_low_memory_pulls_modules_lazily():
+    pulled = 0
+
+    def modules():
+        nonlocal pulled
+        for i in range(10):
+            pulled += 1
+            yield _make_module(f"m{i}")
+
+    builder = FakeBuilder()
+    gen = _AsyncGen()
+    uc = DocumentationUpdateUseCase(
+        builder=builder, generator=gen, patcher=FakePatcher(postfix="#p")
+    )
+
+    out = []
+    async for res in uc.run_async(
+        modules(), style=STYLE, concurrency=2, low_memory=True
+    ):
+        # never more than `concurrency` modules pulled ahead of the consumer
+        assert pulled - len(out) <= 2
+        out.append(res)
+
+    assert len(out) == 10 and gen.peak == 2
+    assert builder.called_with == {}  # prompts built one at a time
+    [failed] = [r for r in out if not r.ok]
+    assert failed.error.__traceback__ is None
+
+
+@pytest.mark.asyncio
+async def test_run_async_starts_modules_in_order_key_order():
+    gen = _AsyncGen()
+    uc = DocumentationUpdateUseCase(
+        builder=FakeBuilder(), generator=gen, patcher=FakePatcher(postfix="")
+    )
+    mods = [_make_module(f"m{i}", code="x\n" * i) for i in (1, 4, 2)]
+
+    async for _ in uc.run_async(
+        mods, style=STYLE, concurrency=1, order_key=lambda m: -len(m.code)
+    ):
+        pass
+
+    assert gen.prompts == ["prompt<m4.py>", "prompt<m2.py>", "prompt<m1.py>"]
+
+
+@pytest.mark.asyncio
+async def test_run_async_releases_results_once_yielded():
+    class _Code:  # weak-referenceable stand-in for the patched source
+        pass
+
+    class _TrackingPatcher:
+        def __init__(self):
+            self.made = []
+
+        def apply(self, edit, code):
+            self.made.append(weakref.ref(new := _Code()))
+            return new
+
+    patcher = _TrackingPatcher()
+    uc = DocumentationUpdateUseCase(
+        builder=FakeBuilder(), generator=_AsyncGen(), patcher=patcher
+    )
+    mods = [_make_module(f"m{i}") for i in (0, 1, 2, 4, 5)]
+
+    seen = 0
+    async for res in uc.run_async(mods, style=STYLE, concurrency=1):
+        seen += 1
+        del res
+        gc.collect()
+        assert [ref() for ref in patcher.made[: seen - 1]] == [None] * (seen - 1)
+    assert seen == 5
+
+
+def test_run_low_memory_accepts_a_generator():
+    builder = FakeBuilder()
+    gen = FakeGenerator()
+    uc = DocumentationUpdateUseCase(
+        builder=builder, generator=gen, patcher=FakePatcher(postfix="#p")
+    )
+
+    mods = (_make_module(f"m{i}") for i in range(3))
+    out = list(uc.run(mods, style=STYLE, low_memory=True))
+
+    assert [str(r.module.path) for r in out] == ["m0.py", "m1.py", "m2.py"]
+    assert gen.prompts == ["prompt<m0.py>", "prompt<m1.py>", "prompt<m2.py>"]
+
+
+# --------------------------------------------------------------------------- #
+#  5 ── model tiering: invalid small-model output escalates to the large one  #
+# --------------------------------------------------------------------------- #
+def test_router_escalates_invalid_small_model_output():
+    class InvalidGen(FakeGenerator):
+        def generate(self, prompt):
+            super().generate(prompt)
+            raise EditValidationError("missing class_edits")
+
+    small, large = InvalidGen(), FakeGenerator()
+    router = ModelRouter(small=small, large=large)
+    uc = DocumentationUpdateUseCase(
+        builder=FakeBuilder(),
+        generator=large,
+        patcher=FakePatcher(postfix="#p"),
+        router=router,
+    )
+
+    [res] = list(uc.run([_make_module("tiny")], style=STYLE))
+
+    assert res.ok
+    assert small.prompts == large.prompts == ["prompt<tiny.py>"]
+    assert router.stats()["Model tiers"] == {"small": 1, "large": 0, "escalated": 1}
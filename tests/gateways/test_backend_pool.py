@@ -0,0 +1,147 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from lovethedocs.gateways.backend_pool import (
+    AllBackendsFailedError,
+    AsyncPooledClient,
+    Backend,
+    PooledClient,
+    _Balancer,
+)
+
+STYLE = object()
+
+
+class FakeClient:
+    def __init__(self, name, *, exc=None, delay=0.0):
+        self.name = name
+        self.exc = exc
+        self.delay = delay
+        self.calls = 0
+
+    def request(self, prompt):
+        self.calls += 1
+        if self.exc:
+            raise self.exc
+        return {"backend": self.name}
+
+    def stats(self):
+        return {"Token usage": {"responses": self.calls}}
+
+
+class AsyncFakeClient(FakeClient):
+    async def request(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.exc:
+            raise self.exc
+        return {"backend": self.name}
+
+    async def request_stream(self, prompt, on_item):
+        on_item("function_edits", {"qualname": "f"})
+        return await self.request(prompt)
+
+
+def _bad_request():
+    request = httpx.Request("POST", "http://stub/v1/responses")
+    return openai.BadRequestError(
+        "bad", response=httpx.Response(400, request=request), body=None
+    )
+
+
+# --------------------------------------------------------------------------- #
+# 1. Least outstanding requests spreads concurrent load                       #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_async_pool_balances_by_outstanding_requests():
+    a, b = AsyncFakeClient("a", delay=0.01), AsyncFakeClient("b", delay=0.01)
+    pool = AsyncPooledClient([Backend("a", a), Backend("b", b)], style=STYLE)
+
+    await asyncio.gather(*(pool.request("p") for _ in range(6)))
+
+    assert (a.calls, b.calls) == (3, 3)
+
+
+# --------------------------------------------------------------------------- #
+# 2. Errors fail over and put the backend into cooldown                       #
+# --------------------------------------------------------------------------- #
+def test_sync_pool_fails_over_and_cools_down():
+    a, b = FakeClient("a", exc=RuntimeError("down")), FakeClient("b")
+    pool = PooledClient([Backend("a", a), Backend("b", b)], style=STYLE)
+
+    assert pool.request("p") == {"backend": "b"}
+    assert pool.request("p") == {"backend": "b"}  # a is cooling down
+    assert a.calls == 1
+    stats = pool.stats()
+    assert stats["Backend pool"] == {"a": "0 ok / 1 failed", "b": "2 ok / 0 failed"}
+    assert stats["Token usage (b)"] == {"responses": 2}
+
+
+def test_sync_pool_raises_when_every_backend_fails():
+    pool = PooledClient(
+        [Backend("a", FakeClient("a", exc=RuntimeError("x")))], style=STYLE
+    )
+    with pytest.raises(AllBackendsFailedError):
+        pool.request("p")
+
+
+def test_rejected_request_is_not_retried_elsewhere():
+    a, b = FakeClient("a", exc=_bad_request()), FakeClient("b")
+    pool = PooledClient([Backend("a", a), Backend("b", b)], style=STYLE)
+
+    with pytest.raises(openai.BadRequestError):
+        pool.request("p")
+    assert b.calls == 0
+    assert pool.stats()["Backend pool"]["a"] == "0 ok / 0 failed"
+
+
+# --------------------------------------------------------------------------- #
+# 3. A rate-limited backend yields to one with headroom                       #
+# --------------------------------------------------------------------------- #
+def test_rate_limit_routes_to_backend_with_headroom():
+    slow = Backend("slow", FakeClient("slow"), rpm=60)
+    fast = Backend("fast", FakeClient("fast"))
+    balancer = _Balancer([slow, fast])
+
+    first, wait1 = balancer.acquire(set())
+    balancer.release(first, failed=False)
+    second, wait2 = balancer.acquire(set())
+
+    assert (first.name, wait1) == ("slow", 0)
+    assert (second.name, wait2) == ("fast", 0)
+
+
+# --------------------------------------------------------------------------- #
+# 4. Streaming only fails over before anything was emitted                    #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_stream_does_not_fail_over_after_emitting():
+    a = AsyncFakeClient("a", exc=RuntimeError("mid-stream"))
+    b = AsyncFakeClient("b")
+    pool = AsyncPooledClient([Backend("a", a), Backend("b", b)], style=STYLE)
+    seen = []
+
+    with pytest.raises(RuntimeError, match="mid-stream"):
+        await pool.request_stream("p", lambda k, e: seen.append(k))
+    assert b.calls == 0 and seen == ["function_edits"]
+
+
+# --------------------------------------------------------------------------- #
+# 5. Cancelled requests free their slot without counting as an outcome        #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_cancelled_request_is_not_counted():
+    backend = Backend("a", AsyncFakeClient("a", delay=10))
+    pool = AsyncPooledClient([backend], style=STYLE)
+
+    task = asyncio.create_task(pool.request("p"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert (backend.ok, backend.failed, backend.outstanding) == (0, 0, 0)
+    assert pool.stats()["Backend pool"] == {"a": "0 ok / 0 failed"}
@@ -0,0 +1,199 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from lovethedocs.gateways.backend_pool import is_request_error
+from lovethedocs.gateways.circuit_breaker import (
+    AsyncCircuitBreakerClient,
+    CircuitBreaker,
+    CircuitBreakerClient,
+    CircuitOpenError,
+)
+
+STYLE = object()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyClient:
+    style = STYLE
+
+    def __init__(self, exc=None):
+        self.exc = exc
+        self.calls = 0
+
+    def request(self, prompt):
+        self.calls += 1
+        if self.exc:
+            raise self.exc
+        return {"ok": True}
+
+
+class AsyncFlakyClient(FlakyClient):
+    async def request(self, prompt):
+        return super().request(prompt)
+
+
+def _trip(breaker, n=4):
+    for _ in range(n):
+        assert breaker.acquire() == (0.0, False)
+        breaker.record(ok=False, probe=False)
+
+
+# --------------------------------------------------------------------------- #
+# 1. State machine                                                            #
+# --------------------------------------------------------------------------- #
+def test_opens_at_error_rate_then_probes_and_closes():
+    clock = Clock()
+    breaker = CircuitBreaker(error_rate=0.5, window=4, cooldown=10, clock=clock)
+    for ok in (True, True, False):
+        breaker.acquire()
+        breaker.record(ok=ok, probe=False)
+    assert breaker.state == "closed"  # window not full yet
+
+    breaker.acquire()
+    breaker.record(ok=False, probe=False)
+    assert breaker.state == "open"
+    assert breaker.acquire() == (10.0, False)
+
+    clock.now = 10.0
+    assert breaker.acquire() == (0.0, True)
+    assert breaker.acquire()[0] > 0  # only one probe at a time
+    breaker.record(ok=True, probe=True)
+    assert breaker.state == "closed"
+    assert breaker.stats() == {"state": "closed", "trips": 1}
+
+
+def test_failed_probes_abort_after_max_outage():
+    clock = Clock()
+    breaker = CircuitBreaker(window=4, cooldown=10, abort_after=25, clock=clock)
+    _trip(breaker)
+
+    for now in (10.0, 20.0, 30.0):
+        clock.now = now
+        assert breaker.acquire() == (0.0, True)
+        breaker.record(ok=False, probe=True)
+
+    assert breaker.state == "aborted"
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+
+def test_aborted_breaker_keeps_probing_and_recovers():
+    clock = Clock()
+    breaker = CircuitBreaker(window=4, cooldown=10, abort_after=5, clock=clock)
+    _trip(breaker)
+    clock.now = 10.0
+    assert breaker.acquire() == (0.0, True)
+    breaker.record(ok=False, probe=True)
+    assert breaker.state == "aborted"
+
+    clock.now = 15.0
+    with pytest.raises(CircuitOpenError):  # fails fast between probes
+        breaker.acquire()
+
+    clock.now = 20.0  # e.g. the next batch in watch mode
+    assert breaker.acquire() == (0.0, True)
+    assert breaker.acquire()[0] > 0  # others wait for the probe's outcome
+    breaker.record(ok=True, probe=True)
+    assert breaker.state == "closed"
+    assert breaker.acquire() == (0.0, False)
+
+
+def test_late_results_from_before_the_trip_are_ignored():
+    breaker = CircuitBreaker(window=4, clock=Clock())
+    _trip(breaker)
+    breaker.record(ok=True, probe=False)
+    assert breaker.state == "open"
+
+
+# --------------------------------------------------------------------------- #
+# 2. Client wrappers                                                          #
+# --------------------------------------------------------------------------- #
+def test_rejected_requests_do_not_count_as_outage():
+    request = httpx.Request("POST", "http://stub/v1/responses")
+    bad = openai.BadRequestError(
+        "bad", response=httpx.Response(400, request=request), body=None
+    )
+    breaker = CircuitBreaker(window=4, clock=Clock())
+    client = CircuitBreakerClient(FlakyClient(exc=bad), breaker)
+
+    for _ in range(4):
+        with pytest.raises(openai.BadRequestError):
+            client.request("p")
+
+    assert breaker.state == "closed"
+
+
+def _status_error(status):
+    request = httpx.Request("POST", "http://stub/v1/responses")
+    return openai.APIStatusError(
+        f"HTTP {status}", response=httpx.Response(status, request=request), body=None
+    )
+
+
+@pytest.mark.parametrize(
+    "status, refused",
+    [(401, True), (403, True), (404, True), (429, False), (500, False)],
+)
+def test_only_non_retryable_4xx_are_request_errors(status, refused):
+    assert is_request_error(_status_error(status)) is refused
+
+
+@pytest.mark.parametrize("exc_type", [openai.AuthenticationError, openai.NotFoundError])
+def test_bad_key_or_model_fails_each_request_without_tripping(exc_type):
+    status = 401 if exc_type is openai.AuthenticationError else 404
+    request = httpx.Request("POST", "http://stub/v1/responses")
+    exc = exc_type(
+        "refused", response=httpx.Response(status, request=request), body=None
+    )
+    inner = FlakyClient(exc=exc)
+    breaker = CircuitBreaker(window=4, clock=Clock())
+    client = CircuitBreakerClient(inner, breaker)
+
+    for _ in range(10):
+        with pytest.raises(exc_type):  # the real error, at once
+            client.request("p")
+
+    assert inner.calls == 10
+    assert breaker.stats() == {"state": "closed", "trips": 0}
+
+
+def test_refused_probe_closes_the_breaker():
+    clock = Clock()
+    breaker = CircuitBreaker(window=4, cooldown=10, clock=clock)
+    _trip(breaker)
+    clock.now = 10.0
+    client = CircuitBreakerClient(FlakyClient(exc=_status_error(401)), breaker)
+
+    with pytest.raises(openai.APIStatusError):
+        client.request("p")
+
+    assert breaker.state == "closed"  # the provider is up; the key is the problem
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast_once_aborted():
+    inner = AsyncFlakyClient(exc=ConnectionError("down"))
+    breaker = CircuitBreaker(window=2, cooldown=0.01, abort_after=0.02)
+    client = AsyncCircuitBreakerClient(inner, breaker)
+
+    errors = []
+    for _ in range(10):
+        try:
+            await asyncio.wait_for(client.request("p"), timeout=1)
+        except Exception as exc:
+            errors.append(type(exc))
+
+    assert errors[:2] == [ConnectionError, ConnectionError]
+    assert errors[-1] is CircuitOpenError
+    assert inner.calls < 10  # later requests never reached the provider
+    assert client.stats()["Circuit breaker"]["state"] == "aborted"
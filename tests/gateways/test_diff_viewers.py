@@ -0,0 +1,25 @@
+import subprocess
+
+import pytest
+
+from lovethedocs.gateways.diff_viewers import DiffViewerError, GitDiffViewer
+
+
+def test_git_viewer_pages_the_whole_patch(tmp_path, monkeypatch):
+    patch = tmp_path / "docs.patch"
+    patch.write_text("diff --git a/m.py b/m.py\n+x\n")
+    out = tmp_path / "paged.txt"
+    monkeypatch.setenv("GIT_PAGER", f"cat > '{out}'")
+
+    GitDiffViewer().view_patch(patch)
+
+    assert out.read_text() == patch.read_text()
+
+
+def test_git_viewer_without_git_raises(tmp_path, monkeypatch):
+    def _missing(*args, **kwargs):
+        raise FileNotFoundError("git")
+
+    monkeypatch.setattr(subprocess, "run", _missing)
+    with pytest.raises(DiffViewerError, match="not found"):
+        GitDiffViewer().view_patch(tmp_path / "docs.patch")
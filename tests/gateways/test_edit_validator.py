@@ -0,0 +1,66 @@
+import copy
+import importlib
+
+import pytest
+
+from lovethedocs.domain.models import ClassEdit, FunctionEdit, ModuleEdit
+from lovethedocs.gateways import edit_validator, schema_loader
+from lovethedocs.gateways.edit_validator import ValidationError, parse_module_edit
+
+GOOD_PAYLOAD = {
+    "function_edits": [{"qualname": "foo", "signature": "foo()", "docstring": "hi"}],
+    "class_edits": [
+        {
+            "qualname": "Bar",
+            "docstring": "hi",
+            "method_edits": [
+                {"qualname": "Bar.baz", "docstring": "hi", "signature": "baz()"}
+            ],
+        }
+    ],
+}
+
+
+def test_builds_domain_edits():
+    assert parse_module_edit(GOOD_PAYLOAD) == ModuleEdit(
+        function_edits=[FunctionEdit("foo", "hi", "foo()")],
+        class_edits=[
+            ClassEdit(
+                "Bar", "hi", method_edits=[FunctionEdit("Bar.baz", "hi", "baz()")]
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.pop("function_edits"),  # missing functions
+        lambda d: d["function_edits"].append({"qualname": "bar"}),  # missing fields
+        lambda d: d["class_edits"][0].pop("method_edits"),  # missing class methods
+        lambda d: d.update(extra=[]),  # additionalProperties: false
+        lambda d: d["function_edits"][0].update(docstring=None),  # not a string
+        lambda d: d.update(class_edits={}),  # not an array
+    ],
+)
+def test_rejects_what_the_schema_rejects(mutate):
+    bad = copy.deepcopy(GOOD_PAYLOAD)
+    mutate(bad)
+    with pytest.raises(ValidationError):
+        parse_module_edit(bad)
+
+
+def test_validation_error_is_a_value_error():
+    assert issubclass(ValidationError, ValueError)
+
+
+@pytest.mark.parametrize("keyword", [{"pattern": "^\\S"}, {"enum": ["hi"]}])
+def test_unsupported_schema_keyword_fails_at_import(monkeypatch, keyword):
+    schema = copy.deepcopy(schema_loader._RAW_SCHEMA)
+    schema["$defs"]["function_edit"]["properties"]["docstring"].update(keyword)
+
+    with monkeypatch.context() as m:
+        m.setattr(schema_loader, "_RAW_SCHEMA", schema)
+        with pytest.raises(ValueError, match="Unsupported schema node"):
+            importlib.reload(edit_validator)
+    importlib.reload(edit_validator)  # back to the shipped schema
@@ -1,3 +1,4 @@
+import os
 import tempfile
 import textwrap
 from pathlib import Path
@@ -38,6 +39,19 @@ def test_load_modules_ignores_virtualenv_dirs():
         assert all("venv" not in p.parts for p in modules)  # path.parts not str
 
 
+def test_module_paths_lists_without_reading():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write(root / "pkg" / "alpha.py", "x = 1\n")
+        _write(root / "pkg" / "__init__.py", "# ignored\n")
+        _write(root / ".venv" / "gamma.py", "z = 3\n")
+
+        fs = ProjectFileSystem(root)
+
+        assert fs.module_paths() == [Path("pkg/alpha.py")]
+        assert fs.read_module(Path("pkg/alpha.py")) == "x = 1\n"
+
+
 def test_load_modules_preserves_blank_lines_and_unicode():
     with tempfile.TemporaryDirectory() as tmp:
         root = Path(tmp)
@@ -143,3 +157,178 @@ def test_apply_stage_is_idempotent():
         # Final consistency checks
         assert (project_root / rel_path).read_text() == updated_code
         assert fs.backup_path(rel_path).is_file()
+
+
+def test_update_pending_merges_and_clears(tmp_path):
+    fs = ProjectFileSystem(tmp_path)
+    assert fs.read_pending() == []
+
+    fs.update_pending([Path("a.py")], [Path("b.py"), Path("pkg/c.py")])
+    fs.update_pending([Path("b.py")], [])
+    assert fs.read_pending() == [Path("pkg/c.py")]
+
+    assert fs.update_pending([Path("pkg/c.py")], []) == []
+    assert not fs.pending_file.exists()
+
+
+def test_stage_file_creates_each_parent_once(tmp_path, monkeypatch):
+    fs = ProjectFileSystem(tmp_path)
+    made = []
+    real_mkdir = Path.mkdir
+
+    def _mkdir(self, *args, **kwargs):
+        if kwargs.get("parents"):  # skip pathlib's own recursive calls
+            made.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _mkdir)
+    for name in ("a.py", "b.py", "c.py"):
+        fs.stage_file(Path("pkg") / name, "x = 1\n")
+    assert made.count(fs.staged_root / "pkg") == 1
+
+    for name in ("a.py", "b.py", "c.py"):
+        fs.delete_staged(Path("pkg") / name)
+    fs.stage_file(Path("pkg/a.py"), "x = 2\n")  # pruned parent is recreated
+    assert fs.staged_path(Path("pkg/a.py")).read_text() == "x = 2\n"
+
+
+def test_stage_file_recreates_dir_pruned_by_another_instance(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+    watcher, reviewer = ProjectFileSystem(tmp_path), ProjectFileSystem(tmp_path)
+    watcher.stage_file(Path("pkg/a.py"), "x = 2\n")
+
+    reviewer.apply_stage(Path("pkg/a.py"))  # prunes .lovethedocs/staged/pkg
+    assert not (watcher.staged_root / "pkg").exists()
+
+    watcher.stage_file(Path("pkg/a.py"), "x = 3\n")
+    assert watcher.staged_path(Path("pkg/a.py")).read_text() == "x = 3\n"
+
+
+def test_load_modules_reads_in_parallel_and_keeps_paths(tmp_path):
+    for i in range(20):
+        (tmp_path / f"m{i}.py").write_text(f"x = {i}\n")
+    modules = ProjectFileSystem(tmp_path).load_modules()
+    assert modules == {Path(f"m{i}.py"): f"x = {i}\n" for i in range(20)}
+
+
+# ---------- atomic writes, fsync policy, bulk apply ----------------------- #
+def test_failed_stage_write_keeps_previous_version(tmp_path, monkeypatch):
+    fs = ProjectFileSystem(tmp_path)
+    fs.stage_file(Path("a.py"), "old\n")
+
+    def _crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(os, "replace", _crash)
+    with pytest.raises(KeyboardInterrupt):
+        fs.stage_file(Path("a.py"), "new\n")
+
+    assert fs.staged_path(Path("a.py")).read_text() == "old\n"
+    assert [p.name for p in fs.staged_root.iterdir()] == ["a.py"]  # no temp file
+
+
+@pytest.mark.parametrize(
+    "policy, on_write, on_sync",
+    [
+        ("none", 0, 0),
+        ("file", 2, 0),
+        ("batch", 0, 2),
+    ],
+)
+def test_fsync_policy(tmp_path, monkeypatch, policy, on_write, on_sync):
+    synced = []
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+    monkeypatch.setattr(
+        "lovethedocs.gateways.project_file_system._fsync_dir", lambda path: None
+    )
+    fs = ProjectFileSystem(tmp_path, fsync=policy)
+
+    fs.stage_file(Path("a.py"), "a\n")
+    fs.stage_file(Path("b.py"), "b\n")
+    assert len(synced) == on_write
+    fs.sync()
+    assert len(synced) == on_write + on_sync
+
+
+def test_unknown_fsync_policy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ProjectFileSystem(tmp_path, fsync="sometimes")
+
+
+def test_apply_all_replaces_backs_up_and_prunes(tmp_path):
+    rels = [Path("a.py"), Path("pkg/b.py"), Path("pkg/sub/c.py")]
+    for rel in rels:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(f"old {rel.name}\n")
+    (tmp_path / "a.py").chmod(0o755)
+    fs = ProjectFileSystem(tmp_path)
+    for rel in rels:
+        fs.stage_file(rel, f"new {rel.name}\n")
+
+    assert fs.apply_all(rels) == rels
+
+    for rel in rels:
+        assert (tmp_path / rel).read_text() == f"new {rel.name}\n"
+        assert fs.backup_path(rel).read_text() == f"old {rel.name}\n"
+    assert (tmp_path / "a.py").stat().st_mode & 0o777 == 0o755
+    assert not fs.staged_root.exists()
+
+
+def test_apply_all_checks_every_path_first(tmp_path):
+    (tmp_path / "a.py").write_text("old\n")
+    fs = ProjectFileSystem(tmp_path)
+    fs.stage_file(Path("a.py"), "new\n")
+
+    with pytest.raises(FileNotFoundError):
+        fs.apply_all([Path("a.py"), Path("missing.py")])
+
+    assert (tmp_path / "a.py").read_text() == "old\n"
+    assert fs.staged_path(Path("a.py")).exists()
+
+
+# ---------- content-addressed backups ------------------------------------ #
+def test_backups_are_deduplicated_and_kept_per_run(tmp_path):
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("same = 1\n")
+
+    first = ProjectFileSystem(tmp_path)
+    for name in ("a.py", "b.py"):
+        first.stage_file(Path(name), f"# v2\n{name}\n")
+    first.apply_all([Path("a.py"), Path("b.py")])
+
+    second = ProjectFileSystem(tmp_path)
+    second.stage_file(Path("a.py"), "# v3\n")
+    second.apply_stage(Path("a.py"))
+
+    blobs = [p for p in second.backups.objects_root.rglob("*") if p.is_file()]
+    assert len(blobs) == 2  # "same = 1" stored once, plus a.py's v2
+    runs = second.backups.runs()
+    assert [sorted(r.files) for r in runs] == [
+        [Path("a.py"), Path("b.py")],
+        [Path("a.py")],
+    ]
+    assert second.backup_path(Path("a.py")).read_text() == "# v2\na.py\n"
+    # the blob is not affected by the applied file being edited in place
+    (tmp_path / "a.py").write_text("edited\n")
+    assert second.backup_path(Path("a.py")).read_text() == "# v2\na.py\n"
+
+
+def test_restore_puts_a_run_back_and_is_undoable(tmp_path):
+    (tmp_path / "a.py").write_text("v1\n")
+    fs = ProjectFileSystem(tmp_path)
+    fs.stage_file(Path("a.py"), "v2\n")
+    fs.apply_stage(Path("a.py"))
+    [run] = fs.backups.runs()
+
+    restorer = ProjectFileSystem(tmp_path)
+    assert restorer.restore(run.run_id) == [Path("a.py")]
+    assert (tmp_path / "a.py").read_text() == "v1\n"
+
+    undo = restorer.backups.runs()[-1]
+    assert undo.run_id != run.run_id
+    ProjectFileSystem(tmp_path).restore(undo.run_id)
+    assert (tmp_path / "a.py").read_text() == "v2\n"
+
+    with pytest.raises(ValueError):
+        fs.restore("no-such-run")
@@ -0,0 +1,41 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from lovethedocs.gateways.git_files import GitError, staged_python_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git missing")
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def test_lists_added_and_modified_python_files(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "pkg").mkdir()
+    for name in ("pkg/old.py", "pkg/gone.py"):
+        (tmp_path / name).write_text("x = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+
+    (tmp_path / "pkg/old.py").write_text("x = 2\n")
+    (tmp_path / "pkg/new.py").write_text("y = 1\n")
+    (tmp_path / "notes.txt").write_text("hi\n")
+    (tmp_path / "unstaged.py").write_text("z = 1\n")
+    _git(tmp_path, "add", "pkg/old.py", "pkg/new.py", "notes.txt")
+    _git(tmp_path, "rm", "-q", "pkg/gone.py")
+
+    root, files = staged_python_files(tmp_path / "pkg")
+
+    assert root == tmp_path.resolve()
+    assert sorted(files) == [Path("pkg/new.py"), Path("pkg/old.py")]
+
+
+def test_outside_a_repository_raises(tmp_path):
+    with pytest.raises(GitError):
+        staged_python_files(tmp_path)
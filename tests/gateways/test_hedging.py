@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from lovethedocs.gateways.hedging import HedgedClient
+
+STYLE = object()
+
+
+class SlowFirstClient:
+    """Answers after `delays[i]` seconds on its i-th call, then 0.001 s."""
+
+    style = STYLE
+
+    def __init__(self, *delays, exc=None):
+        self.delays = list(delays)
+        self.exc = exc
+        self.calls = self.cancelled = 0
+
+    async def request(self, prompt):
+        call = self.calls
+        self.calls += 1
+        delay = self.delays[call] if call < len(self.delays) else 0.001
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.exc:
+            raise self.exc
+        return {"call": call}
+
+    async def request_stream(self, prompt, on_item):
+        call = self.calls
+        result = await self.request(prompt)
+        on_item("function_edits", {"qualname": f"f{call}"})
+        return result
+
+    def stats(self):
+        return {"Token usage": {"responses": self.calls}}
+
+
+async def _warm_up(client, n=4):
+    for _ in range(n):
+        await client.request("p")
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_while_warming_up():
+    inner = SlowFirstClient(0.05)
+    client = HedgedClient(inner, percentile=50, budget=1.0, min_samples=4)
+
+    assert await client.request("p") == {"call": 0}
+    assert inner.calls == 1
+    assert client.stats()["Hedging"]["threshold"] == "warming up"
+
+
+@pytest.mark.asyncio
+async def test_straggler_is_hedged_and_loser_cancelled():
+    inner = SlowFirstClient(*[0.001] * 4, 5.0)
+    client = HedgedClient(inner, percentile=50, budget=1.0, min_samples=4)
+    await _warm_up(client)
+
+    result = await asyncio.wait_for(client.request("p"), timeout=2)
+
+    assert result == {"call": 5}  # the duplicate answered first
+    assert inner.cancelled == 1
+    stats = client.stats()
+    assert stats["Hedging"]["hedged"] == stats["Hedging"]["hedge wins"] == 1
+    assert stats["Token usage"] == {"responses": 6}
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_duplicates():
+    inner = SlowFirstClient(*[0.001] * 4, 0.05, 0.05, 0.05)
+    client = HedgedClient(inner, percentile=50, budget=0.2, min_samples=4)
+    await _warm_up(client)
+
+    await asyncio.gather(*(client.request("p") for _ in range(3)))
+
+    # 7 requests at a 20 % budget allow a single duplicate
+    assert client.stats()["Hedging"]["hedged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_items_from_one_attempt_only():
+    inner = SlowFirstClient(*[0.001] * 4, 5.0)
+    client = HedgedClient(inner, percentile=50, budget=1.0, min_samples=4)
+    await _warm_up(client)
+    items = []
+
+    await asyncio.wait_for(
+        client.request_stream("p", lambda key, item: items.append(item)), timeout=2
+    )
+
+    assert items == [{"qualname": "f5"}]
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_when_every_attempt_fails():
+    inner = SlowFirstClient(exc=RuntimeError("down"))
+    client = HedgedClient(inner, percentile=50, min_samples=1)
+
+    with pytest.raises(RuntimeError, match="down"):
+        await client.request("p")
+
+
+def test_rejects_out_of_range_percentile():
+    with pytest.raises(ValueError):
+        HedgedClient(SlowFirstClient(), percentile=100)
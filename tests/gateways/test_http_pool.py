@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from lovethedocs.gateways import http_pool, openai_client as oc
+from lovethedocs.gateways.stub_server import LatencyModel, StubConfig, StubServer
+
+
+class _DummyStyle:
+    name = "numpy"
+
+
+def test_pool_sized_from_concurrency():
+    cfg = http_pool.PoolConfig.for_concurrency(64, read_timeout=5.0)
+
+    assert cfg.max_connections == cfg.max_keepalive == 64
+    assert cfg.read_timeout == 5.0
+
+
+def test_http2_dropped_without_h2(monkeypatch):
+    monkeypatch.setattr(http_pool, "http2_available", lambda: False)
+
+    assert http_pool.PoolConfig(http2=True).resolved().http2 is False
+
+
+@pytest.mark.asyncio
+async def test_pooled_adapter_reports_stats(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    http_pool.get_async_http_client.cache_clear()
+    oc._get_async_sdk_client.cache_clear()
+    prompt = "### Objects in m.py:\n  f\n\nBEGIN m.py\ndef f(): ...\nEND m.py"
+
+    config = StubConfig(latency=LatencyModel.parse("fixed:0.05"))
+    with StubServer(config) as server:
+        adapter = oc.AsyncOpenAIClientAdapter(
+            style=_DummyStyle(),
+            base_url=server.base_url,
+            pool=http_pool.PoolConfig.for_concurrency(4),
+        )
+        await asyncio.gather(*(adapter.request(prompt) for _ in range(8)))
+
+    stats = adapter.stats()["HTTP pool"]
+    assert stats["requests"] == 8
+    assert stats["transport errors"] == 0
+    # requests beyond the pool size wait inside the transport for a connection
+    assert stats["peak in flight (incl. queued)"] > 4
+    assert 1 <= stats["peak open connections"] <= 4
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from lovethedocs.gateways.json_stream import EditStreamParser
+
+PAYLOAD = {
+    "function_edits": [
+        {"qualname": "foo", "docstring": 'Has "quotes" and {braces}', "signature": ""},
+        {"qualname": "bar", "docstring": "Back\\slash ]", "signature": "def bar():"},
+    ],
+    "class_edits": [
+        {
+            "qualname": "Baz",
+            "docstring": "Class",
+            "method_edits": [{"qualname": "Baz.m", "docstring": "", "signature": ""}],
+        }
+    ],
+}
+TEXT = json.dumps(PAYLOAD, indent=2)
+
+
+# --------------------------------------------------------------------------- #
+# 1. Any chunking yields the same items, in order, and the same document       #
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(TEXT)])
+def test_items_emitted_for_any_chunk_size(size):
+    parser = EditStreamParser()
+    emitted = []
+    for i in range(0, len(TEXT), size):
+        emitted.extend(parser.feed(TEXT[i : i + size]))
+
+    assert [(k, item["qualname"]) for k, item in emitted] == [
+        ("function_edits", "foo"),
+        ("function_edits", "bar"),
+        ("class_edits", "Baz"),
+    ]
+    assert parser.result() == PAYLOAD
+
+
+def test_item_emitted_as_soon_as_it_closes():
+    parser = EditStreamParser()
+    first_end = TEXT.index("},") + 1
+
+    assert parser.feed(TEXT[:first_end]) == [
+        ("function_edits", PAYLOAD["function_edits"][0])
+    ]
+
+
+def test_truncated_stream_raises():
+    parser = EditStreamParser()
+    parser.feed(TEXT[:-10])
+
+    with pytest.raises(ValueError):
+        parser.result()
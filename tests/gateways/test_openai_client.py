@@ -33,7 +33,7 @@ def test_sync_request_returns_parsed_json(monkeypatch):
             return SimpleNamespace(output_text=json.dumps({"ok": True}))
 
     fake_client = SimpleNamespace(responses=FakeResponses())
-    monkeypatch.setattr(oc, "_get_sdk_client", lambda: fake_client)
+    monkeypatch.setattr(oc, "_get_sdk_client", lambda **_: fake_client)
     monkeypatch.setattr(oc, "_PROMPTS", SimpleNamespace(get=lambda _n: "TEST_PROMPT"))
 
     adapter = oc.OpenAIClientAdapter(style=_DummyStyle(), model="gpt-test")
@@ -57,7 +57,7 @@ async def test_async_request_returns_parsed_json(monkeypatch):
     fake_client = SimpleNamespace(
         responses=SimpleNamespace(create=AsyncMock(side_effect=_fake_create))
     )
-    monkeypatch.setattr(oc, "_get_async_sdk_client", lambda: fake_client)
+    monkeypatch.setattr(oc, "_get_async_sdk_client", lambda **_: fake_client)
     monkeypatch.setattr(oc, "_PROMPTS", SimpleNamespace(get=lambda _n: "TEST_PROMPT"))
 
     adapter = oc.AsyncOpenAIClientAdapter(style=_DummyStyle(), model="gpt-test")
@@ -67,6 +67,43 @@ async def test_async_request_returns_parsed_json(monkeypatch):
     fake_client.responses.create.assert_awaited_once()
 
 
+# --------------------------------------------------------------------------- #
+# 2b. Explicit instructions win over the template; usage lands in stats()     #
+# --------------------------------------------------------------------------- #
+def test_instructions_and_usage(monkeypatch):
+    _clear_caches()
+    captured = {}
+    usage = SimpleNamespace(
+        input_tokens=2000,
+        input_tokens_details=SimpleNamespace(cached_tokens=1536),
+        output_tokens=300,
+    )
+
+    class FakeResponses:
+        def create(self, **kwargs):
+            captured.update(kwargs)
+            return SimpleNamespace(output_text="{}", usage=usage)
+
+    fake_client = SimpleNamespace(responses=FakeResponses())
+    monkeypatch.setattr(oc, "_get_sdk_client", lambda **_: fake_client)
+    monkeypatch.setattr(oc, "_PROMPTS", SimpleNamespace(get=lambda _n: "TEMPLATE"))
+
+    adapter = oc.OpenAIClientAdapter(style=_DummyStyle(), instructions="PREFIX")
+    assert adapter.stats() == {}
+    adapter.request("PROMPT")
+
+    assert captured["instructions"] == "PREFIX"
+    assert adapter.stats() == {
+        "Token usage": {
+            "responses": 1,
+            "input tokens": 2000,
+            "cached input tokens": 1536,
+            "cache hit rate": "76.8%",
+            "output tokens": 300,
+        }
+    }
+
+
 # --------------------------------------------------------------------------- #
 # 3. _get_sdk_client raises when the API key is missing                       #
 # --------------------------------------------------------------------------- #
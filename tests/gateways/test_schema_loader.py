@@ -1,9 +1,12 @@
 import copy
 
 import pytest
+from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
-from lovethedocs.gateways.schema_loader import VALIDATOR
+from lovethedocs.gateways.schema_loader import _RAW_SCHEMA
+
+VALIDATOR = Draft202012Validator(_RAW_SCHEMA)
 
 GOOD_PAYLOAD = {
     "function_edits": [{"qualname": "foo", "signature": "foo()", "docstring": "hi"}],
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+from jsonschema import Draft202012Validator
+from openai import RateLimitError
+
+from lovethedocs.gateways import openai_client as oc
+from lovethedocs.gateways.schema_loader import _RAW_SCHEMA
+from lovethedocs.gateways.stub_server import (
+    LatencyModel,
+    StubConfig,
+    StubServer,
+    build_edits,
+)
+
+VALIDATOR = Draft202012Validator(_RAW_SCHEMA)
+
+PROMPT = (
+    "### Objects in pkg/mod.py:\n"
+    "  helper\n"
+    "  Widget\n"
+    "  Widget.run\n"
+    "\n"
+    "BEGIN pkg/mod.py\n...\nEND pkg/mod.py"
+)
+
+
+class _DummyStyle:
+    name = "numpy"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    oc._get_sdk_client.cache_clear()
+    yield
+    oc._get_sdk_client.cache_clear()
+
+
+# --------------------------------------------------------------------------- #
+# 1. Payload mirrors the listed objects and satisfies the schema              #
+# --------------------------------------------------------------------------- #
+def test_build_edits_is_schema_valid():
+    payload = build_edits(PROMPT)
+
+    VALIDATOR.validate(payload)
+    assert [f["qualname"] for f in payload["function_edits"]] == ["helper"]
+    [cls] = payload["class_edits"]
+    assert cls["qualname"] == "Widget"
+    assert [m["qualname"] for m in cls["method_edits"]] == ["Widget.run"]
+
+
+def test_latency_model_parse():
+    assert LatencyModel.parse("fixed:0.5").sample(random.Random(0)) == 0.5
+    assert 0.1 <= LatencyModel.parse("uniform:0.1,0.2").sample(random.Random(0)) <= 0.2
+    with pytest.raises(ValueError):
+        LatencyModel.parse("gamma:1")
+
+
+# --------------------------------------------------------------------------- #
+# 2. Real adapter round-trips through the stub                                #
+# --------------------------------------------------------------------------- #
+def test_adapter_against_stub():
+    with StubServer(StubConfig()) as server:
+        adapter = oc.OpenAIClientAdapter(style=_DummyStyle(), base_url=server.base_url)
+        raw = adapter.request(PROMPT)
+
+    VALIDATOR.validate(raw)
+    assert server.stats == {"requests": 1, "ok": 1, "429": 0, "500": 0}
+
+
+# --------------------------------------------------------------------------- #
+# 3. Injected 429s are retried by the SDK, then surface                       #
+# --------------------------------------------------------------------------- #
+def test_injected_rate_limit_is_retried():
+    with StubServer(StubConfig(p429=1.0, retry_after=0.01)) as server:
+        adapter = oc.OpenAIClientAdapter(style=_DummyStyle(), base_url=server.base_url)
+        with pytest.raises(RateLimitError):
+            adapter.request(PROMPT)
+
+    # one attempt + the SDK's default two retries
+    assert server.stats["429"] == 3
+
+
+# --------------------------------------------------------------------------- #
+# 4. Streaming adapter reports each edit before returning the full payload    #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_async_adapter_streams_from_stub():
+    oc._get_async_sdk_client.cache_clear()
+    seen = []
+    with StubServer(StubConfig()) as server:
+        adapter = oc.AsyncOpenAIClientAdapter(
+            style=_DummyStyle(), base_url=server.base_url
+        )
+        raw = await adapter.request_stream(PROMPT, lambda k, e: seen.append(k))
+
+    assert raw == build_edits(PROMPT)
+    assert seen == ["function_edits", "class_edits"]
+
+
+# --------------------------------------------------------------------------- #
+# 5. A repeated static prefix is reported as cached input tokens              #
+# --------------------------------------------------------------------------- #
+def test_shared_prefix_reports_cache_hits():
+    prefix = "Style guide. " * 400  # ~1300 estimated tokens
+    with StubServer(StubConfig()) as server:
+        adapter = oc.OpenAIClientAdapter(
+            style=_DummyStyle(), base_url=server.base_url, instructions=prefix
+        )
+        adapter.request(PROMPT)
+        first = adapter.stats()["Token usage"]["cached input tokens"]
+        adapter.request(PROMPT)
+        usage = adapter.stats()["Token usage"]
+
+    assert first == 0
+    assert usage["responses"] == 2
+    assert usage["cached input tokens"] == 1280
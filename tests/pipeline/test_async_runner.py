@@ -6,6 +6,7 @@ Tests for lovethedocs.application.pipeline.async_runner
 from __future__ import annotations
 
 import asyncio
+import threading
 from pathlib import Path
 from typing import Dict
 
@@ -15,6 +16,8 @@ from lovethedocs.application.pipeline import async_runner as uut
 from lovethedocs.domain.docstyle.base import DocStyle
 from lovethedocs.domain.models import SourceModule
 from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.gateways.circuit_breaker import CircuitOpenError
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
 STYLE = DocStyle.from_string("numpy")
 
@@ -36,9 +39,16 @@ class _DummyFS:
             for p in self.root.rglob("*.py")
         }
 
-    def stage_file(self, rel_path: Path, code: str) -> None:
+    def stage_file(self, rel_path: Path, code: str, *, stats=None) -> None:
         self.staged[rel_path] = code
 
+    def update_pending(self, finished, unfinished):
+        self.pending = sorted(unfinished)
+        return self.pending
+
+    def sync(self):
+        pass
+
 
 def _fs_factory(root: Path) -> _DummyFS:  # noqa: D401
     return _DummyFS(root)
@@ -157,3 +167,144 @@ def test_semaphore_respected(tmp_path, patch_progress, patch_summary, concurrenc
     )
 
     assert max_active <= concurrency
+
+
+# ────────────────────────────────────────────────────────────
+# 5. several projects share one run and one concurrency limit
+# ────────────────────────────────────────────────────────────
+def test_projects_share_one_queue(tmp_path, patch_progress, patch_summary):
+    roots = [tmp_path / "a", tmp_path / "b"]
+    for root in roots:
+        root.mkdir()
+        (root / "mod.py").write_text(f"# {root.name}")
+    (roots[1] / "extra.py").write_text("# extra")
+    calls = []
+
+    class FakeUseCase:
+        async def run_async(self, modules, *, style, concurrency):
+            calls.append(sorted(m.code for m in modules))
+            for mod in reversed(list(modules)):  # finish out of project order
+                yield UpdateResult(mod, mod.code + " done")
+
+    fs_a, fs_b = uut.run_async(
+        paths=roots,
+        concurrency=2,
+        fs_factory=_fs_factory,
+        use_case=FakeUseCase(),
+        style=STYLE,
+    )
+
+    assert calls == [["# a", "# b", "# extra"]]
+    assert fs_a.staged == {Path("mod.py"): "# a done"}
+    assert fs_b.staged == {
+        Path("mod.py"): "# b done",
+        Path("extra.py"): "# extra done",
+    }
+
+
+def test_low_memory_merges_projects_lazily(tmp_path, patch_progress, patch_summary):
+    roots = [tmp_path / "a", tmp_path / "b"]
+    for root in roots:
+        root.mkdir()
+        (root / "mod.py").write_text(f"# {root.name}")
+
+    class FakeUseCase:
+        async def run_async(self, modules, *, style, concurrency, low_memory):
+            assert not isinstance(modules, list) and len(modules) == 2
+            for mod in modules:
+                yield UpdateResult(mod, mod.code + " done")
+
+    file_systems = uut.run_async(
+        paths=roots,
+        concurrency=2,
+        fs_factory=ProjectFileSystem,
+        use_case=FakeUseCase(),
+        style=STYLE,
+        low_memory=True,
+    )
+
+    for root, fs in zip(roots, file_systems):
+        assert fs.staged_path(Path("mod.py")).read_text() == f"# {root.name} done"
+
+
+# ────────────────────────────────────────────────────────────
+# 6. modules abandoned to an outage are left for --resume
+# ────────────────────────────────────────────────────────────
+def test_outage_leaves_modules_pending_for_resume(
+    tmp_path, patch_progress, patch_summary, monkeypatch
+):
+    monkeypatch.setattr(uut, "report_pending", lambda count: None)
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text(f"{name} = 1")
+    seen = []
+
+    class FakeUseCase:
+        def __init__(self, down):
+            self.down = down
+
+        async def run_async(self, modules, *, style, concurrency):
+            for mod in modules:
+                seen.append(mod.path.name)
+                if mod.path.name in self.down:
+                    yield UpdateResult(mod, error=CircuitOpenError("down"))
+                else:
+                    yield UpdateResult(mod, mod.code + "  # done")
+
+    def _run(down, resume=False):
+        return uut.run_async(
+            paths=tmp_path,
+            concurrency=2,
+            fs_factory=ProjectFileSystem,
+            use_case=FakeUseCase(down),
+            style=STYLE,
+            resume=resume,
+        )
+
+    [fs] = _run(down={"b.py", "c.py"})
+    assert fs.read_pending() == [Path("b.py"), Path("c.py")]
+    assert not fs.staged_path(Path("b.py")).exists()
+
+    seen.clear()
+    _run(down=set(), resume=True)
+    assert sorted(seen) == ["b.py", "c.py"]
+    assert fs.read_pending() == []
+    assert fs.staged_path(Path("c.py")).read_text() == "c = 1  # done"
+
+
+# ────────────────────────────────────────────────────────────
+# 7. staged writes run on the I/O pool; write errors are failures
+# ────────────────────────────────────────────────────────────
+def test_staged_writes_run_off_the_event_loop(tmp_path, monkeypatch, patch_progress):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.py").write_text(name)
+    threads = []
+    reported = {}
+    monkeypatch.setattr(
+        uut, "summarize", lambda failures, n: reported.update(failures=failures, n=n)
+    )
+
+    class _SlowFS(_DummyFS):
+        def stage_file(self, rel_path, code, *, stats=None):
+            threads.append(threading.current_thread().name)
+            if rel_path.name == "b.py":
+                raise OSError("disk full")
+            super().stage_file(rel_path, code)
+
+    class FakeUseCase:
+        async def run_async(self, modules, *, style, concurrency):
+            for mod in modules:
+                yield UpdateResult(mod, mod.code + "!")
+
+    [fs] = uut.run_async(
+        paths=tmp_path,
+        concurrency=2,
+        fs_factory=_SlowFS,
+        use_case=FakeUseCase(),
+        style=STYLE,
+    )
+
+    assert all(name.startswith("lovethedocs-io") for name in threads)
+    assert fs.staged == {Path("a.py"): "a!"}
+    [(path, exc)] = reported["failures"]
+    assert path == Path("b.py") and isinstance(exc, OSError)
+    assert reported["n"] == 2
@@ -0,0 +1,21 @@
+from dataclasses import replace
+
+from lovethedocs.application.config import Settings
+from lovethedocs.application.pipeline.factory import make_use_case
+from lovethedocs.domain.docstyle.base import DocStyle
+
+STYLE = DocStyle.from_string("numpy")
+
+
+def test_per_run_settings_share_one_cached_use_case(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    base = Settings(base_url="http://127.0.0.1:1/v1")
+
+    def _use_case(settings):
+        return make_use_case(async_mode=True, style=STYLE, settings=settings)
+
+    first = _use_case(base)
+    assert _use_case(replace(base, files=("a.py",))) is first
+    assert _use_case(replace(base, resume=True)) is first
+    assert _use_case(replace(base, schedule="recent")) is first
+    assert _use_case(replace(base, model="other")) is not first
@@ -0,0 +1,221 @@
+"""
+Tests for lovethedocs.application.pipeline.run_pipeline_async.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from lovethedocs.application.config import Settings
+from lovethedocs.application.pipeline import run_pipeline_async
+from lovethedocs.domain.models.update_result import UpdateResult
+
+
+class _DummyFS:
+    def __init__(self, root: Path):
+        self.root = root
+        self.staged: Dict[Path, str] = {}
+
+    def load_modules(self) -> Dict[Path, str]:
+        return {
+            p.relative_to(self.root): p.read_text("utf-8")
+            for p in sorted(self.root.rglob("*.py"))
+        }
+
+    def stage_file(self, rel_path: Path, code: str, *, stats=None) -> None:
+        self.staged[rel_path] = code
+
+    def update_pending(self, finished, unfinished):
+        self.pending = sorted(unfinished)
+        return self.pending
+
+    def sync(self):
+        pass
+
+    def original_path(self, rel_path: Path) -> Path:
+        return self.root / rel_path
+
+
+class _FakeUseCase:
+    async def run_async(self, modules, *, style, concurrency, order_key=None):
+        if order_key is not None:
+            modules = sorted(modules, key=order_key)
+        for mod in modules:
+            if mod.code == "boom":
+                yield UpdateResult(mod, None, ValueError("bad"))
+            else:
+                yield UpdateResult(mod, mod.code + "\n# updated")
+
+
+def _factories():
+    created: list[_DummyFS] = []
+
+    def fs_factory(root: Path) -> _DummyFS:
+        created.append(_DummyFS(root))
+        return created[-1]
+
+    def use_case_factory(**kwargs):
+        assert kwargs["async_mode"] is True
+        assert kwargs["concurrency"] == 4
+        return _FakeUseCase()
+
+    return created, fs_factory, use_case_factory
+
+
+@pytest.mark.asyncio
+async def test_streams_results_inside_running_loop(tmp_path):
+    (tmp_path / "good.py").write_text("pass")
+    (tmp_path / "bad.py").write_text("boom")
+    created, fs_factory, use_case_factory = _factories()
+
+    results = [
+        r
+        async for r in run_pipeline_async(
+            tmp_path,
+            style="numpy",
+            concurrency=4,
+            fs_factory=fs_factory,
+            use_case_factory=use_case_factory,
+        )
+    ]
+
+    assert sorted(str(r.module.path) for r in results) == ["bad.py", "good.py"]
+    assert [r.ok for r in results if str(r.module.path) == "bad.py"] == [False]
+    # nothing is staged unless asked for
+    assert created[0].staged == {}
+
+
+@pytest.mark.asyncio
+async def test_stage_writes_successful_results(tmp_path):
+    (tmp_path / "good.py").write_text("pass")
+    (tmp_path / "bad.py").write_text("boom")
+    created, fs_factory, use_case_factory = _factories()
+
+    async for _ in run_pipeline_async(
+        [tmp_path, tmp_path / "missing.txt"],
+        style="numpy",
+        concurrency=4,
+        stage=True,
+        fs_factory=fs_factory,
+        use_case_factory=use_case_factory,
+    ):
+        pass
+
+    [fs] = created
+    assert fs.staged == {Path("good.py"): "pass\n# updated"}
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_positive_concurrency(tmp_path):
+    with pytest.raises(ValueError):
+        async for _ in run_pipeline_async(tmp_path, style="numpy", concurrency=0):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "schedule, expected",
+    [
+        ("largest", ["big.py", "old.py", "new.py"]),
+        ("recent", ["new.py", "big.py", "old.py"]),
+        ("input", ["big.py", "new.py", "old.py"]),
+    ],
+)
+async def test_schedule_orders_requests(tmp_path, schedule, expected):
+    (tmp_path / "big.py").write_text("def f():\n    pass\n" * 20)
+    (tmp_path / "old.py").write_text("def g():\n    pass\n")
+    (tmp_path / "new.py").write_text("x = 1\n")
+    for name, mtime in [("big.py", 1_000), ("old.py", 1_000), ("new.py", 2_000)]:
+        os.utime(tmp_path / name, (mtime, mtime))
+    created, fs_factory, use_case_factory = _factories()
+
+    results = [
+        r
+        async for r in run_pipeline_async(
+            tmp_path,
+            style="numpy",
+            concurrency=4,
+            settings=Settings(schedule=schedule),
+            fs_factory=fs_factory,
+            use_case_factory=use_case_factory,
+        )
+    ]
+
+    assert [str(r.module.path) for r in results] == expected
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_schedule(tmp_path):
+    with pytest.raises(ValueError, match="Unknown schedule"):
+        async for _ in run_pipeline_async(
+            tmp_path, style="numpy", settings=Settings(schedule="shortest")
+        ):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_fsync_policy_reaches_the_file_system(tmp_path):
+    (tmp_path / "good.py").write_text("pass")
+    created, fs_factory, use_case_factory = _factories()
+    policies = []
+
+    def recording_factory(root: Path, *, fsync: str = "batch") -> _DummyFS:
+        policies.append(fsync)
+        return fs_factory(root)
+
+    async for _ in run_pipeline_async(
+        tmp_path,
+        style="numpy",
+        concurrency=4,
+        settings=Settings(fsync="file"),
+        fs_factory=recording_factory,
+        use_case_factory=use_case_factory,
+    ):
+        pass
+
+    assert policies == ["file"]
+
+
+@pytest.mark.asyncio
+async def test_loading_does_not_block_the_event_loop(tmp_path):
+    (tmp_path / "a.py").write_text("def f():\n    pass\n")
+    created, fs_factory, use_case_factory = _factories()
+
+    class _SlowFS(_DummyFS):
+        def load_modules(self):
+            time.sleep(0.3)  # a large tree on a slow disk
+            return super().load_modules()
+
+    def slow_factory(root: Path) -> _SlowFS:
+        created.append(_SlowFS(root))
+        return created[-1]
+
+    ticks = 0
+
+    async def _heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(_heartbeat())
+    results = [
+        r
+        async for r in run_pipeline_async(
+            tmp_path,
+            style="numpy",
+            concurrency=4,
+            fs_factory=slow_factory,
+            use_case_factory=use_case_factory,
+        )
+    ]
+    beat.cancel()
+
+    assert [r.ok for r in results] == [True]
+    assert ticks >= 10  # ~30 expected; 0 if loading ran on the loop
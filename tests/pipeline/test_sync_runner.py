@@ -3,6 +3,7 @@ from pathlib import Path
 from lovethedocs.application.pipeline import sync_runner as uut
 from lovethedocs.domain.docstyle.base import DocStyle
 from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
 
 STYLE = DocStyle.from_string("numpy")
 
@@ -21,9 +22,16 @@ class FakeFS:
     def load_modules(self):
         return self._modules  # mapping[Path, str]
 
-    def stage_file(self, rel_path: Path, new_code: str):
+    def stage_file(self, rel_path: Path, new_code: str, *, stats=None):
         self.staged[rel_path] = new_code
 
+    def update_pending(self, finished, unfinished):
+        self.pending = sorted(unfinished)
+        return self.pending
+
+    def sync(self):
+        pass
+
 
 # ────────────────────────────────────
 # 1. single-file happy path
@@ -102,3 +110,116 @@ def test_run_sync_ignores_non_python_files(tmp_path, patch_progress, patch_summa
         paths=notes, fs_factory=fs_factory, use_case=FakeUseCase(), style=STYLE
     )
     assert fses == []  # nothing processed, nothing returned
+
+
+# ────────────────────────────────────
+# 4. workers are forwarded to the use case
+# ────────────────────────────────────
+def test_run_sync_forwards_workers(tmp_path, patch_progress, patch_summary):
+    fake_fs = FakeFS(tmp_path, modules={Path("a.py"): "a=1"})
+    seen = {}
+
+    class FakeUseCase:
+        def run(self, modules, *, style, workers, ordered):
+            seen.update(workers=workers, ordered=ordered)
+            for mod in modules:
+                yield UpdateResult(mod, "a=2")
+
+    uut.run_sync(
+        paths=[tmp_path],
+        fs_factory=lambda _root: fake_fs,
+        use_case=FakeUseCase(),
+        style=STYLE,
+        workers=4,
+    )
+
+    assert seen == {"workers": 4, "ordered": False}
+    assert fake_fs.staged == {Path("a.py"): "a=2"}
+
+
+# ────────────────────────────────────
+# 5. low-memory mode hands the use case a lazy module view
+# ────────────────────────────────────
+def test_run_sync_low_memory_reads_lazily(tmp_path, patch_progress, patch_summary):
+    (tmp_path / "a.py").write_text("a=1")
+    (tmp_path / "b.py").write_text("b=1")
+    seen = {}
+
+    class FakeUseCase:
+        def run(self, modules, *, style, low_memory):
+            seen.update(low_memory=low_memory, size=len(modules))
+            assert not isinstance(modules, list)
+            for mod in modules:
+                yield UpdateResult(mod, mod.code + "  # done")
+
+    [fs] = uut.run_sync(
+        paths=[tmp_path],
+        fs_factory=ProjectFileSystem,
+        use_case=FakeUseCase(),
+        style=STYLE,
+        low_memory=True,
+    )
+
+    assert seen == {"low_memory": True, "size": 2}
+    assert fs.staged_path(Path("b.py")).read_text() == "b=1  # done"
+
+
+def test_run_sync_files_skips_discovery(tmp_path, patch_progress, patch_summary):
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / name).write_text("x = 1\n")
+
+    class FakeUseCase:
+        def run(self, modules, *, style):
+            for mod in modules:
+                yield UpdateResult(mod, mod.code + "# doc\n")
+
+    [fs] = uut.run_sync(
+        paths=[tmp_path],
+        fs_factory=ProjectFileSystem,
+        use_case=FakeUseCase(),
+        style=STYLE,
+        files=[Path("b.py")],
+    )
+
+    assert [p.name for p in fs.staged_root.rglob("*.py")] == ["b.py"]
+
+
+def test_run_sync_staging_error_is_a_module_failure(
+    tmp_path, monkeypatch, patch_progress
+):
+    modules_map = {Path(f"{n}.py"): f"{n}=1" for n in "abc"}
+    synced = []
+    reported = {}
+
+    class FlakyFS(FakeFS):
+        def stage_file(self, rel_path, new_code, *, stats=None):
+            if rel_path == Path("b.py"):
+                raise OSError("disk full")
+            super().stage_file(rel_path, new_code, stats=stats)
+
+        def sync(self):
+            synced.append(self)
+
+    fake_fs = FlakyFS(tmp_path, modules=modules_map)
+
+    class FakeUseCase:
+        def run(self, modules, *, style, workers, ordered):
+            for mod in modules:
+                yield UpdateResult(mod, mod.code + "  # done")
+
+    monkeypatch.setattr(
+        uut, "summarize", lambda failures, n: reported.update(failures=failures, n=n)
+    )
+    uut.run_sync(
+        paths=[tmp_path],
+        fs_factory=lambda _root: fake_fs,
+        use_case=FakeUseCase(),
+        style=STYLE,
+        workers=2,
+    )
+
+    assert set(fake_fs.staged) == {Path("a.py"), Path("c.py")}
+    assert synced == [fake_fs]
+    [(path, exc)] = reported["failures"]
+    assert path == Path("b.py") and isinstance(exc, OSError)
+    assert reported["n"] == 3
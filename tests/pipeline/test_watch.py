@@ -0,0 +1,134 @@
+import os
+import threading
+from pathlib import Path
+
+from lovethedocs.application.pipeline import watch as uut
+from lovethedocs.domain.docstyle.base import DocStyle
+from lovethedocs.domain.models.update_result import UpdateResult
+from lovethedocs.gateways.project_file_system import ProjectFileSystem
+
+STYLE = DocStyle.from_string("numpy")
+
+
+class _FakeUseCase:
+    """Appends a marker comment and records each batch it is given."""
+
+    def __init__(self, fail=()):
+        self.batches: list[list[str]] = []
+        self._fail = set(fail)
+
+    def run(self, modules, *, style, workers=0, ordered=True):
+        self.batches.append([str(m.path) for m in modules])
+        for mod in modules:
+            if str(mod.path) in self._fail:
+                yield UpdateResult(mod, None, RuntimeError("boom"))
+            else:
+                yield UpdateResult(mod, mod.code + "# documented\n")
+
+
+def _touch(path: Path, text: str) -> None:
+    path.write_text(text)
+    # Make the change visible to mtime polling on coarse-grained filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+def test_watcher_stages_new_content_and_skips_what_it_has_seen(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    fs = ProjectFileSystem(tmp_path)
+    use_case = _FakeUseCase()
+    watcher = uut.Watcher(fs, use_case, STYLE)
+
+    assert [r.ok for r in watcher.handle([Path("a.py")])] == [True]
+    staged = fs.staged_path(Path("a.py")).read_text()
+    assert staged == "x = 1\n# documented\n"
+    assert Path("a.py") in fs.read_index()
+
+    assert watcher.handle([Path("a.py")]) == []  # saved without changes
+    fs.apply_stage(Path("a.py"))  # accepting our own edit
+    assert watcher.handle([Path("a.py")]) == []
+
+    (tmp_path / "a.py").write_text("x = 2\n")
+    watcher.handle([Path("a.py"), Path("gone.py")])
+    assert use_case.batches == [["a.py"], ["a.py"]]
+
+
+def test_failed_module_is_retried_only_after_another_edit(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    fs = ProjectFileSystem(tmp_path)
+    use_case = _FakeUseCase(fail={"a.py"})
+    watcher = uut.Watcher(fs, use_case, STYLE)
+
+    assert [r.ok for r in watcher.handle([Path("a.py")])] == [False]
+    assert watcher.handle([Path("a.py")]) == []
+    (tmp_path / "a.py").write_text("x = 2\n")
+    assert len(watcher.handle([Path("a.py")])) == 1
+
+
+def test_staging_error_is_reported_per_module(tmp_path, monkeypatch):
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("x = 1\n")
+    fs = ProjectFileSystem(tmp_path)
+    watcher = uut.Watcher(fs, _FakeUseCase(), STYLE)
+    real_stage = uut.diff_stats.stage
+
+    def _stage(fs, rel_path, original, code):
+        if rel_path == Path("a.py"):
+            raise FileNotFoundError("staged dir vanished")
+        real_stage(fs, rel_path, original, code)
+
+    monkeypatch.setattr(uut.diff_stats, "stage", _stage)
+    results = watcher.handle([Path("a.py"), Path("b.py")])
+
+    assert {str(r.module.path): r.ok for r in results} == {"a.py": False, "b.py": True}
+    assert isinstance(results[0].error, FileNotFoundError)
+    assert fs.staged_path(Path("b.py")).exists()
+
+
+def test_poll_changes_debounces_and_ignores_ignored_dirs(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("y = 1\n")
+    (tmp_path / ".venv").mkdir()
+    fs = ProjectFileSystem(tmp_path)
+    stop = threading.Event()
+    batches: list[set[Path]] = []
+
+    def _consume():
+        for batch in uut.poll_changes(fs, interval=0.02, debounce=0.1, stop=stop):
+            batches.append(batch)
+            stop.set()
+
+    thread = threading.Thread(target=_consume)
+    thread.start()
+    threading.Event().wait(0.1)  # let the first snapshot happen
+    _touch(tmp_path / "a.py", "x = 2\n")
+    _touch(tmp_path / ".venv" / "lib.py", "z = 1\n")
+    threading.Event().wait(0.04)
+    _touch(tmp_path / "b.py", "y = 2\n")  # same burst
+    thread.join(timeout=5)
+
+    assert batches == [{Path("a.py"), Path("b.py")}]
+
+
+def test_watch_processes_saves_until_stopped(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    fs = ProjectFileSystem(tmp_path)
+    stop = threading.Event()
+    seen = []
+
+    def _on_results(results):
+        seen.extend(str(r.module.path) for r in results)
+        stop.set()
+
+    thread = threading.Thread(
+        target=uut.watch,
+        args=(fs, _FakeUseCase(), STYLE),
+        kwargs=dict(poll=True, debounce=0.05, stop=stop, on_results=_on_results),
+    )
+    thread.start()
+    threading.Event().wait(0.2)
+    _touch(tmp_path / "a.py", "x = 2\n")
+    thread.join(timeout=10)
+
+    assert seen == ["a.py"]
+    assert fs.staged_path(Path("a.py")).read_text() == "x = 2\n# documented\n"